@@ -0,0 +1,212 @@
+# features/process_logs/log_follower.py
+import json
+import logging
+import shlex
+import socket
+import threading
+import time
+from pathlib import Path
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from features.ssh_access.ssh_connect import acquire_ssh_lease, release_ssh_client
+
+logger = logging.getLogger("log_follower")
+
+DEFAULT_LOG_PATHS = ["/var/log/syslog", "/var/log/messages"]  # Ubuntu ar CentOS er file
+OFFSETS_PATH = Path(__file__).resolve().parent.parent.parent / "logs" / "log_offsets.json"
+
+
+class OffsetStore:
+    """
+    Remembers how far each (host, log file) has been read, keyed by inode
+    so a rotated file is never resumed at the old file's offset.
+    """
+
+    def __init__(self, path: Path = OFFSETS_PATH):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        try:
+            self._data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            self._data = {}
+        except Exception as e:
+            logger.error("Failed to read log offsets %s: %s", self.path, e)
+            self._data = {}
+
+    @staticmethod
+    def _key(host, path):
+        return f"{host}|{path}"
+
+    def get(self, host: str, path: str):
+        with self._lock:
+            entry = self._data.get(self._key(host, path))
+        return (entry["inode"], entry["offset"]) if entry else (None, 0)
+
+    def set(self, host: str, path: str, inode, offset: int) -> None:
+        with self._lock:
+            self._data[self._key(host, path)] = {"inode": inode, "offset": offset}
+
+    def save(self) -> None:
+        with self._lock:
+            payload = json.dumps(self._data, indent=2)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(payload, encoding="utf-8")
+            tmp.replace(self.path)
+        except Exception as e:
+            logger.error("Failed to save log offsets %s: %s", self.path, e)
+
+
+_offsets = None
+_offsets_lock = threading.Lock()
+
+
+def get_offset_store() -> OffsetStore:
+    global _offsets
+    with _offsets_lock:
+        if _offsets is None:
+            _offsets = OffsetStore()
+        return _offsets
+
+
+def follow_command(saved: dict, paths=DEFAULT_LOG_PATHS, initial_lines: int = 50) -> str:
+    """
+    Build the remote follow script. It picks the first readable log, resumes
+    at the saved byte offset when the inode still matches (and the file did
+    not shrink), otherwise starts `initial_lines` from the end. It prints one
+    '@@FOLLOW <path> <inode> <offset>' header, then execs `tail -F`.
+    `saved` maps path -> (inode, offset).
+    """
+    cases = "".join(
+        f"  {shlex.quote(p)}) si={shlex.quote(str(inode or ''))}; so={int(offset)};;\n"
+        for p, (inode, offset) in saved.items()
+    )
+    script = (
+        f"for p in {' '.join(shlex.quote(p) for p in paths)}; do [ -r \"$p\" ] && break; p=; done\n"
+        "[ -n \"$p\" ] || { echo '@@ERROR no readable log file'; exit 1; }\n"
+        "set -- $(stat -Lc '%i %s' \"$p\")\n"
+        "si=; so=0\n"
+        "case $p in\n"
+        f"{cases}"
+        "esac\n"
+        "if [ -n \"$si\" ] && [ \"$1\" = \"$si\" ] && [ \"$2\" -ge \"$so\" ]; then start=$so\n"
+        f"else start=$(( $2 - $(tail -n {int(initial_lines)} \"$p\" | wc -c) )); fi\n"
+        "echo \"@@FOLLOW $p $1 $start\"\n"
+        "exec tail -c +$((start + 1)) -F \"$p\"\n"
+    )
+    return "sh -c " + shlex.quote(script)
+
+
+class LogFollower(QThread):
+    """
+    Follows a remote log over one channel with `tail -F` semantics.
+
+    Only complete new lines are emitted through `lines_appended`, and the
+    byte offset of the last delivered line is saved per host and file, so
+    a reconnect resumes exactly where the previous session stopped.
+    """
+
+    lines_appended = pyqtSignal(str)
+    rotated = pyqtSignal(str)
+    error = pyqtSignal(str)
+
+    def __init__(self, ssh_client, host: str, paths=None, initial_lines: int = 50,
+                 offsets: OffsetStore = None, save_interval: float = 5.0):
+        super().__init__()
+        self.ssh_client = ssh_client
+        self.host = host
+        self.paths = list(paths or DEFAULT_LOG_PATHS)
+        self.initial_lines = initial_lines
+        self.offsets = offsets or get_offset_store()
+        self.save_interval = save_interval
+        self.channel = None
+        self.running = True
+
+        self.path = None
+        self.inode = None
+        self.offset = 0
+
+    def run(self):
+        lease = acquire_ssh_lease(self.ssh_client)  # keeps the pooled transport from idle eviction
+        try:
+            transport = self.ssh_client.get_transport()
+            if not transport or not transport.is_active():
+                raise ConnectionError("SSH transport is inactive.")
+
+            saved = {p: self.offsets.get(self.host, p) for p in self.paths}
+            self.channel = transport.open_session()
+            self.channel.exec_command(follow_command(saved, self.paths, self.initial_lines))
+            self.channel.settimeout(0.5)
+
+            pending = b""
+            header_seen = False
+            last_save = time.monotonic()
+            while self.running:
+                self._drain_stderr()
+                try:
+                    chunk = self.channel.recv(65536)
+                except socket.timeout:
+                    chunk = None
+                if chunk == b"":
+                    if not self.channel.recv_stderr_ready():
+                        break
+                    continue
+
+                if chunk:
+                    pending += chunk
+                    if not header_seen:
+                        line, sep, rest = pending.partition(b"\n")
+                        if not sep:
+                            continue
+                        self._read_header(line.decode(errors="ignore"))
+                        header_seen, pending = True, rest
+
+                    cut = pending.rfind(b"\n") + 1
+                    if cut:
+                        complete, pending = pending[:cut], pending[cut:]
+                        self.offset += len(complete)
+                        self.lines_appended.emit(complete.decode(errors="ignore"))
+
+                if self.path and time.monotonic() - last_save >= self.save_interval:
+                    self._save_offset()
+                    last_save = time.monotonic()
+
+        except Exception as e:
+            logger.error("Log follow failed on %s: %s", self.host, e)
+            self.error.emit(f"❌ Log follow error: {e}")
+        finally:
+            self._save_offset()
+            if self.channel:
+                self.channel.close()
+            release_ssh_client(lease)
+
+    def _read_header(self, line: str):
+        if line.startswith("@@ERROR"):
+            raise RuntimeError(line[len("@@ERROR "):])
+        parts = line.split()
+        if len(parts) != 4 or parts[0] != "@@FOLLOW":
+            raise RuntimeError(f"Unexpected follow header: {line!r}")
+        self.path, self.inode, self.offset = parts[1], parts[2], int(parts[3])
+        logger.info("Following %s:%s from byte %d", self.host, self.path, self.offset)
+
+    def _drain_stderr(self):
+        while self.channel.recv_stderr_ready():
+            text = self.channel.recv_stderr(4096).decode(errors="ignore")
+            for message in text.splitlines():
+                if "has been replaced" in message or "truncated" in message:
+                    # tail reopened a new file from byte 0; its inode is unknown
+                    # here, so the next session falls back to the last N lines.
+                    self.inode, self.offset = None, 0
+                    self.rotated.emit(message)
+                elif message.strip():
+                    logger.warning("tail on %s: %s", self.host, message)
+
+    def _save_offset(self):
+        if self.path:
+            self.offsets.set(self.host, self.path, self.inode, self.offset)
+            self.offsets.save()
+
+    def stop(self):
+        self.running = False
@@ -0,0 +1,332 @@
+# features/process_logs/log_search.py
+import logging
+import re
+import shlex
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+
+logger = logging.getLogger("log_search")
+
+# Current and rotated system logs (syslog.1, syslog.2.gz, messages-20240101, ...)
+DEFAULT_SEARCH_GLOBS = ("/var/log/syslog*", "/var/log/messages*")
+
+# Syslog lines rarely carry a numeric priority, so severity is matched on
+# keywords. Lower rank = more severe; a query for "err" matches ranks 0-3.
+SEVERITY_LEVELS = (
+    ("emerg", r"emerg|panic"),
+    ("alert", r"alert"),
+    ("crit", r"crit|fatal"),
+    ("err", r"err|fail"),
+    ("warning", r"warn"),
+    ("notice", r"notice"),
+    ("info", r"info"),
+    ("debug", r"debug"),
+)
+SEVERITY_RANK = {name: rank for rank, (name, _) in enumerate(SEVERITY_LEVELS)}
+_SEVERITY_RES = [re.compile(pattern, re.IGNORECASE) for _, pattern in SEVERITY_LEVELS]
+
+# POSIX bracket classes in Python character-set syntax (C locale)
+_POSIX_CLASSES = {
+    "alpha": "a-zA-Z", "digit": "0-9", "alnum": "a-zA-Z0-9", "upper": "A-Z", "lower": "a-z",
+    "space": r" \t\n\r\f\v", "blank": r" \t", "xdigit": "0-9A-Fa-f", "cntrl": r"\x00-\x1f\x7f",
+    "print": r"\x20-\x7e", "graph": r"\x21-\x7e", "punct": re.escape("!\"#$%&'()*+,-./:;<=>?@[\\]^_`{|}~"),
+}
+
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+# Turns either timestamp style into a comparable "MM-DD hh:mm:ss" key:
+#   2026-10-18T12:34:56.123+00:00 host ...   (rsyslog high-precision)
+#   Oct 18 12:34:56 host ...                 (traditional)
+_AWK_TIME_FILTER = r"""
+BEGIN { split("Jan Feb Mar Apr May Jun Jul Aug Sep Oct Nov Dec", m, " "); for (i = 1; i <= 12; i++) mon[m[i]] = sprintf("%02d", i) }
+{
+  if ($1 ~ /^[0-9][0-9][0-9][0-9]-/) k = substr($1, 6, 5) " " substr($1, 12, 8)
+  else if ($1 in mon) k = mon[$1] "-" sprintf("%02d", $2) " " $3
+  else next
+  if (lo <= hi) { if (k >= lo && k <= hi) print }
+  else if (k >= lo || k <= hi) print
+}
+"""
+
+
+@dataclass(frozen=True)
+class LogQuery:
+    """
+    A log search. Every regex in `patterns` must match (extended regex,
+    evaluated by grep -E on the host). `since`/`until` are epoch seconds;
+    the host converts them to its own wall-clock time. `severity` is a
+    SEVERITY_LEVELS name and means "this level or worse".
+    """
+
+    patterns: tuple = ()
+    since: float = None
+    until: float = None
+    severity: str = None
+    ignore_case: bool = False
+    globs: tuple = DEFAULT_SEARCH_GLOBS
+
+    def covers(self, other: "LogQuery") -> bool:
+        """True if every line matching `other` also matches this query."""
+        if self.globs != other.globs or not set(self.patterns) <= set(other.patterns):
+            return False
+        if set(self.patterns) and self.ignore_case != other.ignore_case:
+            return False
+        if self.since is not None and (other.since is None or other.since < self.since):
+            return False
+        if self.until is not None and (other.until is None or other.until > self.until):
+            return False
+        if self.severity is not None:
+            if other.severity is None or SEVERITY_RANK[other.severity] > SEVERITY_RANK[self.severity]:
+                return False
+        return True
+
+
+class LogMatch:
+    """One matching line, with its parsed timestamp and keyword severity."""
+
+    __slots__ = ("path", "line", "timestamp", "severity")
+
+    def __init__(self, path: str, line: str, tz=None):
+        self.path = path
+        self.line = line
+        self.timestamp = parse_timestamp(line, tz)
+        self.severity = line_severity(line)
+
+    def __repr__(self):
+        return f"LogMatch({self.path!r}, {self.line!r})"
+
+
+def line_severity(line: str):
+    for rank, regex in enumerate(_SEVERITY_RES):
+        if regex.search(line):
+            return rank
+    return None
+
+
+def parse_timestamp(line: str, tz=None):
+    """
+    Epoch seconds of a syslog line, or None. Timestamps without an offset
+    are host wall-clock time in `tz` (a tzinfo; None reads them as this
+    machine's local time).
+    """
+    try:
+        if line[:4].isdigit():
+            ts = datetime.fromisoformat(line.split(None, 1)[0])
+            return (ts if ts.tzinfo else ts.replace(tzinfo=tz)).timestamp()
+        if line[:3] in _MONTHS:
+            now = datetime.now(tz)
+            ts = datetime.strptime(f"{now.year} {line[:15]}", "%Y %b %d %H:%M:%S").replace(tzinfo=tz)
+            if ts > now.replace(microsecond=0) and (ts - now).days >= 1:
+                ts = ts.replace(year=now.year - 1)  # December lines read in January
+            return ts.timestamp()
+    except ValueError:
+        pass
+    return None
+
+
+def _parse_offset(value: str):
+    """tzinfo of a `date +%z` offset such as +0200, or None."""
+    try:
+        return datetime.strptime(value.strip(), "%z").tzinfo
+    except ValueError:
+        return None
+
+
+def _ere_to_python(pattern: str):
+    """
+    Translate a grep -E pattern to Python re syntax, or return None when it
+    uses something the two do not share (equivalence classes, escapes like
+    \\d that grep reads as a plain letter, Python-only (?...) groups).
+    Covers POSIX classes, \\< \\> word anchors and backslashes in brackets.
+    """
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == "\\":
+            if i + 1 >= n:
+                return None
+            nxt = pattern[i + 1]
+            if nxt == "<":
+                out.append(r"\b(?=\w)")
+            elif nxt == ">":
+                out.append(r"\b(?<=\w)")
+            elif nxt.isalnum() and nxt not in "wWsSbB123456789":
+                return None
+            else:
+                out.append(c + nxt)
+            i += 2
+        elif c == "(" and pattern.startswith("(?", i):
+            return None
+        elif c == "[":
+            i += 1
+            members = []
+            if i < n and pattern[i] == "^":
+                members.append("^")
+                i += 1
+            if i < n and pattern[i] == "]":
+                members.append(r"\]")
+                i += 1
+            while i < n and pattern[i] != "]":
+                if pattern.startswith("[:", i):
+                    end = pattern.find(":]", i + 2)
+                    name = pattern[i + 2:end] if end != -1 else None
+                    if name not in _POSIX_CLASSES:
+                        return None
+                    members.append(_POSIX_CLASSES[name])
+                    i = end + 2
+                elif pattern.startswith("[=", i) or pattern.startswith("[.", i):
+                    return None
+                else:
+                    # A backslash is literal in a POSIX bracket; escape what Python treats specially
+                    members.append("\\" + pattern[i] if pattern[i] in "\\[&~|" else pattern[i])
+                    i += 1
+            if i >= n:
+                return None
+            out.append("[" + "".join(members) + "]")
+            i += 1
+        else:
+            out.append(c)
+            i += 1
+    return "".join(out)
+
+
+def _local_regex(pattern: str, ignore_case: bool):
+    """Compiled Python equivalent of a grep -E pattern, or None if there is none."""
+    translated = _ere_to_python(pattern)
+    if translated is None:
+        return None
+    try:
+        return re.compile(translated, re.IGNORECASE if ignore_case else 0)
+    except re.error:
+        return None
+
+
+def build_search_command(query: LogQuery, max_matches: int) -> str:
+    """
+    Build the remote pipeline: per file, decompress if needed, grep each
+    pattern, grep severity keywords, then the awk time window (bounds
+    converted to the host's wall-clock time by its own `date`). Rotated
+    files last modified before `since` are skipped without being read.
+    The first output line is '#tz\\t<host UTC offset>', then each line is
+    '<file>\\t<log line>'.
+    """
+    icase = "-i" if query.ignore_case else ""
+    stages = [f"grep -a -E {icase} -e {shlex.quote(p)}" for p in query.patterns]
+    if query.severity:
+        rank = SEVERITY_RANK[query.severity]
+        keywords = "|".join(pattern for _, pattern in SEVERITY_LEVELS[:rank + 1])
+        stages.append(f"grep -a -i -E -e {shlex.quote(keywords)}")
+    window = ""
+    if query.since is not None or query.until is not None:
+        lo = f'$(date -d @{int(query.since)} "+%m-%d %H:%M:%S")' if query.since is not None else "00-00 00:00:00"
+        hi = f'$(date -d @{int(query.until)} "+%m-%d %H:%M:%S")' if query.until is not None else "99-99 99:99:99"
+        window = f'lo="{lo}"; hi="{hi}"\n'
+        stages.append(f'awk -v lo="$lo" -v hi="$hi" {shlex.quote(_AWK_TIME_FILTER)}')
+    pipeline = " | ".join(['$r "$f"'] + stages + ["sed \"s|^|$f\t|\""])
+
+    skip_old = ""
+    if query.since is not None:
+        skip_old = f'[ "$(stat -Lc %Y "$f")" -lt {int(query.since)} ] && continue\n'
+
+    script = (
+        'printf "#tz\\t%s\\n" "$(date +%z)"\n'
+        f"{window}"
+        f"for f in {' '.join(query.globs)}; do\n"
+        '  [ -r "$f" ] || continue\n'
+        f"  {skip_old}"
+        '  case $f in *.gz) r="gzip -dc";; *) r=cat;; esac\n'
+        f"  {pipeline}\n"
+        f"done 2>/dev/null | head -n {int(max_matches)}\n"
+    )
+    return "sh -c " + shlex.quote(script)
+
+
+def _matches_locally(match: LogMatch, query: LogQuery, extra_patterns) -> bool:
+    if query.since is not None and (match.timestamp is None or match.timestamp < query.since):
+        return False
+    if query.until is not None and (match.timestamp is None or match.timestamp > query.until):
+        return False
+    if query.severity is not None and (match.severity is None or match.severity > SEVERITY_RANK[query.severity]):
+        return False
+    return all(regex.search(match.line) for regex in extra_patterns)
+
+
+class LogSearchIndex:
+    """
+    Runs log searches on the host and keeps recent result sets per host.
+
+    A query whose matches are a subset of a cached, complete result set
+    (same files, a superset of its patterns, a narrower time window, an
+    equal or stricter severity) is answered from the cache without going
+    back to the server. Patterns the cache would have to evaluate locally
+    are translated from grep -E to Python re; one without an exact
+    translation sends the query to the server instead.
+    """
+
+    def __init__(self, max_matches: int = 20000, max_cached: int = 16):
+        self.max_matches = max_matches
+        self.max_cached = max_cached
+        self._cache = {}  # host -> OrderedDict[LogQuery, list[LogMatch]] (complete results only)
+        self._lock = threading.Lock()
+
+    def search(self, ssh_client, host: str, query: LogQuery, timeout: float = 120.0):
+        """
+        Return (matches, truncated). `truncated` is True when the remote side
+        hit max_matches; such partial result sets are never reused.
+        """
+        cached = self._lookup(host, query)
+        if cached is not None:
+            base_query, base_results = cached
+            extra = [_local_regex(p, query.ignore_case) for p in query.patterns if p not in base_query.patterns]
+            if None not in extra:
+                return [m for m in base_results if _matches_locally(m, query, extra)], False
+
+        started = time.monotonic()
+        command = build_search_command(query, self.max_matches + 1)
+        stdin, stdout, stderr = ssh_client.exec_command(command, timeout=timeout)
+        matches = []
+        tz = None
+        for raw in stdout.read().decode(errors="ignore").splitlines():
+            path, sep, line = raw.partition("\t")
+            if path == "#tz":
+                tz = _parse_offset(line)
+            elif sep:
+                matches.append(LogMatch(path, line, tz))
+
+        truncated = len(matches) > self.max_matches
+        del matches[self.max_matches:]
+        logger.info("Log search on %s: %d match(es) in %.2fs%s", host, len(matches),
+                    time.monotonic() - started, " (truncated)" if truncated else "")
+        if not truncated:
+            self._store(host, query, matches)
+        return matches, truncated
+
+    def clear(self, host: str = None) -> None:
+        with self._lock:
+            if host is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(host, None)
+
+    def _lookup(self, host, query):
+        with self._lock:
+            entries = self._cache.get(host)
+            if not entries:
+                return None
+            for cached_query, results in entries.items():
+                if cached_query.covers(query):
+                    entries.move_to_end(cached_query)
+                    return cached_query, results
+        return None
+
+    def _store(self, host, query, matches):
+        with self._lock:
+            entries = self._cache.setdefault(host, OrderedDict())
+            entries[query] = matches
+            entries.move_to_end(query)
+            while len(entries) > self.max_cached:
+                entries.popitem(last=False)
@@ -0,0 +1,173 @@
+# features/process_logs/log_transfer.py
+import io
+import logging
+import shlex
+import time
+import zlib
+
+logger = logging.getLogger("log_transfer")
+
+_CHUNK = 256 * 1024
+
+
+class TransferStats:
+    """Byte counts and timing of one log transfer."""
+
+    __slots__ = ("path", "mode", "raw_bytes", "wire_bytes", "seconds")
+
+    def __init__(self, path: str):
+        self.path = path
+        self.mode = None  # "gzip" (compressed on host), "as-is" (.gz file) or "plain"
+        self.raw_bytes = 0  # bytes delivered to the caller after decompression
+        self.wire_bytes = 0  # bytes received over the SSH channel
+        self.seconds = 0.0
+
+    @property
+    def saved_bytes(self) -> int:
+        return max(0, self.raw_bytes - self.wire_bytes)
+
+    @property
+    def ratio(self) -> float:
+        return self.raw_bytes / self.wire_bytes if self.wire_bytes else 1.0
+
+    @property
+    def throughput(self) -> float:
+        """Delivered (uncompressed) bytes per second."""
+        return self.raw_bytes / self.seconds if self.seconds else 0.0
+
+    def __repr__(self):
+        return (f"TransferStats({self.path!r}, mode={self.mode}, raw={self.raw_bytes}, "
+                f"wire={self.wire_bytes}, saved={self.saved_bytes}, "
+                f"{self.throughput / 1e6:.1f} MB/s)")
+
+
+class _GzipStream:
+    """Incremental gzip decoder that also handles concatenated members (logrotate, pigz)."""
+
+    def __init__(self):
+        self._d = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    def feed(self, data: bytes) -> bytes:
+        out = []
+        while data:
+            out.append(self._d.decompress(data))
+            data = self._d.unused_data
+            if data:
+                self._d = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        return b"".join(out)
+
+    def flush(self) -> bytes:
+        return self._d.flush()
+
+
+class _RangeWriter:
+    """Applies a byte range to a decompressed stream on the client side."""
+
+    def __init__(self, dest, start: int, length):
+        self.dest = dest
+        self.skip = start
+        self.left = length
+        self.written = 0
+
+    def write(self, data: bytes):
+        if self.skip:
+            cut = min(self.skip, len(data))
+            data, self.skip = data[cut:], self.skip - cut
+        if self.left is not None:
+            data = data[:self.left]
+            self.left -= len(data)
+        if data:
+            self.dest.write(data)
+            self.written += len(data)
+
+
+def transfer_command(path: str, start: int = 0, length: int = None, level: int = 1) -> str:
+    """
+    Remote side: print a one-byte mode marker, then the data.
+    Plain files are cut to [start, start+length) and gzip'd on the host
+    (falling back to raw if gzip is missing); .gz files are sent unchanged.
+    """
+    p = shlex.quote(path)
+    cut = f"tail -c +{int(start) + 1} {p}"
+    if length is not None:
+        cut += f" | head -c {int(length)}"
+    script = (
+        f"[ -r {p} ] || {{ echo cannot read {p} >&2; exit 1; }}\n"
+        f"case {p} in *.gz) printf G; exec cat {p};; esac\n"
+        f"if command -v gzip >/dev/null 2>&1; then printf Z; {cut} | gzip -c -{int(level)}\n"
+        f"else printf R; {cut}; fi\n"
+    )
+    return "sh -c " + shlex.quote(script)
+
+
+def fetch_log_range(ssh_client, path: str, dest, start: int = 0, length: int = None,
+                    level: int = 1, timeout: float = 60.0) -> TransferStats:
+    """
+    Copy bytes [start, start+length) of a remote log into the binary file-like
+    `dest`, compressed on the wire and decompressed as it streams in.
+    For rotated .gz files the range refers to the decompressed content; the
+    file is transferred as-is and cut on this side; the channel is closed as
+    soon as the range is complete, so a small range near the start of a large
+    archive does not cost the whole file.
+    Returns TransferStats; raises on remote or transport errors.
+    """
+    stats = TransferStats(path)
+    started = time.monotonic()
+
+    transport = ssh_client.get_transport()
+    if not transport or not transport.is_active():
+        raise ConnectionError("SSH transport is inactive.")
+    channel = transport.open_session()
+    try:
+        channel.settimeout(timeout)
+        channel.exec_command(transfer_command(path, start, length, level))
+
+        decoder = None
+        out = dest
+        satisfied = False  # as-is range complete; the rest of the file is not needed
+        while True:
+            chunk = channel.recv(_CHUNK)
+            if not chunk:
+                break
+            stats.wire_bytes += len(chunk)
+            if stats.mode is None:
+                marker, chunk = chunk[:1], chunk[1:]
+                stats.mode = {b"Z": "gzip", b"G": "as-is", b"R": "plain"}.get(marker)
+                if stats.mode is None:
+                    break
+                if stats.mode != "plain":
+                    decoder = _GzipStream()
+                if stats.mode == "as-is":
+                    out = _RangeWriter(dest, start, length)
+            data = decoder.feed(chunk) if decoder else chunk
+            if data:
+                out.write(data)
+                stats.raw_bytes += len(data)
+            if isinstance(out, _RangeWriter) and out.left == 0:
+                satisfied = True
+                break
+        if decoder and not satisfied:
+            tail = decoder.flush()
+            if tail:
+                out.write(tail)
+                stats.raw_bytes += len(tail)
+        if isinstance(out, _RangeWriter):
+            stats.raw_bytes = out.written
+
+        # Closing early kills the remote cat, so its exit status means nothing then
+        if not satisfied and (channel.recv_exit_status() != 0 or stats.mode is None):
+            error = channel.recv_stderr(4096).decode(errors="ignore").strip()
+            raise RuntimeError(error or f"Transfer of {path} failed")
+    finally:
+        channel.close()
+
+    stats.seconds = time.monotonic() - started
+    logger.info("Fetched %s", stats)
+    return stats
+
+
+def fetch_log_text(ssh_client, path: str, start: int = 0, length: int = None):
+    """Convenience wrapper returning (text, TransferStats)."""
+    buffer = io.BytesIO()
+    stats = fetch_log_range(ssh_client, path, buffer, start=start, length=length)
+    return buffer.getvalue().decode(errors="ignore"), stats
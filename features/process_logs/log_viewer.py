@@ -1,17 +1,57 @@
 # features/process_logs/log_viewer.py
 import logging
 
+from features.process_logs.log_search import LogQuery, LogSearchIndex
+from features.process_logs.log_transfer import fetch_log_range
+from features.remote_shell.batch import run_batch
+
 logger = logging.getLogger("log_viewer")
 
+LOG_PATHS = ["/var/log/syslog", "/var/log/messages"]  # Ubuntu ar CentOS er file
+
 def fetch_logs(ssh_client, lines=50):
-    log_paths = ["/var/log/syslog", "/var/log/messages"]  # Ubuntu ar CentOS er file
-    for log_path in log_paths:
-        try:
-            command = f"tail -n {lines} {log_path}"
-            stdin, stdout, stderr = ssh_client.exec_command(command)
-            errors = stderr.read().decode()
-            if not errors:
-                return stdout.read().decode()
-        except Exception:
-            continue
+    # Both paths are tried in one channel; the first readable one wins
+    try:
+        results = run_batch(ssh_client, [f"tail -n {int(lines)} {log_path}" for log_path in LOG_PATHS])
+        for result in results:
+            if result.ok and not result.stderr:
+                return result.stdout
+    except Exception as e:
+        logger.error("Failed to fetch logs: %s", e)
     return "❌ Unable to fetch logs from known paths (/var/log/syslog, /var/log/messages)."
+
+
+_search_index = LogSearchIndex()
+
+
+def search_logs(ssh_client, patterns=(), since=None, until=None, severity=None, ignore_case=False):
+    """
+    Search current and rotated system logs on the host. Filtering runs
+    remotely so only matching lines are transferred; refinements of a
+    previous search are answered from the local result index.
+    Returns (list of LogMatch, truncated).
+    """
+    if isinstance(patterns, str):
+        patterns = (patterns,)
+    host = ssh_client.get_transport().getpeername()[0]
+    query = LogQuery(patterns=tuple(patterns), since=since, until=until,
+                     severity=severity, ignore_case=ignore_case)
+    try:
+        return _search_index.search(ssh_client, host, query)
+    except Exception as e:
+        logger.error("Log search failed on %s: %s", host, e)
+        return [], False
+
+
+def download_log(ssh_client, remote_path, local_path, start=0, length=None):
+    """
+    Copy a remote log (or a byte range of it) to a local file, gzip'd on the
+    wire. Rotated .gz logs are transferred as they are. Returns TransferStats,
+    or None on failure.
+    """
+    try:
+        with open(local_path, "wb") as dest:
+            return fetch_log_range(ssh_client, remote_path, dest, start=start, length=length)
+    except Exception as e:
+        logger.error("Log download of %s failed: %s", remote_path, e)
+        return None
@@ -0,0 +1,97 @@
+# features/process_logs/process_sampler.py
+import heapq
+import threading
+import time
+from collections import deque
+
+# Record attributes that are sampled every tick and can be ranked
+SAMPLED_METRICS = ("cpu", "rss_kb", "read_rate", "write_rate")
+
+
+class ProcessHistory:
+    """Recent samples of one process; survives the process for a grace period."""
+
+    __slots__ = ("record", "samples", "exited_at")
+
+    def __init__(self, record, length: int):
+        self.record = record
+        self.samples = deque(maxlen=length)  # (timestamp, cpu, rss_kb, read_rate, write_rate)
+        self.exited_at = None
+
+    def peak(self, metric: str) -> float:
+        column = SAMPLED_METRICS.index(metric) + 1
+        return max((sample[column] for sample in self.samples), default=0.0)
+
+
+class ProcessSampler:
+    """
+    Per-process CPU, RSS and IO-rate history built from successive
+    ProcessTable refreshes, plus a top-K ranking per metric for every tick.
+
+    Processes that exit keep their history for `grace_seconds`, so a short
+    spike from a process that is already gone can still be inspected.
+    Safe to read from the GUI thread while a worker calls update().
+    """
+
+    def __init__(self, history_length: int = 60, top_k: int = 10, grace_seconds: float = 60.0):
+        self.history_length = history_length
+        self.top_k = top_k
+        self.grace_seconds = grace_seconds
+        self._histories = {}  # pid -> ProcessHistory
+        self._top = {metric: [] for metric in SAMPLED_METRICS}
+        self._lock = threading.Lock()
+
+    def update(self, table, delta, timestamp: float = None) -> dict:
+        """Sample every record of `table` after a refresh; returns the new top-K ranking."""
+        now = time.time() if timestamp is None else timestamp
+        records = table.records
+        with self._lock:
+            histories = self._histories
+            for pid in delta.removed:
+                history = histories.get(pid)
+                if history is not None and history.exited_at is None:
+                    history.exited_at = now
+
+            for pid, record in records.items():
+                history = histories.get(pid)
+                if history is None or history.record is not record:
+                    # New process, or a pid reused by a different one
+                    history = histories[pid] = ProcessHistory(record, self.history_length)
+                history.samples.append((now, record.cpu, record.rss_kb, record.read_rate, record.write_rate))
+
+            expired = [pid for pid, history in histories.items()
+                       if history.exited_at is not None and now - history.exited_at > self.grace_seconds]
+            for pid in expired:
+                del histories[pid]
+
+            for metric in SAMPLED_METRICS:
+                self._top[metric] = heapq.nlargest(
+                    self.top_k, records.values(), key=lambda record, m=metric: getattr(record, m))
+            return dict(self._top)
+
+    def top(self, metric: str = "cpu") -> list:
+        """ProcessRecords with the highest current value of `metric`, highest first."""
+        with self._lock:
+            return list(self._top[metric])
+
+    def history(self, pid: int) -> list:
+        """[(timestamp, cpu, rss_kb, read_rate, write_rate), ...], oldest first."""
+        with self._lock:
+            history = self._histories.get(pid)
+            return list(history.samples) if history else []
+
+    def peak(self, pid: int, metric: str) -> float:
+        with self._lock:
+            history = self._histories.get(pid)
+            return history.peak(metric) if history else 0.0
+
+    def recently_exited(self) -> list:
+        """(record, exited_at, peak cpu) of processes still inside the grace period."""
+        with self._lock:
+            return [(h.record, h.exited_at, h.peak("cpu"))
+                    for h in self._histories.values() if h.exited_at is not None]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._histories.clear()
+            self._top = {metric: [] for metric in SAMPLED_METRICS}
@@ -0,0 +1,260 @@
+# features/process_logs/process_table.py
+import logging
+import shlex
+import time
+
+logger = logging.getLogger("process_table")
+
+_SECTION = "@@"
+
+
+def process_table_command(include_users: bool = True) -> str:
+    """
+    Remote side of one refresh, in a single exec: uptime, clock tick and page
+    size, MemTotal, the owner uid of every /proc/<pid>, every
+    /proc/<pid>/stat, the byte counters of every readable /proc/<pid>/io,
+    and (only when asked) the uid -> name map.
+    Processes that exit mid-scan, and io files of other users' processes
+    when not running as root, are silently skipped.
+    """
+    script = (
+        "cd /proc || exit 1\n"
+        "cat uptime; getconf CLK_TCK; getconf PAGESIZE; grep MemTotal meminfo; echo @@\n"
+        "stat -c '%n %u' [0-9]* 2>/dev/null; echo @@\n"
+        "cat [0-9]*/stat 2>/dev/null; echo @@\n"
+        "grep -H -e '^read_bytes' -e '^write_bytes' [0-9]*/io 2>/dev/null; echo @@\n"
+    )
+    if include_users:
+        script += "cut -d: -f1,3 /etc/passwd\n"
+    return "sh -c " + shlex.quote(script)
+
+
+def _parse_stat(line: str):
+    """
+    Split a /proc/<pid>/stat line into (pid, comm, fields after comm).
+    comm is bracketed and may itself contain spaces or parentheses.
+    """
+    open_at = line.index("(")
+    close_at = line.rindex(")")
+    return int(line[:open_at]), line[open_at + 1:close_at], line[close_at + 2:].split()
+
+
+class ProcessRecord:
+    """One row of the process table, with numeric CPU, memory and IO."""
+
+    __slots__ = ("pid", "ppid", "uid", "user", "name", "state", "threads",
+                 "cpu", "mem", "rss_kb", "ticks", "start_ticks", "raw",
+                 "read_bytes", "write_bytes", "read_rate", "write_rate")
+
+    def __init__(self, pid: int, start_ticks: int):
+        self.pid = pid
+        self.start_ticks = start_ticks  # distinguishes a reused pid from the old process
+        self.ppid = 0
+        self.uid = None
+        self.user = ""
+        self.name = ""
+        self.state = ""
+        self.threads = 0
+        self.cpu = 0.0  # percent of one core since the previous refresh
+        self.mem = 0.0  # percent of MemTotal
+        self.rss_kb = 0
+        self.ticks = 0  # utime + stime
+        self.raw = ""  # last stat line, so unchanged processes are not reparsed
+        self.read_bytes = None  # storage IO counters; None if /proc/<pid>/io is unreadable
+        self.write_bytes = None
+        self.read_rate = 0.0  # bytes per second since the previous refresh
+        self.write_rate = 0.0
+
+    def key(self):
+        """The values shown in the UI; a row is 'changed' when this differs."""
+        return (self.user, self.name, self.state, self.threads,
+                round(self.cpu, 1), round(self.mem, 1), self.rss_kb,
+                int(self.read_rate) >> 10, int(self.write_rate) >> 10)
+
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__ if name != "raw"}
+
+    def __repr__(self):
+        return f"ProcessRecord(pid={self.pid}, name={self.name!r}, cpu={self.cpu:.1f}, mem={self.mem:.1f})"
+
+
+class ProcessDelta:
+    """What changed between two refreshes: new records, gone pids, updated records."""
+
+    __slots__ = ("added", "removed", "changed", "total", "seconds")
+
+    def __init__(self):
+        self.added = []
+        self.removed = []
+        self.changed = []
+        self.total = 0
+        self.seconds = 0.0
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+
+    def __repr__(self):
+        return (f"ProcessDelta(+{len(self.added)} -{len(self.removed)} ~{len(self.changed)}, "
+                f"total={self.total}, {self.seconds * 1000:.0f} ms)")
+
+
+class ProcessTable:
+    """
+    Client-side copy of a host's full process table, keyed by pid.
+
+    Every refresh reads /proc in one round trip. Stat lines identical to the
+    previous refresh (idle processes) are not reparsed, and only rows whose
+    visible values changed are reported, so a large, mostly idle host costs
+    little per tick on this side.
+    """
+
+    def __init__(self):
+        self.records = {}  # pid -> ProcessRecord
+        self.users = {}  # uid -> user name
+        self.clock_ticks = 100
+        self.page_size = 4096
+        self.mem_total_kb = 0
+        self._uptime = None
+        self._reload_users = True  # /etc/passwd is only re-read when an unknown uid shows up
+
+    def refresh(self, ssh_client, timeout: float = 10.0) -> ProcessDelta:
+        started = time.monotonic()
+        stdin, stdout, stderr = ssh_client.exec_command(
+            process_table_command(include_users=self._reload_users), timeout=timeout)
+        output = stdout.read().decode(errors="ignore")
+        delta = self.apply(output)
+        delta.seconds = time.monotonic() - started
+        return delta
+
+    def apply(self, output: str) -> ProcessDelta:
+        """Merge one process_table_command() output and return the delta."""
+        sections = output.split(_SECTION + "\n")
+        if len(sections) < 5:
+            raise RuntimeError("Unexpected process table output")
+        header, owners, stats, io, users = sections[:5]
+
+        if users:
+            for line in users.splitlines():
+                name, _, uid = line.partition(":")
+                if uid.isdigit():
+                    self.users[int(uid)] = name
+            self._reload_users = False
+
+        header_lines = header.split("\n")
+        uptime = float(header_lines[0].split()[0])
+        self.clock_ticks = int(header_lines[1])
+        self.page_size = int(header_lines[2])
+        self.mem_total_kb = int(header_lines[3].split()[1])
+        elapsed = uptime - self._uptime if self._uptime is not None else 0.0
+        self._uptime = uptime
+
+        uids = {}
+        for line in owners.splitlines():
+            pid, _, uid = line.partition(" ")
+            if pid.isdigit() and uid.isdigit():
+                uids[int(pid)] = int(uid)
+
+        io_counters = {}  # pid -> [read_bytes, write_bytes]
+        for line in io.splitlines():
+            # "<pid>/io:read_bytes: <n>"
+            pid, _, rest = line.partition("/io:")
+            name, _, value = rest.partition(": ")
+            if pid.isdigit() and value.isdigit():
+                counters = io_counters.setdefault(int(pid), [None, None])
+                counters[name == "write_bytes"] = int(value)
+
+        delta = ProcessDelta()
+        seen = set()
+        records = self.records
+        tick_scale = 100.0 / (elapsed * self.clock_ticks) if elapsed > 0 else 0.0
+        mem_scale = 100.0 / self.mem_total_kb if self.mem_total_kb else 0.0
+        page_kb = self.page_size // 1024
+
+        for line in stats.splitlines():
+            try:
+                pid = int(line[:line.index(" ")])
+            except ValueError:
+                continue
+            seen.add(pid)
+            record = records.get(pid)
+            if record is not None and record.raw == line:
+                # No tick moved and nothing else in stat changed; only a CPU value
+                # decaying to zero or IO counters can still alter the row
+                counters = io_counters.get(pid)
+                if (not record.cpu and not record.read_rate and not record.write_rate
+                        and (counters is None or counters == [record.read_bytes, record.write_bytes])):
+                    continue
+                before = record.key()
+                record.cpu = 0.0
+                self._update_io(record, counters, elapsed)
+                if record.key() != before:
+                    delta.changed.append(record)
+                continue
+
+            try:
+                pid, name, fields = _parse_stat(line)
+                start_ticks = int(fields[19])
+                ticks = int(fields[11]) + int(fields[12])
+            except (ValueError, IndexError):
+                continue
+
+            if record is not None and record.start_ticks != start_ticks:
+                delta.removed.append(pid)  # pid reused by a new process
+                record = None
+            is_new = record is None
+            if is_new:
+                record = ProcessRecord(pid, start_ticks)
+                record.ticks = ticks
+                records[pid] = record
+            before = record.key()
+
+            record.raw = line
+            record.name = name
+            record.state = fields[0]
+            record.ppid = int(fields[1])
+            record.threads = int(fields[17])
+            record.rss_kb = int(fields[21]) * page_kb
+            record.mem = record.rss_kb * mem_scale
+            record.cpu = max(0, ticks - record.ticks) * tick_scale
+            record.ticks = ticks
+            self._update_io(record, io_counters.get(pid), elapsed)
+            uid = uids.get(pid, record.uid)
+            if uid != record.uid:
+                record.uid = uid
+                if uid is None:
+                    record.user = ""
+                elif uid in self.users:
+                    record.user = self.users[uid]
+                else:
+                    record.user = str(uid)
+                    self._reload_users = True
+
+            if is_new:
+                delta.added.append(record)
+            elif record.key() != before:
+                delta.changed.append(record)
+
+        for pid in [pid for pid in records if pid not in seen]:
+            del records[pid]
+            delta.removed.append(pid)
+
+        delta.total = len(records)
+        return delta
+
+    @staticmethod
+    def _update_io(record, counters, elapsed):
+        if counters is None:
+            record.read_rate = record.write_rate = 0.0
+            return
+        read_bytes, write_bytes = counters
+        if elapsed > 0 and record.read_bytes is not None and read_bytes is not None:
+            record.read_rate = max(0, read_bytes - record.read_bytes) / elapsed
+        if elapsed > 0 and record.write_bytes is not None and write_bytes is not None:
+            record.write_rate = max(0, write_bytes - record.write_bytes) / elapsed
+        record.read_bytes, record.write_bytes = read_bytes, write_bytes
+
+    def clear(self) -> None:
+        self.records.clear()
+        self.users.clear()
+        self._uptime = None
+        self._reload_users = True
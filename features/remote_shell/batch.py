@@ -0,0 +1,87 @@
+# features/remote_shell/batch.py
+import logging
+import re
+import secrets
+import shlex
+
+from features.remote_shell.shell_command import run_command
+
+logger = logging.getLogger("batch")
+
+
+class BatchResult:
+    """Output of one command of a batch."""
+
+    __slots__ = ("command", "exit_status", "stdout", "stderr")
+
+    def __init__(self, command, exit_status=None, stdout="", stderr=""):
+        self.command = command
+        self.exit_status = exit_status  # None when the batch stopped before this command finished
+        self.stdout = stdout
+        self.stderr = stderr
+
+    @property
+    def ok(self) -> bool:
+        return self.exit_status == 0
+
+    def __repr__(self):
+        return f"BatchResult({self.command!r}, exit_status={self.exit_status})"
+
+
+def batch_script(commands, nonce: str) -> str:
+    """
+    Shell script running `commands` one after another. After each command a
+    line "<nonce>:<index>:<exit status>" is written to stdout and
+    "<nonce>:<index>" to stderr, each preceded by a newline so the marker
+    starts a line even when the output did not end with one; the parser
+    removes that newline again. Commands run in subshells with stdin from
+    /dev/null, so an `exit` or a read only ends their own part.
+    """
+    parts = []
+    for index, command in enumerate(commands):
+        parts.append(
+            f"( {command}\n) </dev/null; rc=$?; "
+            f"printf '\\n{nonce}:{index}:%d\\n' \"$rc\"; printf '\\n{nonce}:{index}\\n' >&2"
+        )
+    return "\n".join(parts)
+
+
+def _split(text: str, nonce: str, with_status: bool):
+    """Map command index -> (output, exit status or None) from one framed stream."""
+    pattern = re.compile("\n" + re.escape(nonce) + (r":(\d+):(-?\d+)\n" if with_status else r":(\d+)\n"))
+    sections = {}
+    position = 0
+    for match in pattern.finditer(text):
+        status = int(match.group(2)) if with_status else None
+        sections[int(match.group(1))] = (text[position:match.start()], status)
+        position = match.end()
+    return sections
+
+
+def run_batch(ssh_client, commands, timeout: float = 60.0) -> list:
+    """
+    Run several commands over a single SSH channel and return one
+    BatchResult per command, in order, with its own stdout, stderr and exit
+    status. This costs one channel open and one round trip however many
+    commands there are. A random nonce frames the outputs, so command
+    output cannot fake a boundary.
+    """
+    commands = list(commands)
+    if not commands:
+        return []
+    nonce = "@@batch-" + secrets.token_hex(8)
+    with run_command(ssh_client, "sh -c " + shlex.quote(batch_script(commands, nonce)),
+                     timeout=timeout) as outcome:
+        stdout = _split(outcome.stdout, nonce, with_status=True)
+        stderr = _split(outcome.stderr, nonce, with_status=False)
+        timed_out = outcome.timed_out
+
+    results = []
+    for index, command in enumerate(commands):
+        out, status = stdout.get(index, ("", None))
+        err, _ = stderr.get(index, ("", None))
+        results.append(BatchResult(command, status, out, err))
+    if timed_out:
+        done = sum(1 for r in results if r.exit_status is not None)
+        logger.warning("Batch timed out after %d of %d commands", done, len(commands))
+    return results
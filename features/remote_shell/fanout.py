@@ -0,0 +1,232 @@
+# features/remote_shell/fanout.py
+import codecs
+import hashlib
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from features.remote_shell.shell_command import run_command
+from features.server_monitoring.fleet_poller import load_registered_servers
+from features.ssh_access.connection_pool import get_connection_pool
+
+logger = logging.getLogger("fanout")
+
+
+def host_label(server: dict) -> str:
+    """Short name of a registered server for tagging output: user@ip[:port]."""
+    label = f"{server.get('username', '')}@{server['ip']}" if server.get("username") else server["ip"]
+    port = int(server.get("port", 22) or 22)
+    return label if port == 22 else f"{label}:{port}"
+
+
+class HostResult:
+    """What one host returned for a fan-out command."""
+
+    __slots__ = ("host", "exit_status", "stdout", "stderr", "error", "timed_out", "duration")
+
+    def __init__(self, host):
+        self.host = host
+        self.exit_status = None
+        self.stdout = ""
+        self.stderr = ""
+        self.error = None  # connection / channel failure, if the command never ran to completion
+        self.timed_out = False
+        self.duration = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.timed_out and self.exit_status == 0
+
+    def signature(self) -> str:
+        """Digest of everything hosts are grouped by."""
+        digest = hashlib.sha1()
+        for part in (str(self.exit_status), self.error or "", "T" if self.timed_out else "",
+                     self.stdout, self.stderr):
+            digest.update(part.encode(errors="ignore"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+
+class OutputGroup:
+    """Hosts that produced identical output and exit status."""
+
+    __slots__ = ("hosts", "exit_status", "stdout", "stderr", "error", "timed_out")
+
+    def __init__(self, result: HostResult):
+        self.hosts = []
+        self.exit_status = result.exit_status
+        self.stdout = result.stdout
+        self.stderr = result.stderr
+        self.error = result.error
+        self.timed_out = result.timed_out
+
+
+class FanoutSummary:
+    """All host results of one fan-out run, grouped by identical output."""
+
+    def __init__(self, command: str, results: list, elapsed: float, cancelled: bool = False):
+        self.command = command
+        self.results = results
+        self.elapsed = elapsed
+        self.cancelled = cancelled
+        groups = {}
+        for result in results:
+            signature = result.signature()
+            group = groups.get(signature)
+            if group is None:
+                group = groups[signature] = OutputGroup(result)
+            group.hosts.append(result.host)
+        # Biggest group first: the odd hosts out end up at the bottom
+        self.groups = sorted(groups.values(), key=lambda g: len(g.hosts), reverse=True)
+
+    @property
+    def ok(self) -> int:
+        return sum(1 for r in self.results if r.ok)
+
+    @property
+    def failed(self) -> int:
+        return len(self.results) - self.ok
+
+    def format(self) -> str:
+        """Plain-text report: one block per distinct output."""
+        lines = [f"$ {self.command}",
+                 f"{len(self.results)} hosts, {self.ok} ok, {self.failed} failed, "
+                 f"{len(self.groups)} distinct outputs in {self.elapsed:.1f}s"
+                 + (" (cancelled)" if self.cancelled else "")]
+        for group in self.groups:
+            if group.error:
+                status = f"error: {group.error}"
+            elif group.timed_out:
+                status = "timed out"
+            else:
+                status = f"exit {group.exit_status}"
+            lines.append("")
+            lines.append(f"── {len(group.hosts)} host(s), {status}: {', '.join(sorted(group.hosts))}")
+            if group.stdout:
+                lines.append(group.stdout.rstrip("\n"))
+            if group.stderr:
+                lines.append("[stderr] " + group.stderr.rstrip("\n"))
+        return "\n".join(lines)
+
+
+class FanoutRunner:
+    """
+    Runs one command on many registered servers at once.
+
+    Hosts are worked through on a thread pool of `max_workers`, reusing the
+    shared connection pool's transports; each host gets `host_timeout`
+    seconds for connect + command, so a dead host only holds its own slot.
+    Output is passed to on_output(host, stream, text) as it arrives, from
+    the worker threads; on_result(HostResult) fires as each host finishes.
+    """
+
+    def __init__(self, max_workers: int = 32, host_timeout: float = 30.0, pool=None):
+        self.max_workers = max_workers
+        self.host_timeout = host_timeout
+        self.pool = pool or get_connection_pool()
+        self._cancel = threading.Event()
+
+    def run(self, command: str, servers=None, on_output=None, on_result=None) -> FanoutSummary:
+        """Run `command` on `servers` (default: every registered server) and wait for all of them."""
+        started = time.monotonic()
+        servers = load_registered_servers() if servers is None else servers
+        self._cancel.clear()
+
+        logger.info("Fan-out to %d hosts: %s", len(servers), command)
+        # Stay within the shared pool: pages hold leases on it too
+        workers = self.pool.concurrency_for(min(self.max_workers, max(1, len(servers))))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fanout") as executor:
+            futures = [executor.submit(self._run_host, server, command, on_output, on_result)
+                       for server in servers]
+            results = [f.result() for f in futures]
+
+        summary = FanoutSummary(command, [r for r in results if r is not None],
+                                time.monotonic() - started, self._cancel.is_set())
+        logger.info("Fan-out finished: %d ok, %d failed in %.1fs", summary.ok, summary.failed, summary.elapsed)
+        return summary
+
+    def cancel(self) -> None:
+        """Skip hosts that have not started yet; commands already running finish or time out."""
+        self._cancel.set()
+
+    def _run_host(self, server, command, on_output, on_result):
+        if self._cancel.is_set():
+            return None
+        host = host_label(server)
+        result = HostResult(host)
+        started = time.monotonic()
+        client = None
+        try:
+            client = self.pool.acquire(
+                server["ip"], port=server.get("port", 22), username=server.get("username", ""),
+                password=server.get("password", ""), key_file=server.get("key_file"),
+                timeout=self.host_timeout,
+            )
+            remaining = max(0.1, self.host_timeout - (time.monotonic() - started))
+            on_stdout = on_stderr = None
+            if on_output is not None:
+                on_stdout = self._tagger(on_output, host, "stdout")
+                on_stderr = self._tagger(on_output, host, "stderr")
+            with run_command(client, command, timeout=remaining,
+                             on_stdout=on_stdout, on_stderr=on_stderr) as outcome:
+                result.exit_status = outcome.exit_status
+                result.timed_out = outcome.timed_out
+                result.stdout = outcome.stdout
+                result.stderr = outcome.stderr
+        except Exception as e:
+            result.error = str(e) or type(e).__name__
+            logger.warning("Fan-out to %s failed: %s", host, result.error)
+        finally:
+            if client is not None:
+                self.pool.release(client)
+            result.duration = time.monotonic() - started
+
+        if on_result is not None:
+            try:
+                on_result(result)
+            except Exception:
+                logger.exception("Fan-out result callback failed")
+        return result
+
+    @staticmethod
+    def _tagger(on_output, host, stream):
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+
+        def emit(data):
+            text = decoder.decode(data)
+            if text:
+                on_output(host, stream, text)
+        return emit
+
+
+class FanoutWorker(QThread):
+    """
+    Runs a FanoutRunner in the background. Output chunks, finished hosts
+    and the final summary are delivered as Qt signals.
+    """
+
+    output = pyqtSignal(str, str, str)  # host, "stdout" | "stderr", text
+    host_finished = pyqtSignal(object)  # HostResult
+    finished_summary = pyqtSignal(object)  # FanoutSummary
+    error = pyqtSignal(str)
+
+    def __init__(self, command: str, servers=None, max_workers: int = 32, host_timeout: float = 30.0):
+        super().__init__()
+        self.command = command
+        self.servers = servers
+        self.runner = FanoutRunner(max_workers=max_workers, host_timeout=host_timeout)
+
+    def run(self):
+        try:
+            summary = self.runner.run(self.command, self.servers,
+                                      on_output=self.output.emit, on_result=self.host_finished.emit)
+            self.finished_summary.emit(summary)
+        except Exception as e:
+            logger.error("Fan-out failed: %s", e)
+            self.error.emit(str(e))
+
+    def stop(self):
+        self.runner.cancel()
@@ -1,36 +1,166 @@
 # features/remote_shell/shell_command.py
 import logging
+import select
+import tempfile
+import time
 
 logger = logging.getLogger("shell_command")
 
-def execute_command(ssh_client, command: str):
+SPOOL_BYTES = 1024 * 1024  # output kept in memory per stream before spilling to a temp file
+CHUNK_SIZE = 65536
+
+
+class CommandResult:
     """
-    Execute a shell command on the remote server via SSH using a PTY and TERM environment.
-    Returns stdout and stderr output as strings.
+    Outcome of run_command(). stdout/stderr are spooled: small outputs stay
+    in memory, larger ones live in a temporary file, so the `stdout` and
+    `stderr` properties read them back on demand; for large outputs use
+    iter_stdout() / iter_stderr() or the spool files themselves. Call
+    close() (or use the result as a context manager) to drop the spool.
     """
-    import time
 
-    try:
-        logger.info("Executing command with PTY: %s", command)
-        transport = ssh_client.get_transport()
-        if not transport or not transport.is_active():
-            return None, "SSH transport is inactive."
+    def __init__(self, command: str):
+        self.command = command
+        self.exit_status = None  # None when the command timed out or the channel died first
+        self.timed_out = False
+        self.error = None  # set when the command could not be run at all
+        self.duration = 0.0
+        self.stdout_bytes = 0
+        self.stderr_bytes = 0
+        self.stdout_file = tempfile.SpooledTemporaryFile(max_size=SPOOL_BYTES)
+        self.stderr_file = tempfile.SpooledTemporaryFile(max_size=SPOOL_BYTES)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.exit_status == 0
+
+    @property
+    def stdout(self) -> str:
+        return self._read(self.stdout_file)
+
+    @property
+    def stderr(self) -> str:
+        return self._read(self.stderr_file)
+
+    def iter_stdout(self, chunk_size: int = CHUNK_SIZE):
+        """Yield stdout as bytes chunks without loading all of it."""
+        return self._iter(self.stdout_file, chunk_size)
+
+    def iter_stderr(self, chunk_size: int = CHUNK_SIZE):
+        return self._iter(self.stderr_file, chunk_size)
+
+    def close(self) -> None:
+        self.stdout_file.close()
+        self.stderr_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __repr__(self):
+        return (f"CommandResult({self.command!r}, exit_status={self.exit_status}, "
+                f"timed_out={self.timed_out}, {self.duration * 1000:.0f} ms)")
 
-        session = transport.open_session()
-        session.get_pty(term='xterm')  # 🔧 Allocate a PTY
-        session.exec_command(command)
+    @staticmethod
+    def _read(spool) -> str:
+        spool.seek(0)
+        return spool.read().decode(errors="ignore")
 
-        time.sleep(1.0)  # ⏳ Let command produce output
+    @staticmethod
+    def _iter(spool, chunk_size):
+        spool.seek(0)
+        while True:
+            chunk = spool.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
 
-        stdout = session.recv(65535).decode(errors="ignore")
-        stderr = session.recv_stderr(65535).decode(errors="ignore")
 
-        if stderr:
-            logger.warning("Command error output: %s", stderr)
-            return stdout, stderr
+def run_command(ssh_client, command: str, timeout: float = None, pty: bool = False,
+                on_stdout=None, on_stderr=None) -> CommandResult:
+    """
+    Run `command` and wait for its real exit status.
+
+    Output is read as it arrives (select() on the channel) rather than after
+    a fixed delay: each chunk goes to the optional on_stdout/on_stderr
+    callbacks (bytes) and to the result's spool. A fast command returns
+    after one round trip; a long one is read to the end. When `timeout`
+    seconds pass first, the channel is closed and `timed_out` is set.
+    With pty=True stderr is merged into stdout by the remote terminal.
+    """
+    result = CommandResult(command)
+    started = time.monotonic()
+    deadline = None if timeout is None else started + timeout
+
+    transport = ssh_client.get_transport()
+    if not transport or not transport.is_active():
+        raise ConnectionError("SSH transport is inactive.")
+
+    channel = transport.open_session(timeout=timeout)
+    try:
+        if pty:
+            channel.get_pty(term="xterm")
+        channel.exec_command(command)
+
+        while True:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                result.timed_out = True
+                break
+            if channel.eof_received and not channel.recv_ready() and not channel.recv_stderr_ready():
+                # All output is in; the exit status follows EOF on the wire
+                if channel.status_event.wait(remaining):
+                    result.exit_status = channel.recv_exit_status()
+                else:
+                    result.timed_out = True
+                break
+            if channel.closed:
+                break
+            select.select([channel], [], [], remaining)
+            while channel.recv_ready():
+                data = channel.recv(CHUNK_SIZE)
+                if not data:
+                    break
+                result.stdout_file.write(data)
+                result.stdout_bytes += len(data)
+                if on_stdout:
+                    on_stdout(data)
+            while channel.recv_stderr_ready():
+                data = channel.recv_stderr(CHUNK_SIZE)
+                if not data:
+                    break
+                result.stderr_file.write(data)
+                result.stderr_bytes += len(data)
+                if on_stderr:
+                    on_stderr(data)
+    finally:
+        channel.close()
+        result.duration = time.monotonic() - started
 
-        return stdout, None
+    if result.timed_out:
+        logger.warning("Command timed out after %.1fs: %s", timeout, command)
+    return result
 
+
+def execute_command(ssh_client, command: str, timeout: float = 60.0) -> CommandResult:
+    """
+    Execute a shell command on the remote server via SSH using a PTY and TERM environment.
+    Returns the CommandResult: exit status, duration, timed_out, and the
+    spooled output (read `stdout` for small outputs, iter_stdout() for large
+    ones). If the command could not be run, `error` says why. The caller
+    owns the result and should close() it.
+    """
+    try:
+        logger.info("Executing command with PTY: %s", command)
+        result = run_command(ssh_client, command, timeout=timeout, pty=True)
     except Exception as e:
         logger.error("Failed to execute command: %s", e)
-        return None, str(e)
+        result = CommandResult(command)
+        result.error = str(e)
+        return result
+
+    if result.exit_status:
+        logger.warning("Command exited with status %d (%d bytes of stderr)", result.exit_status, result.stderr_bytes)
+    return result
@@ -1,37 +1,165 @@
 import logging
+import threading
+import time
+import weakref
 
 logger = logging.getLogger("cpu_memory_disk")
 
+# One exec per sample: raw kernel counters instead of scraping top/free/df text.
+PROBE_COMMAND = (
+    "head -n1 /proc/stat; echo @@; "
+    "cat /proc/meminfo; echo @@; "
+    "cat /proc/loadavg; echo @@; "
+    "df -Pk / | tail -n1"
+)
+
+EMPTY_USAGE = {"cpu": None, "memory": None, "disk": None}
+
+
+def parse_cpu_counters(line: str):
+    """
+    Parse the aggregate 'cpu' line of /proc/stat into (busy, total) jiffies.
+    iowait counts as idle time, steal/irq/softirq as busy.
+    """
+    fields = line.split()
+    if not fields or fields[0] != "cpu":
+        return None
+    values = [int(v) for v in fields[1:9]]
+    values += [0] * (8 - len(values))
+    total = sum(values)
+    idle = values[3] + values[4]  # idle + iowait
+    return total - idle, total
+
+
+def cpu_percent(prev, cur):
+    """CPU usage between two (busy, total) counter samples, in percent."""
+    if cur is None:
+        return None
+    if prev is None:
+        busy, total = cur  # first sample: average since boot
+    else:
+        busy, total = cur[0] - prev[0], cur[1] - prev[1]
+    if total <= 0:
+        return 0.0
+    return round(max(0.0, min(100.0, busy * 100.0 / total)), 2)
+
+
+def memory_usage(total_kb: int, available_kb: int):
+    """Return (used_kb, percent) from MemTotal/MemAvailable."""
+    if not total_kb:
+        return 0, None
+    used = max(0, total_kb - available_kb)
+    return used, round(used * 100.0 / total_kb, 2)
+
+
+def parse_probe_output(text: str) -> dict:
+    """
+    Split PROBE_COMMAND output into typed raw counters.
+    Missing sections are simply left out of the result.
+    """
+    sections = text.split("@@\n")
+    raw = {}
+
+    if sections and sections[0].strip():
+        raw["cpu_counters"] = parse_cpu_counters(sections[0].strip())
+
+    if len(sections) > 1:
+        meminfo = {}
+        for line in sections[1].splitlines():
+            name, _, rest = line.partition(":")
+            parts = rest.split()
+            if parts:
+                meminfo[name] = int(parts[0])
+        total = meminfo.get("MemTotal", 0)
+        available = meminfo.get("MemAvailable")
+        if available is None:  # kernels < 3.14
+            available = meminfo.get("MemFree", 0) + meminfo.get("Buffers", 0) + meminfo.get("Cached", 0)
+        raw["mem_total_kb"] = total
+        raw["mem_available_kb"] = available
+
+    if len(sections) > 2:
+        load = sections[2].split()
+        if len(load) >= 3:
+            raw["load"] = (float(load[0]), float(load[1]), float(load[2]))
+
+    if len(sections) > 3:
+        disk = sections[3].split()
+        if len(disk) >= 3:
+            raw["disk_total_kb"] = int(disk[1])
+            raw["disk_used_kb"] = int(disk[2])
+
+    return raw
+
+
+def build_usage(raw: dict, prev_cpu=None) -> dict:
+    """Turn raw counters into the numeric usage dict returned by get_resource_usage."""
+    usage = dict(EMPTY_USAGE)
+    usage["timestamp"] = time.time()
+
+    usage["cpu"] = cpu_percent(prev_cpu, raw.get("cpu_counters"))
+
+    if "mem_total_kb" in raw:
+        used, percent = memory_usage(raw["mem_total_kb"], raw["mem_available_kb"])
+        usage["memory"] = percent
+        usage["mem_total_kb"] = raw["mem_total_kb"]
+        usage["mem_used_kb"] = used
+
+    if "load" in raw:
+        usage["load_1"], usage["load_5"], usage["load_15"] = raw["load"]
+
+    if raw.get("disk_total_kb"):
+        usage["disk_total_kb"] = raw["disk_total_kb"]
+        usage["disk_used_kb"] = raw["disk_used_kb"]
+        usage["disk"] = round(raw["disk_used_kb"] * 100.0 / raw["disk_total_kb"], 2)
+
+    return usage
+
+
+class ResourceProbe:
+    """
+    Samples one host with PROBE_COMMAND and remembers the previous CPU
+    counters so CPU usage is a delta between consecutive samples.
+    """
+
+    def __init__(self):
+        self._prev_cpu = None
+        self._lock = threading.Lock()
+
+    def update(self, raw: dict) -> dict:
+        with self._lock:
+            usage = build_usage(raw, self._prev_cpu)
+            if raw.get("cpu_counters"):
+                self._prev_cpu = raw["cpu_counters"]
+        return usage
+
+    def sample(self, ssh_client, timeout: float = None) -> dict:
+        stdin, stdout, _ = ssh_client.exec_command(PROBE_COMMAND, timeout=timeout)
+        return self.update(parse_probe_output(stdout.read().decode(errors="ignore")))
+
+
+# One probe per live transport so CPU deltas survive between calls.
+_probes = weakref.WeakKeyDictionary()
+_probes_lock = threading.Lock()
+
+
+def get_probe(ssh_client) -> ResourceProbe:
+    """The ResourceProbe holding CPU-delta state for this client's transport."""
+    key = ssh_client.get_transport() or ssh_client
+    with _probes_lock:
+        probe = _probes.get(key)
+        if probe is None:
+            probe = _probes[key] = ResourceProbe()
+        return probe
+
+
 def get_resource_usage(ssh_client):
     """
     Get CPU, memory, and disk usage from the remote server via SSH.
-    Returns a dictionary with usage stats.
+    Returns a dictionary of numbers: cpu/memory/disk in percent, load_1/5/15,
+    mem_total_kb/mem_used_kb, disk_total_kb/disk_used_kb and a timestamp.
     """
     try:
-        usage = {}
-
-        # CPU Usage
-        stdin, stdout, _ = ssh_client.exec_command("top -bn1 | grep 'Cpu(s)'")
-        cpu_line = stdout.read().decode()
-        if cpu_line:
-            cpu_usage = cpu_line.split(",")[0].split(":")[-1].strip()
-            usage["cpu"] = cpu_usage
-
-        # Memory Usage
-        stdin, stdout, _ = ssh_client.exec_command("free -m")
-        mem_lines = stdout.readlines()
-        if len(mem_lines) > 1:
-            mem_data = mem_lines[1].split()
-            total, used = int(mem_data[1]), int(mem_data[2])
-            usage["memory"] = round((used / total) * 100, 2)
-
-        # Disk Usage
-        stdin, stdout, _ = ssh_client.exec_command("df -h / | tail -1")
-        disk_line = stdout.read().decode().split()
-        if disk_line:
-            usage["disk"] = disk_line[4]  # e.g., '40%'
-
-        return usage
+        return get_probe(ssh_client).sample(ssh_client)
     except Exception as e:
         logger.error("Failed to fetch resource usage: %s", e)
-        return {"cpu": None, "memory": None, "disk": None}
+        return dict(EMPTY_USAGE)
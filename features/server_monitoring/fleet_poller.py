@@ -0,0 +1,231 @@
+# features/server_monitoring/fleet_poller.py
+import logging
+import threading
+import time
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from features.server_monitoring.cpu_memory_disk import ResourceProbe
+from features.server_registration.server_registry import get_server_registry
+from features.ssh_access.connection_pool import SSHConnectionPool
+
+logger = logging.getLogger("fleet_poller")
+
+
+class HostStatus:
+    """Latest sample and health of one polled host."""
+
+    __slots__ = ("key", "usage", "ok", "error", "latency", "updated")
+
+    def __init__(self, key):
+        self.key = key
+        self.usage = None
+        self.ok = False
+        self.error = None
+        self.latency = None
+        self.updated = None
+
+    def as_dict(self) -> dict:
+        host, port, username = self.key
+        return {
+            "host": host,
+            "port": port,
+            "username": username,
+            "usage": self.usage,
+            "ok": self.ok,
+            "error": self.error,
+            "latency": self.latency,
+            "updated": self.updated,
+        }
+
+
+class FleetStore:
+    """
+    Thread-safe in-memory store of the latest sample per host, shared by
+    the poller (writer) and any number of views (readers).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hosts = {}
+
+    def record(self, key, usage=None, error=None, latency=None):
+        with self._lock:
+            status = self._hosts.get(key)
+            if status is None:
+                status = self._hosts[key] = HostStatus(key)
+            status.ok = error is None
+            status.error = error
+            status.latency = latency
+            status.updated = time.time()
+            if usage is not None:
+                status.usage = usage
+        return status
+
+    def get(self, key):
+        with self._lock:
+            status = self._hosts.get(key)
+            return status.as_dict() if status else None
+
+    def snapshot(self) -> list:
+        with self._lock:
+            return [status.as_dict() for status in self._hosts.values()]
+
+    def forget(self, keys) -> None:
+        with self._lock:
+            for key in keys:
+                self._hosts.pop(key, None)
+
+
+def load_registered_servers() -> list:
+    """Every registered server, from the shared in-memory registry."""
+    try:
+        return get_server_registry().servers()
+    except Exception as e:
+        logger.error("Failed to load server store: %s", e)
+        return []
+
+
+class FleetPoller:
+    """
+    Samples every registered server concurrently on a bounded thread pool.
+
+    Each host gets `host_deadline` seconds for connect + probe, counted
+    from when its probe starts, so one slow or dead host only costs its own
+    slot. A host whose previous sample is still running is skipped for the
+    sweep instead of being queued twice. Results land in a shared FleetStore.
+
+    Unless a pool is passed in, the poller keeps its own connection pool,
+    grown to the fleet size, so every host's transport survives between
+    sweeps instead of being LRU-evicted from the pages' shared pool.
+    """
+
+    def __init__(self, store: FleetStore = None, max_workers: int = 64,
+                 host_deadline: float = 2.5, pool=None, history=None):
+        self.store = store or FleetStore()
+        self.history = history  # optional MetricsHistory for on-disk retention
+        self.max_workers = max_workers
+        self.host_deadline = host_deadline
+        self._own_pool = pool is None
+        self.pool = pool or SSHConnectionPool(max_connections=max_workers)
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fleet-poll")
+        self._probes = {}
+        self._in_flight = set()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+
+    def poll_once(self, servers=None) -> dict:
+        """
+        Run one sweep and wait at most host_deadline for it.
+        Returns counts of ok / failed / late / skipped hosts and the elapsed time.
+        """
+        started = time.monotonic()
+        servers = load_registered_servers() if servers is None else servers
+        if self._own_pool:
+            self.pool.max_connections = max(self.max_workers, len(servers))
+        # Stay within the pool: a shared one has pages holding leases on it too
+        slots = threading.Semaphore(self.pool.concurrency_for(self.max_workers))
+
+        futures = {}  # future -> key
+        starts = {}  # key -> when its probe got a slot
+        skipped = 0
+        for server in servers:
+            key = (server["ip"], int(server.get("port", 22) or 22), server.get("username", ""))
+            with self._lock:
+                if key in self._in_flight:
+                    skipped += 1
+                    continue
+                self._in_flight.add(key)
+            futures[self._executor.submit(self._poll_host, key, server, slots, starts)] = key
+
+        # Wait until every host has finished or run past its own deadline;
+        # hosts still queued for a slot are not late yet
+        done, pending = set(), set(futures)
+        while pending and not self._stop.is_set():
+            now = time.monotonic()
+            deadlines = [starts[futures[f]] + self.host_deadline for f in pending if futures[f] in starts]
+            if len(deadlines) == len(pending) and max(deadlines) <= now:
+                break
+            upcoming = [d for d in deadlines if d > now]
+            finished, pending = wait(pending, timeout=min(upcoming) - now if upcoming else self.host_deadline,
+                                     return_when=FIRST_COMPLETED if len(deadlines) < len(pending) else ALL_COMPLETED)
+            done |= finished
+        ok = sum(1 for f in done if f.result())
+        summary = {
+            "hosts": len(servers),
+            "ok": ok,
+            "failed": len(done) - ok,
+            "late": len(pending),
+            "skipped": skipped,
+            "elapsed": round(time.monotonic() - started, 3),
+        }
+        if pending or skipped:
+            logger.warning("Fleet sweep: %d late, %d still busy from last sweep", len(pending), skipped)
+        return summary
+
+    def start(self, interval: float = 3.0) -> None:
+        """Poll the whole fleet every `interval` seconds in a background thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(interval,), name="fleet-poller", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.host_deadline + 1)
+            self._thread = None
+
+    def shutdown(self) -> None:
+        self.stop()
+        self._executor.shutdown(wait=False)
+        if self._own_pool:
+            self.pool.close_all()
+
+    # ------------------------------------------------------------------ #
+
+    def _run(self, interval):
+        next_tick = time.monotonic()
+        while not self._stop.is_set():
+            try:
+                self.poll_once()
+            except Exception as e:
+                logger.error("Fleet sweep failed: %s", e)
+            next_tick += interval
+            delay = next_tick - time.monotonic()
+            if delay < 0:
+                next_tick = time.monotonic()  # overran; don't try to catch up
+                delay = 0
+            self._stop.wait(delay)
+
+    def _poll_host(self, key, server, slots, starts) -> bool:
+        client = None
+        slots.acquire()
+        started = starts[key] = time.monotonic()
+        try:
+            client = self.pool.acquire(
+                key[0], port=key[1], username=key[2],
+                password=server.get("password", ""),
+                key_file=server.get("key_file"),
+                timeout=self.host_deadline,
+            )
+            remaining = max(0.1, self.host_deadline - (time.monotonic() - started))
+            probe = self._probes.get(key)
+            if probe is None:
+                probe = self._probes.setdefault(key, ResourceProbe())
+            usage = probe.sample(client, timeout=remaining)
+            self.store.record(key, usage=usage, latency=time.monotonic() - started)
+            if self.history is not None:
+                self.history.append(key[0], usage)
+            return True
+        except Exception as e:
+            self.store.record(key, error=str(e), latency=time.monotonic() - started)
+            return False
+        finally:
+            if client is not None:
+                self.pool.release(client)
+            slots.release()
+            with self._lock:
+                self._in_flight.discard(key)
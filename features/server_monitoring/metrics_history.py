@@ -0,0 +1,250 @@
+# features/server_monitoring/metrics_history.py
+import logging
+import re
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger("metrics_history")
+
+HISTORY_DIR = Path(__file__).resolve().parent.parent.parent / "logs" / "metrics"
+
+METRICS = ("cpu", "memory", "disk", "load_1")
+
+# Raw samples: 24 bytes each, one append-only segment per host per UTC day.
+RAW_DTYPE = np.dtype([("ts", "<f8")] + [(m, "<f4") for m in METRICS])
+
+# Rollups: sample count plus average and maximum of every metric per bucket.
+ROLLUP_DTYPE = np.dtype(
+    [("ts", "<f8"), ("count", "<u4")]
+    + [(f"{m}_avg", "<f4") for m in METRICS]
+    + [(f"{m}_max", "<f4") for m in METRICS]
+)
+
+ROLLUPS = {"1m": 60, "1h": 3600}
+
+
+def _host_dir_name(host: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]", "_", str(host))
+
+
+def _open_records(path: Path, dtype):
+    """Memory-map a segment read-only, ignoring a torn trailing record."""
+    try:
+        count = path.stat().st_size // dtype.itemsize
+    except FileNotFoundError:
+        return None
+    if not count:
+        return None
+    return np.memmap(path, dtype=dtype, mode="r", shape=(count,))
+
+
+def _slice(records, start: float, end: float):
+    ts = records["ts"]
+    lo = int(np.searchsorted(ts, start, side="left"))
+    hi = int(np.searchsorted(ts, end, side="right"))
+    return records[lo:hi]
+
+
+def _aggregate(records, bucket: int, value_fields=None):
+    """
+    Group time-sorted records into `bucket`-second rollup rows.
+    `value_fields` maps metric -> (avg source, max source, weight source) for
+    re-rolling rollups; raw samples use the metric column for all three.
+    """
+    keys = (records["ts"] // bucket).astype(np.int64)
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    out = np.zeros(len(starts), dtype=ROLLUP_DTYPE)
+    out["ts"] = keys[starts] * bucket
+
+    weights = records["count"].astype(np.float64) if value_fields else np.ones(len(records))
+    out["count"] = np.add.reduceat(weights, starts)
+
+    for m in METRICS:
+        avg_src = records[f"{m}_avg"] if value_fields else records[m]
+        max_src = records[f"{m}_max"] if value_fields else records[m]
+        valid = ~np.isnan(avg_src)
+        w = np.where(valid, weights, 0.0)
+        total = np.add.reduceat(np.where(valid, avg_src * weights, 0.0), starts)
+        n = np.add.reduceat(w, starts)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out[f"{m}_avg"] = np.where(n > 0, total / n, np.nan)
+        out[f"{m}_max"] = np.fmax.reduceat(np.asarray(max_src, dtype=np.float32), starts)
+    return out
+
+
+class MetricsHistory:
+    """
+    Local, append-only on-disk history of resource samples.
+
+    Samples are buffered and appended to per-host daily segments of packed
+    24-byte records. A background thread flushes them and maintains 1-minute
+    and 1-hour rollup files. Queries memory-map only the segments that overlap
+    the requested range and binary-search the timestamps, so "host X CPU,
+    last 7 days" reads a few thousand rollup rows instead of every sample.
+    """
+
+    def __init__(self, root: Path = HISTORY_DIR, flush_interval: float = 2.0, rollup_interval: float = 60.0):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.flush_interval = flush_interval
+        self.rollup_interval = rollup_interval
+
+        self._pending = {}  # host -> list of raw rows
+        self._lock = threading.Lock()  # guards _pending
+        self._io_lock = threading.Lock()  # serialises segment/rollup writes
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="metrics-history", daemon=True)
+        self._thread.start()
+
+    # -- writing ---------------------------------------------------------- #
+
+    def append(self, host: str, sample: dict) -> None:
+        """Queue one get_resource_usage() sample; safe to call from any thread."""
+        if not sample or sample.get("timestamp") is None:
+            return
+        row = (sample["timestamp"],) + tuple(
+            np.nan if sample.get(m) is None else sample[m] for m in METRICS
+        )
+        with self._lock:
+            self._pending.setdefault(host, []).append(row)
+
+    def flush(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        with self._io_lock:
+            for host, rows in pending.items():
+                records = np.array(rows, dtype=RAW_DTYPE)
+                records.sort(order="ts")
+                days = (records["ts"] // 86400).astype(np.int64)
+                for day in np.unique(days):
+                    path = self._raw_path(host, int(day))
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    with path.open("ab") as f:
+                        f.write(records[days == day].tobytes())
+
+    def build_rollups(self) -> None:
+        """Extend every host's rollups up to the last complete bucket."""
+        with self._io_lock:
+            for host_dir in self.root.iterdir():
+                if host_dir.is_dir():
+                    try:
+                        self._roll_host(host_dir)
+                    except Exception as e:
+                        logger.error("Rollup failed for %s: %s", host_dir.name, e)
+
+    def close(self) -> None:
+        self._stop.set()
+        self._thread.join(timeout=5)
+        self.flush()
+        self.build_rollups()
+
+    # -- reading ---------------------------------------------------------- #
+
+    def query(self, host: str, metric: str, start: float, end: float = None,
+              resolution: str = None, stat: str = "avg"):
+        """
+        Return (timestamps, values) numpy arrays for one host/metric in [start, end].
+
+        `resolution` is "raw", "1m" or "1h"; by default it is picked from the
+        span (raw up to 6 hours, 1m up to 7 days, 1h beyond). `stat` selects
+        "avg" or "max" for rollups. Unflushed samples are not included.
+        """
+        end = time.time() if end is None else end
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric: {metric}")
+        if resolution is None:
+            span = end - start
+            # A little slack so "last 7 days" computed a moment earlier still maps to 1m
+            resolution = "raw" if span <= 6 * 3600 + 60 else "1m" if span <= 7 * 86400 + 3600 else "1h"
+
+        host_dir = self.root / _host_dir_name(host)
+        if resolution == "raw":
+            parts = []
+            for day in range(int(start // 86400), int(end // 86400) + 1):
+                records = _open_records(host_dir / f"raw-{day}.bin", RAW_DTYPE)
+                if records is not None:
+                    parts.append(_slice(records, start, end))
+            column = metric
+        elif resolution in ROLLUPS:
+            records = _open_records(host_dir / f"rollup-{resolution}.bin", ROLLUP_DTYPE)
+            parts = [] if records is None else [_slice(records, start, end)]
+            column = f"{metric}_{stat}"
+        else:
+            raise ValueError(f"Unknown resolution: {resolution}")
+
+        if not parts:
+            return np.empty(0, dtype=np.float64), np.empty(0, dtype=np.float32)
+        # Copies only the selected rows out of the mapped segments
+        return (np.concatenate([p["ts"] for p in parts]),
+                np.concatenate([p[column] for p in parts]))
+
+    def hosts(self) -> list:
+        return sorted(p.name for p in self.root.iterdir() if p.is_dir())
+
+    # -- internals -------------------------------------------------------- #
+
+    def _raw_path(self, host: str, day: int) -> Path:
+        return self.root / _host_dir_name(host) / f"raw-{day}.bin"
+
+    def _roll_host(self, host_dir: Path):
+        # Stay behind the flush window so a bucket is never rolled before its last samples land
+        now = time.time() - 2 * self.flush_interval - 1
+        minute_path = host_dir / "rollup-1m.bin"
+        done = _open_records(minute_path, ROLLUP_DTYPE)
+        since = float(done["ts"][-1]) + 60 if done is not None else 0.0
+        until = (now // 60) * 60  # only complete minutes
+
+        segments = sorted(host_dir.glob("raw-*.bin"), key=lambda p: int(p.stem[4:]))
+        new_rows = []
+        for path in segments:
+            day = int(path.stem[4:])
+            if (day + 1) * 86400 <= since or day * 86400 >= until:
+                continue
+            records = _open_records(path, RAW_DTYPE)
+            if records is None:
+                continue
+            chunk = _slice(records, since, until - 1e-6)
+            if len(chunk):
+                new_rows.append(_aggregate(chunk, 60))
+        if new_rows:
+            with minute_path.open("ab") as f:
+                for rows in new_rows:
+                    f.write(rows.tobytes())
+
+        hour_path = host_dir / "rollup-1h.bin"
+        minutes = _open_records(minute_path, ROLLUP_DTYPE)
+        if minutes is None:
+            return
+        hours = _open_records(hour_path, ROLLUP_DTYPE)
+        since = float(hours["ts"][-1]) + 3600 if hours is not None else 0.0
+        chunk = _slice(minutes, since, (now // 3600) * 3600 - 1e-6)
+        if len(chunk):
+            with hour_path.open("ab") as f:
+                f.write(_aggregate(chunk, 3600, value_fields=True).tobytes())
+
+    def _run(self):
+        last_rollup = 0.0
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+                if time.monotonic() - last_rollup >= self.rollup_interval:
+                    self.build_rollups()
+                    last_rollup = time.monotonic()
+            except Exception as e:
+                logger.error("Metrics history maintenance failed: %s", e)
+
+
+_default_history = None
+_default_history_lock = threading.Lock()
+
+
+def get_metrics_history() -> MetricsHistory:
+    """Return the process-wide history store under logs/metrics."""
+    global _default_history
+    with _default_history_lock:
+        if _default_history is None:
+            _default_history = MetricsHistory()
+        return _default_history
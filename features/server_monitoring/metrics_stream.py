@@ -0,0 +1,145 @@
+# features/server_monitoring/metrics_stream.py
+import logging
+import shlex
+import socket
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from features.server_monitoring.cpu_memory_disk import ResourceProbe, parse_cpu_counters
+from features.ssh_access.ssh_connect import acquire_ssh_lease, release_ssh_client
+
+logger = logging.getLogger("metrics_stream")
+
+# Runs on the remote host for the lifetime of the stream. Everything except
+# df and sleep is a shell builtin, so each tick costs two tiny forks.
+# Line format: M user nice system idle iowait irq softirq steal memtotal memavail l1 l5 l15 disktotal diskused
+_STREAM_SCRIPT = """
+while :; do
+  read -r _ u n s i w q sq st _ < /proc/stat
+  mt=0; ma=; mf=0; mb=0; mc=0
+  while read -r k v _; do
+    case $k in
+      MemTotal:) mt=$v;; MemAvailable:) ma=$v;; MemFree:) mf=$v;; Buffers:) mb=$v;; Cached:) mc=$v;;
+    esac
+  done < /proc/meminfo
+  [ -n "$ma" ] || ma=$((mf + mb + mc))
+  read -r l1 l5 l15 _ < /proc/loadavg
+  set -- $(df -Pk / | tail -n1)
+  echo "M $u $n $s $i $w $q $sq ${st:-0} $mt $ma $l1 $l5 $l15 ${2:-0} ${3:-0}" || exit 0
+  sleep %s
+done
+"""
+
+
+def stream_command(interval: float) -> str:
+    return "sh -c " + shlex.quote(_STREAM_SCRIPT % format(interval, "g"))
+
+
+def parse_stream_line(line: str):
+    """Parse one 'M ...' line into the raw counter dict used by ResourceProbe."""
+    fields = line.split()
+    if len(fields) != 16 or fields[0] != "M":
+        return None
+    try:
+        raw = {
+            "cpu_counters": parse_cpu_counters("cpu " + " ".join(fields[1:9])),
+            "mem_total_kb": int(fields[9]),
+            "mem_available_kb": int(fields[10]),
+            "load": (float(fields[11]), float(fields[12]), float(fields[13])),
+        }
+        if int(fields[14]):
+            raw["disk_total_kb"] = int(fields[14])
+            raw["disk_used_kb"] = int(fields[15])
+        return raw
+    except ValueError:
+        return None
+
+
+class MetricsStream(QThread):
+    """
+    Streaming collector: one long-running remote command on one channel
+    writes a compact sample line every `interval` seconds. Lines are parsed
+    as they arrive and pushed through `sample_ready` and to any callbacks
+    registered with subscribe().
+    """
+
+    sample_ready = pyqtSignal(dict)
+    stream_closed = pyqtSignal(str)
+
+    def __init__(self, ssh_client, interval: float = 1.0):
+        super().__init__()
+        self.ssh_client = ssh_client
+        self.interval = interval
+        self.channel = None
+        self.running = True
+        self._probe = ResourceProbe()
+        self._subscribers = []
+
+    def subscribe(self, callback) -> None:
+        """Call `callback(sample)` from the stream thread for every sample."""
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback) -> None:
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def run(self):
+        reason = "stopped"
+        # Our own pool lease keeps the transport from being evicted as idle
+        # while we stream, even after the Terminal page has let go of it
+        lease = acquire_ssh_lease(self.ssh_client)
+        try:
+            transport = self.ssh_client.get_transport()
+            if not transport or not transport.is_active():
+                raise ConnectionError("SSH transport is inactive.")
+
+            self.channel = transport.open_session()
+            self.channel.exec_command(stream_command(self.interval))
+            self.channel.settimeout(max(1.0, self.interval * 2))
+            logger.info("Metrics stream started (interval %.2fs)", self.interval)
+
+            pending = b""
+            while self.running:
+                try:
+                    chunk = self.channel.recv(4096)
+                except socket.timeout:
+                    continue
+                if not chunk:
+                    reason = "remote collector exited"
+                    break
+
+                pending += chunk
+                *lines, pending = pending.split(b"\n")
+                for line in lines:
+                    self._handle_line(line.decode(errors="ignore"))
+
+        except Exception as e:
+            reason = str(e)
+            logger.error("Metrics stream failed: %s", e)
+        finally:
+            self._close_channel()
+            release_ssh_client(lease)
+            self.stream_closed.emit(reason)
+
+    def _handle_line(self, line: str):
+        raw = parse_stream_line(line)
+        if raw is None:
+            return
+        sample = self._probe.update(raw)
+        self.sample_ready.emit(sample)
+        for callback in list(self._subscribers):
+            try:
+                callback(sample)
+            except Exception as e:
+                logger.error("Metrics subscriber failed: %s", e)
+
+    def _close_channel(self):
+        if self.channel:
+            try:
+                self.channel.close()
+            except Exception:
+                pass
+
+    def stop(self):
+        self.running = False
+        self._close_channel()
@@ -1,78 +1,217 @@
 import sys
+import time
 from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout
-from PyQt5.QtCore import QTimer
-import matplotlib.pyplot as plt
+from PyQt5.QtCore import QObject, QTimer
+import numpy as np
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 
+from features.server_monitoring.resource_sampler import ResourceSampler
+from features.server_monitoring.timeseries import RingBuffer
+
+
+_retiring_samplers = set()
+
+
+def _retire_sampler(sampler):
+    if sampler in _retiring_samplers:
+        _retiring_samplers.discard(sampler)
+        sampler.deleteLater()
+
+
+class RenderScheduler(QObject):
+    """
+    Coalesces redraw requests from every ResourceGraph into display frames.
+
+    Each frame renders dirty graphs in request order until `budget_ms` is
+    spent; the rest stay dirty and go first in the next frame, so dozens of
+    live graphs never hold the GUI thread for more than about one frame.
+    """
+
+    _instance = None
+
+    def __init__(self, budget_ms: float = 16.0, parent=None):
+        super().__init__(parent)
+        self.budget_ms = budget_ms
+        self.frame_ms = 0.0  # duration of the last frame
+        self.deferred = 0  # graphs pushed to a later frame because the budget ran out
+        self._dirty = {}  # insertion-ordered set of graphs waiting for a frame
+        self._timer = QTimer(self)
+        self._timer.setInterval(int(budget_ms))
+        self._timer.timeout.connect(self._frame)
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def request(self, graph) -> None:
+        self._dirty[graph] = None
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def cancel(self, graph) -> None:
+        self._dirty.pop(graph, None)
+
+    def _frame(self):
+        started = time.perf_counter()
+        deadline = started + self.budget_ms / 1000.0
+        while self._dirty:
+            graph = next(iter(self._dirty))
+            del self._dirty[graph]
+            try:
+                graph.render()
+            except RuntimeError:
+                pass  # widget deleted on the C++ side since the request
+            if time.perf_counter() >= deadline and self._dirty:
+                self.deferred += len(self._dirty)
+                break
+        self.frame_ms = (time.perf_counter() - started) * 1000.0
+        if not self._dirty:
+            self._timer.stop()
+
 
 class ResourceGraph(QWidget):
     """
     A QWidget that shows CPU/Memory/Disk usage as a live graph.
+
+    Axes, legends and grid are drawn once and cached as a background; each
+    new sample only updates the line data and blits the three line artists
+    over that background.
     """
-    def __init__(self, fetch_callback, parent=None):
+    def __init__(self, fetch_callback=None, parent=None, series=None,
+                 retention_seconds=6 * 3600, sample_interval=1.0, window=60):
         super().__init__(parent)
-        self.fetch_callback = fetch_callback  # function to fetch resource usage
+        self.fetch_callback = fetch_callback  # function to fetch resource usage; None when samples are pushed
+        self.window = window  # points shown on screen; history is kept for retention_seconds
+
+        # Shared RingBuffer when the caller keeps history across widget rebuilds
+        self.series = series or RingBuffer(max(window, int(retention_seconds / sample_interval)))
 
         layout = QVBoxLayout(self)
 
-        self.figure, self.ax = plt.subplots(3, 1, figsize=(5, 6))
+        # Plain Figure (not pyplot) so closed graphs are not kept alive by the pyplot registry
+        self.figure = Figure(figsize=(5, 6))
+        self.ax = self.figure.subplots(3, 1)
         self.canvas = FigureCanvas(self.figure)
         layout.addWidget(self.canvas)
 
-        self.cpu_data, self.mem_data, self.disk_data = [], [], []
-
-        # Timer for updating graph
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_graph)
-        self.timer.start(3000)  # update every 3 sec
+        # Line artists are created once and only get new data afterwards
+        self.lines = {}
+        for a, metric, label, color in (
+            (self.ax[0], "cpu", "CPU %", None),
+            (self.ax[1], "memory", "Memory %", "orange"),
+            (self.ax[2], "disk", "Disk %", "green"),
+        ):
+            (line,) = a.plot([], [], label=label, color=color, animated=True)
+            self.lines[metric] = line
+            a.set_xlim(0, window - 1)
+            a.set_ylim(0, 100)
+            a.legend(loc="upper right")
+
+        self._background = None
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+        self.scheduler = RenderScheduler.instance()
+
+        # Polling mode: fetch on a worker thread so SSH never blocks the GUI.
+        # Streams call push_sample directly instead.
+        self.sampler = None
+        if self.fetch_callback is not None:
+            self.sampler = ResourceSampler(self.fetch_callback, interval=3.0)  # update every 3 sec
+            self.sampler.sample_ready.connect(self.push_sample)
+            self.sampler.start()
 
     def update_graph(self):
-        stats = self.fetch_callback()
-        if not stats or not stats.get("cpu"):
+        """Fetch and plot one sample synchronously (blocks on fetch_callback)."""
+        self.push_sample(self.fetch_callback())
+
+    @property
+    def dropped_samples(self) -> int:
+        return self.sampler.dropped if self.sampler else 0
+
+    @property
+    def late_samples(self) -> int:
+        return self.sampler.late if self.sampler else 0
+
+    def stop(self):
+        """
+        Stop background sampling without blocking the GUI thread: the sampler
+        is disconnected at once and deletes itself after any in-flight fetch.
+        """
+        self.scheduler.cancel(self)
+        sampler, self.sampler = self.sampler, None
+        if sampler is None:
+            return
+        sampler.disconnect()  # a late sample must not reach this (possibly deleted) graph
+        sampler.stop()
+        _retiring_samplers.add(sampler)  # a running QThread must outlive its last Python reference
+        sampler.finished.connect(lambda: _retire_sampler(sampler))
+        if not sampler.isRunning():
+            _retire_sampler(sampler)
+
+    def push_sample(self, stats):
+        """Add one usage sample (as returned by get_resource_usage) and schedule a redraw."""
+        if not stats or stats.get("cpu") is None:
             return
 
-        try:
-            # CPU
-            cpu_val = float(stats["cpu"].replace("%us", "").strip())
-            self.cpu_data.append(cpu_val)
+        if stats.get("timestamp") is None:
+            stats = dict(stats, timestamp=time.time())
+        self.series.append_sample(stats)
+        self.scheduler.request(self)
 
-            # Memory
-            mem_val = float(stats["memory"])
-            self.mem_data.append(mem_val)
+    def render(self):
+        """Draw the latest window; called by RenderScheduler inside a frame."""
+        if not self.isVisible():
+            return
+        if self._background is None:
+            # First frame or after a resize: full draw, which recaptures the background
+            self.canvas.draw()
+            return
+        self._update_lines()
+        self.canvas.restore_region(self._background)
+        self._draw_lines()
+        self.canvas.blit(self.figure.bbox)
 
-            # Disk
-            disk_val = float(stats["disk"].replace("%", ""))
-            self.disk_data.append(disk_val)
+    def _update_lines(self):
+        for metric, line in self.lines.items():
+            y = self.series.values(metric, self.window)
+            line.set_data(np.arange(self.window - len(y), self.window), y)
 
-            # Keep last 20 values
-            self.cpu_data = self.cpu_data[-20:]
-            self.mem_data = self.mem_data[-20:]
-            self.disk_data = self.disk_data[-20:]
+    def _draw_lines(self):
+        for metric, line in self.lines.items():
+            line.axes.draw_artist(line)
 
-            # Clear and replot
-            for a in self.ax:
-                a.clear()
+    def _on_draw(self, event):
+        # Fired by every full draw (including resizes): cache the static parts
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._update_lines()
+        self._draw_lines()
 
-            self.ax[0].plot(self.cpu_data, label="CPU %")
-            self.ax[1].plot(self.mem_data, label="Memory %", color="orange")
-            self.ax[2].plot(self.disk_data, label="Disk %", color="green")
+    def resizeEvent(self, event):
+        self._background = None
+        super().resizeEvent(event)
 
-            for a in self.ax:
-                a.legend(loc="upper right")
-                a.set_ylim(0, 100)
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.scheduler.request(self)
 
-            self.canvas.draw()
-        except Exception:
-            pass
+    def closeEvent(self, event):
+        self.stop()
+        super().closeEvent(event)
+
+    def hideEvent(self, event):
+        self.scheduler.cancel(self)
+        super().hideEvent(event)
 
 
 # For testing this widget directly
 if __name__ == "__main__":
     def fake_fetch():
         import random
-        return {"cpu": f"{random.randint(1, 99)}%us",
-                "memory": random.randint(1, 99),
-                "disk": f"{random.randint(1, 99)}%"}
+        return {"cpu": random.uniform(1, 99),
+                "memory": random.uniform(1, 99),
+                "disk": random.uniform(1, 99)}
 
     app = QApplication(sys.argv)
     win = ResourceGraph(fetch_callback=fake_fetch)
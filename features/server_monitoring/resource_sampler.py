@@ -0,0 +1,72 @@
+# features/server_monitoring/resource_sampler.py
+import logging
+import threading
+import time
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+logger = logging.getLogger("resource_sampler")
+
+
+class ResourceSampler(QThread):
+    """
+    Calls a blocking fetch function (e.g. get_resource_usage) every
+    `interval` seconds off the GUI thread and delivers results via signals.
+
+    Only one fetch is ever in flight. Ticks that pass while a slow fetch is
+    running are dropped rather than queued, and the schedule realigns to the
+    next tick after the fetch returns. Dropped ticks and fetches that overran
+    their interval are counted and reported through `samples_dropped` and
+    `sample_late`.
+    """
+
+    sample_ready = pyqtSignal(dict)
+    samples_dropped = pyqtSignal(int)  # total dropped ticks so far
+    sample_late = pyqtSignal(float)  # seconds the fetch took when it overran the interval
+    error = pyqtSignal(str)
+
+    def __init__(self, fetch_callback, interval: float = 3.0):
+        super().__init__()
+        self.fetch_callback = fetch_callback
+        self.interval = interval
+        self.dropped = 0
+        self.late = 0
+        self._stop = threading.Event()
+
+    def run(self):
+        next_tick = time.monotonic()
+        while not self._stop.is_set():
+            delay = next_tick - time.monotonic()
+            if delay > 0 and self._stop.wait(delay):
+                break
+
+            started = time.monotonic()
+            try:
+                stats = self.fetch_callback()
+            except Exception as e:
+                logger.error("Resource fetch failed: %s", e)
+                self.error.emit(str(e))
+                stats = None
+            elapsed = time.monotonic() - started
+
+            if self._stop.is_set():
+                break
+            if stats:
+                self.sample_ready.emit(stats)
+
+            if elapsed > self.interval:
+                missed = int(elapsed // self.interval)
+                self.late += 1
+                self.dropped += missed
+                logger.warning("Resource fetch took %.2fs; skipped %d tick(s)", elapsed, missed)
+                self.sample_late.emit(elapsed)
+                self.samples_dropped.emit(self.dropped)
+
+            # Next tick on the original grid, skipping any that already passed
+            next_tick += self.interval
+            now = time.monotonic()
+            if next_tick < now:
+                next_tick += ((now - next_tick) // self.interval + 1) * self.interval
+
+    def stop(self):
+        self._stop.set()
@@ -0,0 +1,39 @@
+# features/server_monitoring/server_overview.py
+import logging
+
+from features.process_logs.log_viewer import LOG_PATHS
+from features.process_logs.running_process import PROCESS_COMMAND, parse_processes
+from features.remote_shell.batch import run_batch
+from features.server_monitoring.cpu_memory_disk import EMPTY_USAGE, PROBE_COMMAND, get_probe, parse_probe_output
+
+logger = logging.getLogger("server_overview")
+
+HOST_COMMAND = "hostname; uptime -p 2>/dev/null || uptime"
+
+
+def get_server_overview(ssh_client, log_lines: int = 50, timeout: float = 15.0) -> dict:
+    """
+    Everything a server summary page shows, from one channel and one round
+    trip: resource usage (as get_resource_usage), the top processes (as
+    get_running_processes), the system log tail (as fetch_logs), hostname
+    and uptime. Parts that failed are None / empty.
+    """
+    commands = [PROBE_COMMAND, PROCESS_COMMAND, HOST_COMMAND]
+    commands += [f"tail -n {int(log_lines)} {log_path}" for log_path in LOG_PATHS]
+    overview = {"usage": dict(EMPTY_USAGE), "processes": [], "logs": None, "hostname": None, "uptime": None}
+    try:
+        probe, processes, host, *logs = run_batch(ssh_client, commands, timeout=timeout)
+    except Exception as e:
+        logger.error("Failed to fetch server overview: %s", e)
+        return overview
+
+    if probe.ok:
+        overview["usage"] = get_probe(ssh_client).update(parse_probe_output(probe.stdout))
+    if processes.ok:
+        overview["processes"] = parse_processes(processes.stdout.splitlines(True))
+    if host.ok:
+        host_lines = host.stdout.splitlines()
+        overview["hostname"] = host_lines[0].strip() if host_lines else None
+        overview["uptime"] = host_lines[1].strip() if len(host_lines) > 1 else None
+    overview["logs"] = next((r.stdout for r in logs if r.ok and not r.stderr), None)
+    return overview
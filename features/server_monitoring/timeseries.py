@@ -0,0 +1,123 @@
+# features/server_monitoring/timeseries.py
+import threading
+
+import numpy as np
+
+METRICS = ("cpu", "memory", "disk", "load_1")
+
+
+class RingBuffer:
+    """
+    Fixed-capacity time series of float32 metric columns with O(1) append.
+
+    Every row is written twice, at slot i and i + capacity, so the newest
+    `size` rows are always one contiguous slice of the backing array and
+    readers get zero-copy views. Views stay valid until the rows they cover
+    are overwritten; copy them if you need to keep them longer.
+    """
+
+    def __init__(self, capacity: int, metrics=METRICS):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = int(capacity)
+        self.metrics = tuple(metrics)
+        self._index = {name: i for i, name in enumerate(self.metrics)}
+        self._ts = np.zeros(2 * self.capacity, dtype=np.float64)
+        self._values = np.full((len(self.metrics), 2 * self.capacity), np.nan, dtype=np.float32)
+        self._head = 0  # next slot to write, in [0, capacity)
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        return self._ts.nbytes + self._values.nbytes
+
+    def append(self, timestamp: float, values) -> None:
+        """Append one row; `values` is a sequence aligned with self.metrics."""
+        i, j = self._head, self._head + self.capacity
+        self._ts[i] = self._ts[j] = timestamp
+        self._values[:, i] = self._values[:, j] = values
+        self._head = (i + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def append_sample(self, sample: dict) -> None:
+        """Append a get_resource_usage() dict; missing metrics are stored as NaN."""
+        row = [np.nan if sample.get(name) is None else sample[name] for name in self.metrics]
+        self.append(sample["timestamp"], row)
+
+    def _bounds(self, last):
+        end = self._head + self.capacity
+        count = self._size if last is None else min(int(last), self._size)
+        return end - count, end
+
+    def timestamps(self, last: int = None) -> np.ndarray:
+        """Read-only view of the newest `last` timestamps (all retained rows by default)."""
+        start, end = self._bounds(last)
+        return _readonly(self._ts[start:end])
+
+    def values(self, metric: str, last: int = None) -> np.ndarray:
+        """Read-only view of the newest `last` values of one metric."""
+        start, end = self._bounds(last)
+        return _readonly(self._values[self._index[metric], start:end])
+
+    def since(self, timestamp: float):
+        """Return (timestamps, {metric: values}) views for rows at or after `timestamp`."""
+        ts = self.timestamps()
+        first = int(np.searchsorted(ts, timestamp, side="left"))
+        start, end = self._bounds(None)
+        return (
+            ts[first:],
+            {name: _readonly(self._values[i, start + first:end]) for name, i in self._index.items()},
+        )
+
+    def latest(self):
+        if not self._size:
+            return None
+        slot = self._head - 1 + self.capacity
+        return {"timestamp": float(self._ts[slot]),
+                **{name: float(self._values[i, slot]) for name, i in self._index.items()}}
+
+
+def _readonly(view: np.ndarray) -> np.ndarray:
+    view.flags.writeable = False
+    return view
+
+
+class TimeSeriesStore:
+    """
+    One RingBuffer per host, sized from a retention period and the
+    expected sample interval (6 hours at 1 Hz is ~1 MB per host).
+    """
+
+    def __init__(self, retention_seconds: float = 6 * 3600, sample_interval: float = 1.0, metrics=METRICS):
+        self.capacity = max(1, int(retention_seconds / sample_interval))
+        self.metrics = tuple(metrics)
+        self._buffers = {}
+        self._lock = threading.Lock()
+
+    def buffer(self, host) -> RingBuffer:
+        with self._lock:
+            buf = self._buffers.get(host)
+            if buf is None:
+                buf = self._buffers[host] = RingBuffer(self.capacity, self.metrics)
+            return buf
+
+    def append(self, host, sample: dict) -> None:
+        if sample and sample.get("timestamp") is not None:
+            self.buffer(host).append_sample(sample)
+
+    def hosts(self) -> list:
+        with self._lock:
+            return list(self._buffers)
+
+    def drop(self, host) -> None:
+        with self._lock:
+            self._buffers.pop(host, None)
+
+    @property
+    def nbytes(self) -> int:
+        with self._lock:
+            return sum(buf.nbytes for buf in self._buffers.values())
@@ -0,0 +1,339 @@
+# features/server_registration/bulk_io.py
+import csv
+import json
+import logging
+import re
+import shlex
+from pathlib import Path
+
+from features.server_registration.server_db import get_server_store
+
+logger = logging.getLogger("bulk_io")
+
+FORMATS = ("csv", "jsonl", "json", "ini")
+FIELDS = ("ip", "port", "username", "password", "key_file", "tags")
+
+# Column / key spellings accepted on import
+_ALIASES = {
+    "host": "ip", "hostname": "ip", "address": "ip", "ansible_host": "ip",
+    "user": "username", "login": "username", "ansible_user": "username",
+    "ansible_port": "port",
+    "ansible_password": "password", "ansible_ssh_pass": "password",
+    "ansible_ssh_private_key_file": "key_file", "group": "tags", "groups": "tags",
+}
+_HOST_RE = re.compile(r"^[A-Za-z0-9_.:%\[\]-]+$")
+_RANGE_RE = re.compile(r"\[(\d+):(\d+)\]")
+
+
+class ImportReport:
+    """What import_servers() did: counts plus the rejected lines and why."""
+
+    def __init__(self):
+        self.read = 0  # host entries found in the file
+        self.added = 0
+        self.duplicates = 0  # repeated in the file or already registered
+        self.invalid = []  # (line number, message)
+
+    def summary(self) -> str:
+        text = f"{self.added} added, {self.duplicates} duplicate(s), {len(self.invalid)} invalid of {self.read} read"
+        if self.invalid:
+            shown = "\n".join(f"line {line}: {message}" for line, message in self.invalid[:20])
+            more = len(self.invalid) - 20
+            text += "\n" + shown + (f"\n… and {more} more" if more > 0 else "")
+        return text
+
+
+def detect_format(path) -> str:
+    suffix = Path(path).suffix.lower()
+    if suffix == ".csv":
+        return "csv"
+    if suffix in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if suffix == ".json":
+        return "json"
+    return "ini"  # Ansible inventories usually have no extension
+
+
+# -- readers: yield (line number, raw dict) ------------------------------------ #
+
+def _split_tags(value):
+    if isinstance(value, (list, tuple)):
+        return [str(tag).strip() for tag in value if str(tag).strip()]
+    return [tag.strip() for tag in re.split(r"[;,|]", str(value or "")) if tag.strip()]
+
+
+def _read_csv(stream):
+    reader = csv.DictReader(stream)
+    for row in reader:
+        yield reader.line_num, row
+
+
+def _read_jsonl(stream):
+    for number, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield number, ValueError(f"invalid JSON: {e}")
+            continue
+        yield number, record if isinstance(record, dict) else ValueError("expected a JSON object")
+
+
+def _read_json(stream):
+    """
+    A JSON document: a list of server objects or {"servers": [...]}, as in
+    the legacy server_store.json. Numbers are entry positions, not lines.
+    """
+    try:
+        data = json.load(stream)
+    except ValueError as e:
+        yield getattr(e, "lineno", 1), ValueError(f"invalid JSON: {e}")
+        return
+    servers = data.get("servers") if isinstance(data, dict) else data
+    if not isinstance(servers, list):
+        yield 1, ValueError('expected a list of servers or {"servers": [...]}')
+        return
+    for number, record in enumerate(servers, 1):
+        yield number, record if isinstance(record, dict) else ValueError("expected a JSON object")
+
+
+def _expand_range(alias: str) -> list:
+    """Ansible host ranges: web[01:03].example.com -> web01, web02, web03 (first range only)."""
+    match = _RANGE_RE.search(alias)
+    if not match:
+        return [alias]
+    first, last = match.group(1), match.group(2)
+    width = len(first) if first.startswith("0") else 0
+    return [alias[:match.start()] + str(n).zfill(width) + alias[match.end():]
+            for n in range(int(first), int(last) + 1)]
+
+
+def _read_ini(stream):
+    """
+    Ansible INI inventory: hosts under [group] become servers tagged with
+    the group (and every group it is a child of); [group:vars] and host
+    variables set ansible_user / ansible_port / ansible_host and friends.
+    """
+    hosts = {}  # alias -> [line number, variables, groups]
+    group_vars = {}
+    children = {}
+    section, kind = "ungrouped", "hosts"
+    for number, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line or line[0] in "#;":
+            continue
+        if line.startswith("[") and line.endswith("]"):
+            section, _, kind = line[1:-1].partition(":")
+            kind = kind or "hosts"
+            continue
+        try:
+            words = shlex.split(line, comments=True)
+        except ValueError as e:
+            yield number, ValueError(f"unparsable line: {e}")
+            continue
+        if not words:
+            continue
+        if kind == "vars":
+            # Unquoted the same way as host variables
+            key, _, value = line.partition("=")
+            try:
+                value = " ".join(shlex.split(value, comments=True))
+            except ValueError as e:
+                yield number, ValueError(f"unparsable line: {e}")
+                continue
+            group_vars.setdefault(section, {})[key.strip()] = value
+        elif kind == "children":
+            children.setdefault(section, set()).add(words[0])
+        elif kind == "hosts":
+            variables = dict(word.split("=", 1) for word in words[1:] if "=" in word)
+            for alias in _expand_range(words[0]):
+                entry = hosts.setdefault(alias, [number, {}, set()])
+                entry[1].update(variables)
+                entry[2].add(section)
+
+    parents = {}
+    for parent, kids in children.items():
+        for kid in kids:
+            parents.setdefault(kid, set()).add(parent)
+
+    def ancestors(group, seen):
+        for parent in parents.get(group, ()):
+            if parent not in seen:
+                seen.add(parent)
+                ancestors(parent, seen)
+        return seen
+
+    base_vars = group_vars.get("all", {})
+    for alias, (number, variables, groups) in hosts.items():
+        all_groups = set(groups)
+        for group in groups:
+            all_groups |= ancestors(group, set())
+        record = dict(base_vars)
+        for group in sorted(all_groups):
+            record.update(group_vars.get(group, {}))
+        record.update(variables)
+        record.setdefault("ansible_host", alias)
+        record["tags"] = sorted(all_groups - {"all", "ungrouped"})
+        yield number, record
+
+
+_READERS = {"csv": _read_csv, "jsonl": _read_jsonl, "json": _read_json, "ini": _read_ini}
+
+
+def _normalise(raw: dict, default_username: str):
+    """Map a raw record onto the server fields; raises ValueError when it is not usable."""
+    record = {}
+    for key, value in raw.items():
+        if key is None:
+            continue
+        key = key.strip().lower()
+        key = _ALIASES.get(key, key)
+        if key in FIELDS and value not in (None, ""):
+            record.setdefault(key, value)
+
+    ip = str(record.get("ip", "")).strip()
+    if not ip:
+        raise ValueError("missing ip")
+    if not _HOST_RE.match(ip):
+        raise ValueError(f"invalid host {ip!r}")
+    username = str(record.get("username") or default_username or "").strip()
+    if not username:
+        raise ValueError("missing username")
+    try:
+        port = int(record.get("port") or 22)
+    except (TypeError, ValueError):
+        raise ValueError(f"invalid port {record.get('port')!r}")
+    if not 0 < port < 65536:
+        raise ValueError(f"port {port} out of range")
+    return {
+        "ip": ip,
+        "port": port,
+        "username": username,
+        "password": str(record.get("password") or ""),
+        "key_file": str(record["key_file"]) if record.get("key_file") else None,
+        "tags": _split_tags(record.get("tags")),
+    }
+
+
+def import_servers(path, fmt: str = None, default_username: str = "", store=None) -> ImportReport:
+    """
+    Import servers from a CSV, JSON Lines, JSON or Ansible INI inventory file.
+
+    The file is validated in one pass; entries repeated within the file
+    are merged (their tags combined) and the rest are written with a single
+    add_many() transaction, so an import costs one commit however many
+    hosts it has. Hosts already registered are counted as duplicates.
+    """
+    store = store or get_server_store()
+    fmt = fmt or detect_format(path)
+    if fmt not in _READERS:
+        raise ValueError(f"Unknown import format {fmt!r}; expected one of {', '.join(FORMATS)}")
+
+    report = ImportReport()
+    servers = {}  # (ip, username) -> server, in file order
+    with open(path, newline="", encoding="utf-8-sig") as stream:
+        for number, raw in _READERS[fmt](stream):
+            report.read += 1
+            try:
+                if isinstance(raw, Exception):
+                    raise raw
+                server = _normalise(raw, default_username)
+            except ValueError as e:
+                report.invalid.append((number, str(e)))
+                continue
+            key = (server["ip"], server["username"])
+            seen = servers.get(key)
+            if seen is None:
+                servers[key] = server
+            else:
+                report.duplicates += 1
+                seen["tags"] = sorted(set(seen["tags"]) | set(server["tags"]))
+
+    report.added = store.add_many(servers.values())
+    report.duplicates += len(servers) - report.added
+    logger.info("Imported %s: %s", path, report.summary().splitlines()[0])
+    return report
+
+
+# -- export ---------------------------------------------------------------------- #
+
+def _write_csv(stream, servers, include_passwords):
+    columns = [f for f in FIELDS if include_passwords or f != "password"]
+    writer = csv.writer(stream)
+    writer.writerow(columns)
+    for server in servers:
+        writer.writerow([";".join(server["tags"]) if f == "tags" else (server[f] if server[f] is not None else "")
+                         for f in columns])
+
+
+def _write_jsonl(stream, servers, include_passwords):
+    for server in servers:
+        record = {f: server[f] for f in FIELDS if server[f] not in (None, "") or f == "tags"}
+        if not include_passwords:
+            record.pop("password", None)
+        stream.write(json.dumps(record) + "\n")
+
+
+def _write_json(stream, servers, include_passwords):
+    """{"servers": [...]}, one server per line, so it reads back like server_store.json."""
+    stream.write('{"servers": [')
+    for number, server in enumerate(servers):
+        record = {f: server[f] for f in FIELDS if server[f] not in (None, "") or f == "tags"}
+        if not include_passwords:
+            record.pop("password", None)
+        stream.write(("," if number else "") + "\n  " + json.dumps(record))
+    stream.write("\n]}\n")
+
+
+def _ini_host_line(server, include_passwords) -> str:
+    parts = [server["ip"], f"ansible_user={shlex.quote(server['username'])}"]
+    if server["port"] != 22:
+        parts.append(f"ansible_port={server['port']}")
+    if server["key_file"]:
+        parts.append(f"ansible_ssh_private_key_file={shlex.quote(server['key_file'])}")
+    if include_passwords and server["password"]:
+        parts.append(f"ansible_password={shlex.quote(server['password'])}")
+    return " ".join(parts) + "\n"
+
+
+def export_servers(path, fmt: str = None, include_passwords: bool = False, store=None) -> int:
+    """
+    Write every registered server to `path` as CSV, JSON Lines, JSON or an Ansible
+    INI inventory (one [group] per tag, untagged hosts under [ungrouped]).
+    Rows are streamed from the database, so memory does not grow with the
+    fleet. Passwords are left out unless include_passwords is set.
+    Returns the number of servers written.
+    """
+    store = store or get_server_store()
+    fmt = fmt or detect_format(path)
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format {fmt!r}; expected one of {', '.join(FORMATS)}")
+
+    count = 0
+
+    def counted(servers):
+        nonlocal count
+        for server in servers:
+            count += 1
+            yield server
+
+    with open(path, "w", newline="", encoding="utf-8") as stream:
+        if fmt == "csv":
+            _write_csv(stream, counted(store.iter_servers()), include_passwords)
+        elif fmt == "jsonl":
+            _write_jsonl(stream, counted(store.iter_servers()), include_passwords)
+        elif fmt == "json":
+            _write_json(stream, counted(store.iter_servers()), include_passwords)
+        else:
+            stream.write("[ungrouped]\n")
+            for server in counted(store.iter_servers()):
+                if not server["tags"]:
+                    stream.write(_ini_host_line(server, include_passwords))
+            for tag in store.tags():
+                stream.write(f"\n[{tag}]\n")
+                for server in store.iter_servers(tag):
+                    stream.write(_ini_host_line(server, include_passwords))
+    logger.info("Exported %d server(s) to %s", count, path)
+    return count
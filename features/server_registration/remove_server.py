@@ -1,27 +1,20 @@
-import json
-from pathlib import Path
+import logging
 
-SERVER_STORE_PATH = Path(__file__).resolve().parent / "server_store.json"
+from features.server_registration.server_db import get_server_store
 
+logger = logging.getLogger("remove_server")
 
-def remove_server(index: int) -> bool:
+
+def remove_server(server_id: int) -> bool:
     """
-    Remove a server by its index in the JSON file.
+    Remove a server by its id in the server store.
     Returns True if removed, False otherwise.
     """
     try:
-        if not SERVER_STORE_PATH.exists():
-            return False
-
-        data = json.loads(SERVER_STORE_PATH.read_text(encoding="utf-8"))
-
-        if "servers" not in data or index < 0 or index >= len(data["servers"]):
-            return False
-
-        removed = data["servers"].pop(index)
-        SERVER_STORE_PATH.write_text(json.dumps(data, indent=2), encoding="utf-8")
-        print(f"Removed server: {removed}")
-        return True
+        removed = get_server_store().remove(server_id)
+        if removed:
+            logger.info("Removed server id %s", server_id)
+        return removed
     except Exception as e:
-        print(f"Error removing server: {e}")
+        logger.error("Error removing server: %s", e)
         return False
@@ -0,0 +1,264 @@
+# features/server_registration/server_db.py
+import json
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+logger = logging.getLogger("server_db")
+
+SERVER_DB_PATH = Path(__file__).resolve().parent / "servers.db"
+LEGACY_JSON_PATH = Path(__file__).resolve().parent / "server_store.json"
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS servers (
+    id        INTEGER PRIMARY KEY,
+    ip        TEXT    NOT NULL,
+    port      INTEGER NOT NULL DEFAULT 22,
+    username  TEXT    NOT NULL,
+    password  TEXT    NOT NULL DEFAULT '',
+    key_file  TEXT,
+    added     REAL    NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS servers_ip_username ON servers (ip, username);
+CREATE INDEX IF NOT EXISTS servers_username ON servers (username);
+CREATE TABLE IF NOT EXISTS server_tags (
+    tag        TEXT    NOT NULL,
+    server_id  INTEGER NOT NULL REFERENCES servers (id) ON DELETE CASCADE,
+    PRIMARY KEY (tag, server_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS server_tags_server ON server_tags (server_id);
+"""
+
+_COLUMNS = "s.id, s.ip, s.port, s.username, s.password, s.key_file"
+_TAGS = "(SELECT group_concat(t.tag, ',') FROM server_tags t WHERE t.server_id = s.id)"
+
+
+def _row_to_server(row) -> dict:
+    server_id, ip, port, username, password, key_file, tags = row
+    return {
+        "id": server_id,
+        "ip": ip,
+        "port": port,
+        "username": username,
+        "password": password,
+        "key_file": key_file,
+        "tags": sorted(tags.split(",")) if tags else [],
+    }
+
+
+class ServerStore:
+    """
+    Registered servers in an SQLite database.
+
+    Servers have stable integer ids, (ip, username) is unique through an
+    index, and tags live in their own indexed table, so lookups and the
+    duplicate check do not scan. Every change is a single transaction in
+    WAL mode, so concurrent writers (several windows, the poller) cannot
+    overwrite each other and readers never see a half-written store.
+    Connections are per thread; the first open imports server_store.json
+    once and renames it to server_store.json.migrated.
+    """
+
+    def __init__(self, path: Path = SERVER_DB_PATH, legacy_json: Path = LEGACY_JSON_PATH):
+        self.path = Path(path)
+        self.legacy_json = Path(legacy_json) if legacy_json else None
+        self._local = threading.local()
+        self._init_lock = threading.Lock()
+        self._initialised = False
+        self._conn()  # create the schema and migrate up front
+        # PRAGMA data_version on a connection that never writes changes with
+        # every commit made through any other connection, ours included
+        self._version_conn = sqlite3.connect(str(self.path), timeout=10.0, isolation_level=None,
+                                             check_same_thread=False)
+        self._version_lock = threading.Lock()
+
+    # -- connection ------------------------------------------------------- #
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=10.0, isolation_level=None)
+            conn.execute("PRAGMA busy_timeout = 10000")
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("PRAGMA foreign_keys = ON")
+            self._local.conn = conn
+            with self._init_lock:
+                if not self._initialised:
+                    self._initialise(conn)
+                    self._initialised = True
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        """BEGIN IMMEDIATE: take the write lock up front so writers queue instead of deadlocking."""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _initialise(self, conn):
+        conn.executescript(SCHEMA)
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < SCHEMA_VERSION:
+            with self._transaction():
+                if self.legacy_json is not None:
+                    self._migrate_json(conn)
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _migrate_json(self, conn):
+        if not self.legacy_json.exists():
+            return
+        try:
+            data = json.loads(self.legacy_json.read_text(encoding="utf-8"))
+        except Exception as e:
+            logger.error("Could not read %s for migration: %s", self.legacy_json, e)
+            return
+        servers = data.get("servers", []) if isinstance(data, dict) else data
+        migrated = 0
+        for server in servers if isinstance(servers, list) else []:
+            if not isinstance(server, dict) or not server.get("ip") or not server.get("username"):
+                continue
+            server_id = self._insert(conn, server.get("ip"), server.get("username"), server.get("password", ""),
+                                     server.get("port", 22), server.get("key_file"), server.get("tags", ()))
+            migrated += server_id is not None
+        self.legacy_json.rename(self.legacy_json.with_name(self.legacy_json.name + ".migrated"))
+        logger.info("Migrated %d server(s) from %s", migrated, self.legacy_json)
+
+    @staticmethod
+    def _insert(conn, ip, username, password, port, key_file, tags):
+        cursor = conn.execute(
+            "INSERT OR IGNORE INTO servers (ip, port, username, password, key_file, added) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (ip, int(port or 22), username, password or "", key_file, time.time()),
+        )
+        if not cursor.rowcount:
+            return None  # (ip, username) already registered
+        server_id = cursor.lastrowid
+        if tags:
+            conn.executemany("INSERT OR IGNORE INTO server_tags (tag, server_id) VALUES (?, ?)",
+                             [(tag, server_id) for tag in tags])
+        return server_id
+
+    # -- queries ---------------------------------------------------------- #
+
+    def list_servers(self, tag: str = None) -> list:
+        """Every server (or those carrying `tag`) as dicts, in registration order."""
+        sql = f"SELECT {_COLUMNS}, {_TAGS} FROM servers s"
+        params = ()
+        if tag is not None:
+            sql += " WHERE s.id IN (SELECT server_id FROM server_tags WHERE tag = ?)"
+            params = (tag,)
+        return [_row_to_server(row) for row in self._conn().execute(sql + " ORDER BY s.id", params)]
+
+    def iter_servers(self, tag: str = None, batch_size: int = 1000):
+        """Like list_servers() but yields servers from a cursor, for exports of any size."""
+        sql = f"SELECT {_COLUMNS}, {_TAGS} FROM servers s"
+        params = ()
+        if tag is not None:
+            sql += " WHERE s.id IN (SELECT server_id FROM server_tags WHERE tag = ?)"
+            params = (tag,)
+        cursor = self._conn().execute(sql + " ORDER BY s.id", params)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield _row_to_server(row)
+
+    def get(self, server_id: int):
+        row = self._conn().execute(f"SELECT {_COLUMNS}, {_TAGS} FROM servers s WHERE s.id = ?",
+                                   (server_id,)).fetchone()
+        return _row_to_server(row) if row else None
+
+    def find(self, ip: str, username: str):
+        row = self._conn().execute(f"SELECT {_COLUMNS}, {_TAGS} FROM servers s WHERE s.ip = ? AND s.username = ?",
+                                   (ip, username)).fetchone()
+        return _row_to_server(row) if row else None
+
+    def version(self) -> int:
+        """
+        Cheap change token: differs after any commit, whether made through
+        this store, another ServerStore or another process. No table is read.
+        """
+        with self._version_lock:
+            return self._version_conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def count(self) -> int:
+        return self._conn().execute("SELECT count(*) FROM servers").fetchone()[0]
+
+    def tags(self) -> list:
+        return [row[0] for row in self._conn().execute("SELECT DISTINCT tag FROM server_tags ORDER BY tag")]
+
+    # -- changes ---------------------------------------------------------- #
+
+    def add(self, ip: str, username: str, password: str = "", port: int = 22,
+            key_file: str = None, tags=()):
+        """Register a server; returns its id, or None if (ip, username) already exists."""
+        with self._transaction() as conn:
+            return self._insert(conn, ip, username, password, port, key_file, tags)
+
+    def add_many(self, servers) -> int:
+        """
+        Register many servers (dicts with ip, username and optionally
+        password, port, key_file, tags) in one transaction. Already
+        registered (ip, username) pairs are skipped but gain the given tags.
+        Returns how many servers were added.
+        """
+        now = time.time()
+        rows = []
+        tag_rows = []
+        for server in servers:
+            rows.append((server["ip"], int(server.get("port") or 22), server["username"],
+                         server.get("password") or "", server.get("key_file"), now))
+            tag_rows.extend((tag, server["ip"], server["username"]) for tag in server.get("tags", ()))
+        with self._transaction() as conn:
+            added = conn.executemany(
+                "INSERT OR IGNORE INTO servers (ip, port, username, password, key_file, added) "
+                "VALUES (?, ?, ?, ?, ?, ?)", rows).rowcount
+            if tag_rows:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO server_tags (tag, server_id) "
+                    "SELECT ?, id FROM servers WHERE ip = ? AND username = ?", tag_rows)
+        return max(0, added)
+
+    def remove(self, server_id: int) -> bool:
+        """Remove a server (and its tags) by id."""
+        with self._transaction() as conn:
+            return conn.execute("DELETE FROM servers WHERE id = ?", (server_id,)).rowcount > 0
+
+    def set_tags(self, server_id: int, tags) -> None:
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM server_tags WHERE server_id = ?", (server_id,))
+            conn.executemany("INSERT OR IGNORE INTO server_tags (tag, server_id) VALUES (?, ?)",
+                             [(tag, server_id) for tag in tags])
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_server_store() -> ServerStore:
+    """Return the process-wide server store, opening (and if needed migrating) it on first use."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ServerStore()
+        return _store
@@ -0,0 +1,92 @@
+# features/server_registration/server_registry.py
+import logging
+import threading
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from features.server_registration.server_db import get_server_store
+
+logger = logging.getLogger("server_registry")
+
+
+class ServerRegistry(QObject):
+    """
+    Process-wide, in-memory copy of the registered servers.
+
+    The list is read from the ServerStore once and then served from memory;
+    it is re-read only when the store's change token (PRAGMA data_version)
+    moves, which catches writes from this process and from other ones. Every
+    view connects to `servers_changed` instead of loading the store itself,
+    so a server added on one page shows up on all of them.
+
+    servers() may be called from any thread; the returned list is shared
+    and must not be modified. Changes are noticed on access, by check()
+    (call it after writing to push the signal at once) and, once watch()
+    is running, by a timer on the GUI thread.
+    """
+
+    servers_changed = pyqtSignal()
+
+    def __init__(self, store=None, parent=None):
+        super().__init__(parent)
+        self.store = store or get_server_store()
+        self._lock = threading.Lock()
+        self._servers = None
+        self._by_id = {}
+        self._version = None
+        self._timer = None
+
+    def servers(self) -> list:
+        """Every registered server as dicts (see ServerStore.list_servers)."""
+        self.check()
+        return self._servers
+
+    def get(self, server_id: int):
+        self.check()
+        return self._by_id.get(server_id)
+
+    def check(self) -> bool:
+        """Reload if the store changed since the last load; emits servers_changed and returns True if so."""
+        with self._lock:
+            try:
+                version = self.store.version()
+                if version == self._version and self._servers is not None:
+                    return False
+                servers = self.store.list_servers()
+            except Exception as e:
+                logger.error("Failed to load server store: %s", e)
+                if self._servers is None:
+                    self._servers = []
+                return False
+            first_load = self._servers is None
+            self._servers = servers
+            self._by_id = {server["id"]: server for server in servers}
+            self._version = version
+        if not first_load:
+            logger.info("Server registry reloaded: %d server(s)", len(servers))
+            self.servers_changed.emit()
+        return not first_load
+
+    def watch(self, interval_ms: int = 2000) -> None:
+        """Poll the change token every `interval_ms` so edits made elsewhere are pushed to the views."""
+        if self._timer is None:
+            self._timer = QTimer(self)
+            self._timer.timeout.connect(self.check)
+        self._timer.start(interval_ms)
+
+    def stop_watching(self) -> None:
+        if self._timer is not None:
+            self._timer.stop()
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_server_registry() -> ServerRegistry:
+    """Return the process-wide server registry (create it on the GUI thread first)."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ServerRegistry()
+        return _registry
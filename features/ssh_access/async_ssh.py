@@ -0,0 +1,368 @@
+# features/ssh_access/async_ssh.py
+import asyncio
+import concurrent.futures
+import logging
+import threading
+import time
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from features.process_logs.log_viewer import LOG_PATHS
+from features.process_logs.running_process import PROCESS_COMMAND, parse_processes
+from features.server_monitoring.cpu_memory_disk import (
+    EMPTY_USAGE, PROBE_COMMAND, get_probe, parse_probe_output
+)
+from features.ssh_access.connection_pool import get_connection_pool
+
+logger = logging.getLogger("async_ssh")
+
+
+class ExecResult:
+    """Outcome of AsyncSSHSession.exec()."""
+
+    __slots__ = ("command", "exit_status", "stdout", "stderr", "duration")
+
+    def __init__(self, command, exit_status, stdout, stderr, duration):
+        self.command = command
+        self.exit_status = exit_status
+        self.stdout = stdout
+        self.stderr = stderr
+        self.duration = duration
+
+    @property
+    def ok(self) -> bool:
+        return self.exit_status == 0
+
+    def __repr__(self):
+        return f"ExecResult({self.command!r}, exit_status={self.exit_status}, {self.duration * 1000:.0f} ms)"
+
+
+class AsyncChannel:
+    """
+    A running remote command whose output is read on the event loop.
+
+    Paramiko exposes a pipe per channel (channel.fileno()) that is readable
+    while stdout, stderr or EOF is pending; loop.add_reader() on it means a
+    waiting command costs a callback registration, not a thread.
+    """
+
+    HIGH_WATERMARK = 4 * 1024 * 1024  # queued bytes before reading pauses
+
+    def __init__(self, channel, loop):
+        self.channel = channel
+        self.loop = loop
+        self.exit_status = None
+        self._queue = asyncio.Queue()
+        self._queued = 0
+        self._reading = True
+        self._done = loop.create_future()
+        self._fd = channel.fileno()
+        loop.add_reader(self._fd, self._on_readable)
+
+    def _on_readable(self):
+        channel = self.channel
+        try:
+            while channel.recv_ready():
+                data = channel.recv(65536)
+                if not data:
+                    break
+                self._put("stdout", data)
+            while channel.recv_stderr_ready():
+                data = channel.recv_stderr(65536)
+                if not data:
+                    break
+                self._put("stderr", data)
+            if self._queued > self.HIGH_WATERMARK:
+                # A slow consumer: stop reading, paramiko's window fills and the sender stalls
+                self.loop.remove_reader(self._fd)
+                self._reading = False
+                return
+            if channel.eof_received and not channel.recv_ready() and not channel.recv_stderr_ready():
+                self._finish()
+        except Exception as e:
+            self._finish(e)
+
+    def _put(self, name, data):
+        self._queued += len(data)
+        self._queue.put_nowait((name, data))
+
+    def _finish(self, error=None):
+        if self._done.done():
+            return
+        self.loop.remove_reader(self._fd)
+        self._queue.put_nowait(None)
+        if error is not None:
+            self._done.set_exception(error)
+        else:
+            self._done.set_result(None)
+
+    async def __aiter__(self):
+        """Yield ("stdout" | "stderr", bytes) chunks until the remote side closes."""
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                break
+            self._queued -= len(item[1])
+            if not self._reading and self._queued <= self.HIGH_WATERMARK // 4 and not self._done.done():
+                self._reading = True
+                self.loop.add_reader(self._fd, self._on_readable)
+            yield item
+        await self._done
+
+    async def wait(self) -> int:
+        """Wait for EOF and the exit status (which follows EOF on the wire); -1 if the channel closed without one."""
+        await self._done
+        if not self.channel.exit_status_ready():
+            # paramiko sets status_event on exit-status or close; block on it off the loop
+            await self.loop.run_in_executor(AsyncSSHSession._executor, self.channel.status_event.wait)
+        self.exit_status = self.channel.recv_exit_status()
+        return self.exit_status
+
+    def send(self, data) -> None:
+        self.channel.sendall(data)
+
+    def close(self) -> None:
+        """Stop reading and close the channel (the remote command gets a hangup)."""
+        if not self._done.done():
+            self.loop.remove_reader(self._fd)
+            self._queue.put_nowait(None)
+            self._done.cancel()
+        self.channel.close()
+
+
+class AsyncSSHSession:
+    """
+    Awaitable operations on one pooled SSH connection.
+
+    The transport comes from the shared connection pool, so the session
+    shares it with the Qt pages. Blocking paramiko steps (the handshake,
+    and the channel-open / exec request round trip) run on a small bounded
+    executor; everything after that (waiting for and reading output) runs
+    on the event loop, so thousands of in-flight commands are coroutines.
+    """
+
+    _executor = concurrent.futures.ThreadPoolExecutor(max_workers=32, thread_name_prefix="async-ssh")
+
+    def __init__(self, client, pool=None):
+        self.client = client
+        self._pool = pool
+
+    @classmethod
+    async def _run_blocking(cls, fn, timeout, discard):
+        """
+        Run fn() on the executor and await it for at most `timeout` seconds.
+        The executor thread cannot be interrupted, so if we stop waiting
+        (timeout or cancellation) its eventual result is handed to
+        discard() instead of being leaked.
+        """
+        job = cls._executor.submit(fn)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(job), timeout)
+        except BaseException:
+            def cleanup(done):
+                if not done.cancelled() and done.exception() is None:
+                    try:
+                        discard(done.result())
+                    except Exception as e:
+                        logger.error("Cleanup of abandoned SSH operation failed: %s", e)
+            job.add_done_callback(cleanup)
+            raise
+
+    @classmethod
+    async def connect(cls, host: str, port: int = 22, username: str = "", password: str = "",
+                      key_file: str = None, timeout: float = 15.0, pool=None) -> "AsyncSSHSession":
+        pool = pool or get_connection_pool()
+        client = await cls._run_blocking(
+            lambda: pool.acquire(host, port=port, username=username,
+                                 password=password, key_file=key_file, timeout=timeout),
+            timeout, pool.release)
+        return cls(client, pool)
+
+    @classmethod
+    def from_client(cls, ssh_client) -> "AsyncSSHSession":
+        """Wrap an already connected client; close() then leaves it alone."""
+        return cls(ssh_client)
+
+    async def start(self, command: str, pty: bool = False, timeout: float = 15.0) -> AsyncChannel:
+        """Open a channel and start `command` on it."""
+        loop = asyncio.get_running_loop()
+
+        def open_and_exec():
+            transport = self.client.get_transport()
+            if not transport or not transport.is_active():
+                raise ConnectionError("SSH transport is inactive.")
+            channel = transport.open_session(timeout=timeout)
+            if pty:
+                channel.get_pty(term="xterm")
+            channel.exec_command(command)
+            return channel
+
+        channel = await self._run_blocking(open_and_exec, timeout, lambda chan: chan.close())
+        return AsyncChannel(channel, loop)
+
+    async def exec(self, command: str, timeout: float = 60.0, pty: bool = False) -> ExecResult:
+        """
+        Run `command` to completion and collect its output. `timeout` covers
+        the whole call, channel open included. On timeout or cancellation
+        the channel is closed and the exception propagates.
+        """
+        started = time.monotonic()
+        deadline = started + timeout
+        chan = await self.start(command, pty=pty, timeout=timeout)
+        stdout, stderr = [], []
+        try:
+            async def collect():
+                async for name, data in chan:
+                    (stdout if name == "stdout" else stderr).append(data)
+                return await chan.wait()
+
+            exit_status = await asyncio.wait_for(collect(), max(0.0, deadline - time.monotonic()))
+        except BaseException:
+            chan.close()
+            raise
+        chan.channel.close()
+        return ExecResult(command, exit_status,
+                          b"".join(stdout).decode(errors="ignore"),
+                          b"".join(stderr).decode(errors="ignore"),
+                          time.monotonic() - started)
+
+    async def stream(self, command: str, timeout: float = None, pty: bool = False):
+        """
+        Async iterator of ("stdout" | "stderr", text) as the command produces
+        output. Leaving the loop early (break, cancellation or `timeout`)
+        closes the channel.
+        """
+        chan = await self.start(command, pty=pty)
+        deadline = None if timeout is None else asyncio.get_running_loop().time() + timeout
+        iterator = chan.__aiter__()
+        try:
+            while True:
+                remaining = None if deadline is None else deadline - asyncio.get_running_loop().time()
+                if remaining is not None and remaining <= 0:
+                    raise asyncio.TimeoutError()
+                try:
+                    name, data = await asyncio.wait_for(iterator.__anext__(), remaining)
+                except StopAsyncIteration:
+                    break
+                yield name, data.decode(errors="ignore")
+        finally:
+            chan.close()
+
+    async def close(self) -> None:
+        if self._pool is not None and self.client is not None:
+            self._pool.release(self.client)
+        self.client = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
+# -- feature operations ---------------------------------------------------- #
+
+async def get_resource_usage_async(session: AsyncSSHSession, timeout: float = 10.0) -> dict:
+    """Awaitable get_resource_usage(); shares CPU-delta state with the blocking version."""
+    try:
+        result = await session.exec(PROBE_COMMAND, timeout=timeout)
+        return get_probe(session.client).update(parse_probe_output(result.stdout))
+    except Exception as e:
+        logger.error("Failed to fetch resource usage: %s", e)
+        return dict(EMPTY_USAGE)
+
+
+async def fetch_logs_async(session: AsyncSSHSession, lines: int = 50, timeout: float = 15.0) -> str:
+    """Awaitable fetch_logs()."""
+    for log_path in LOG_PATHS:
+        try:
+            result = await session.exec(f"tail -n {int(lines)} {log_path}", timeout=timeout)
+            if not result.stderr:
+                return result.stdout
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            continue
+    return "❌ Unable to fetch logs from known paths (/var/log/syslog, /var/log/messages)."
+
+
+async def get_running_processes_async(session: AsyncSSHSession, timeout: float = 15.0) -> list:
+    """Awaitable get_running_processes()."""
+    try:
+        result = await session.exec(PROCESS_COMMAND, timeout=timeout)
+        return parse_processes(result.stdout.splitlines(True))
+    except Exception as e:
+        logger.error("Failed to fetch running processes: %s", e)
+        return []
+
+
+async def execute_command_async(session: AsyncSSHSession, command: str, timeout: float = 60.0) -> ExecResult:
+    """Awaitable execute_command(); returns the full ExecResult."""
+    return await session.exec(command, timeout=timeout)
+
+
+# -- event loop thread and Qt bridge --------------------------------------- #
+
+class AsyncRunner:
+    """
+    Runs an asyncio event loop on a daemon thread next to the Qt event loop.
+    submit() schedules a coroutine from any thread and returns a
+    concurrent.futures.Future; AsyncTask turns that into Qt signals.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name="async-ssh-loop", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro) -> concurrent.futures.Future:
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def stop(self) -> None:
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=5)
+
+
+_runner = None
+_runner_lock = threading.Lock()
+
+
+def get_async_runner() -> AsyncRunner:
+    """Return the process-wide asyncio loop thread, starting it on first use."""
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            _runner = AsyncRunner()
+        return _runner
+
+
+class AsyncTask(QObject):
+    """
+    Runs a coroutine on the shared loop and reports back on the Qt side:
+    `finished(result)` or `failed(message)` are delivered to the thread this
+    object lives in (normally the GUI thread). cancel() cancels the coroutine.
+    """
+
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, coro, parent=None):
+        super().__init__(parent)
+        self.future = get_async_runner().submit(coro)
+        self.future.add_done_callback(self._on_done)  # runs on the loop thread; signals are queued
+
+    def _on_done(self, future):
+        if future.cancelled():
+            self.failed.emit("Cancelled")
+        elif future.exception() is not None:
+            error = future.exception()
+            self.failed.emit(str(error) or type(error).__name__)
+        else:
+            self.finished.emit(future.result())
+
+    def cancel(self) -> None:
+        self.future.cancel()
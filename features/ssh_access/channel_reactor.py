@@ -0,0 +1,208 @@
+# features/ssh_access/channel_reactor.py
+import logging
+import selectors
+import socket
+import threading
+from collections import deque
+
+logger = logging.getLogger("channel_reactor")
+
+
+class ChannelSession:
+    """Handle returned by ChannelReactor.register(); callbacks run on the reactor thread."""
+
+    __slots__ = ("channel", "fd", "on_data", "on_close", "on_stderr", "paused", "closed")
+
+    def __init__(self, channel, on_data, on_close, on_stderr):
+        self.channel = channel
+        self.fd = None
+        self.on_data = on_data
+        self.on_close = on_close
+        self.on_stderr = on_stderr
+        self.paused = False
+        self.closed = False
+
+
+class ChannelReactor:
+    """
+    One I/O thread for every open paramiko channel.
+
+    Channels are watched through the pipe paramiko exposes via
+    channel.fileno(), which becomes readable when data, stderr or EOF
+    arrives, so the thread sleeps in select() until a session has
+    something to read and costs nothing while all sessions are idle.
+    Each chunk is passed to that session's on_data callback.
+
+    Selector changes made from other threads are queued and applied on
+    the reactor thread, after a wake-up byte interrupts select().
+    Writes do not go through the reactor: callers send on the channel
+    directly.
+    """
+
+    def __init__(self, chunk_size: int = 65536, read_budget: int = 262144):
+        self.chunk_size = chunk_size
+        self.read_budget = read_budget  # bytes per session per wake-up, for fairness
+        self._selector = selectors.DefaultSelector()
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ, None)
+        self._calls = deque()
+        self._sessions = {}  # channel -> ChannelSession
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="ssh-channel-reactor", daemon=True)
+        self._thread.start()
+
+    # -- public API (any thread) ------------------------------------------ #
+
+    def register(self, channel, on_data, on_close=None, on_stderr=None) -> ChannelSession:
+        """
+        Start dispatching `channel` output: on_data(bytes) for stdout,
+        on_stderr(bytes) for stderr (defaults to on_data), on_close() once
+        when the remote side closes or unregister(close=True) is called.
+        """
+        session = ChannelSession(channel, on_data, on_close, on_stderr or on_data)
+        session.fd = channel.fileno()
+        with self._lock:
+            self._sessions[channel] = session
+        self._call(self._add, session)
+        return session
+
+    def unregister(self, channel, close: bool = False) -> None:
+        """
+        Stop dispatching `channel`. With close=True the channel is closed on
+        the reactor thread after it has left the selector; always prefer that
+        over channel.close(), which also closes the pipe being watched.
+        """
+        with self._lock:
+            session = self._sessions.pop(channel, None)
+        if session is not None:
+            self._call(self._remove, session, close)
+        elif close:
+            channel.close()
+
+    def pause(self, channel) -> None:
+        """Stop reading `channel`; paramiko's window fills and the remote side stalls."""
+        session = self._sessions.get(channel)
+        if session is not None:
+            self._call(self._set_paused, session, True)
+
+    def resume(self, channel) -> None:
+        session = self._sessions.get(channel)
+        if session is not None:
+            self._call(self._set_paused, session, False)
+
+    def session_count(self) -> int:
+        return len(self._sessions)
+
+    # -- reactor thread --------------------------------------------------- #
+
+    def _call(self, fn, *args):
+        self._calls.append((fn, args))
+        try:
+            self._wake_w.send(b"\0")
+        except (BlockingIOError, OSError):
+            pass  # a wake-up is already pending
+
+    def _add(self, session):
+        if not session.closed and not session.paused:
+            self._selector.register(session.fd, selectors.EVENT_READ, session)
+        # Data that arrived before registration leaves the pipe set, so the
+        # next select() sees it; nothing to drain here
+
+    def _remove(self, session, close):
+        self._detach(session)
+        session.closed = True
+        if close:
+            try:
+                session.channel.close()
+            except Exception:
+                pass
+            self._notify_close(session)
+
+    def _set_paused(self, session, paused):
+        if session.closed or session.paused == paused:
+            return
+        session.paused = paused
+        if paused:
+            self._detach(session)
+        else:
+            self._selector.register(session.fd, selectors.EVENT_READ, session)
+
+    def _detach(self, session):
+        try:
+            self._selector.unregister(session.fd)
+        except (KeyError, ValueError):
+            pass
+
+    def _notify_close(self, session):
+        if session.on_close:
+            try:
+                session.on_close()
+            except Exception:
+                logger.exception("Channel close callback failed")
+
+    def _read(self, session):
+        channel = session.channel
+        budget = self.read_budget
+        try:
+            while budget > 0 and channel.recv_ready():
+                data = channel.recv(self.chunk_size)
+                if not data:
+                    break
+                budget -= len(data)
+                session.on_data(data)
+            while budget > 0 and channel.recv_stderr_ready():
+                data = channel.recv_stderr(self.chunk_size)
+                if not data:
+                    break
+                budget -= len(data)
+                session.on_stderr(data)
+            finished = channel.closed or (
+                channel.eof_received and not channel.recv_ready() and not channel.recv_stderr_ready()
+            )
+        except Exception as e:
+            logger.error("Reading channel failed: %s", e)
+            finished = True
+
+        if finished:
+            with self._lock:
+                self._sessions.pop(channel, None)
+            self._remove(session, close=True)
+
+    def _run(self):
+        while True:
+            try:
+                events = self._selector.select()
+            except Exception as e:
+                logger.error("Channel reactor select failed: %s", e)
+                continue
+            for key, _ in events:
+                session = key.data
+                if session is None:
+                    try:
+                        while self._wake_r.recv(4096):
+                            pass
+                    except (BlockingIOError, OSError):
+                        pass
+                    while self._calls:
+                        fn, args = self._calls.popleft()
+                        try:
+                            fn(*args)
+                        except Exception:
+                            logger.exception("Channel reactor call failed")
+                elif not session.closed and not session.paused:
+                    self._read(session)
+
+
+_reactor = None
+_reactor_lock = threading.Lock()
+
+
+def get_channel_reactor() -> ChannelReactor:
+    """Return the process-wide reactor, starting its thread on first use."""
+    global _reactor
+    with _reactor_lock:
+        if _reactor is None:
+            _reactor = ChannelReactor()
+        return _reactor
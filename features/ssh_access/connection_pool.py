@@ -0,0 +1,302 @@
+# features/ssh_access/connection_pool.py
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+import paramiko
+
+logger = logging.getLogger("connection_pool")
+
+
+class PoolExhaustedError(RuntimeError):
+    """Raised when every pooled connection is in use and the cap is reached."""
+
+
+class _PooledConnection:
+    """
+    One authenticated SSHClient plus the bookkeeping the pool needs.
+    """
+
+    __slots__ = ("key", "client", "refcount", "last_used", "lock")
+
+    def __init__(self, key):
+        self.key = key
+        self.client = None
+        self.refcount = 0
+        self.last_used = time.monotonic()
+        self.lock = threading.Lock()  # serialises the connect handshake per key
+
+    def is_alive(self) -> bool:
+        if self.client is None:
+            return False
+        transport = self.client.get_transport()
+        return bool(transport and transport.is_active())
+
+
+class _Lease:
+    """Outstanding acquire()s of one client; outlives a reconnect that replaces it."""
+
+    __slots__ = ("client", "entry", "count")
+
+    def __init__(self, client, entry):
+        self.client = client
+        self.entry = entry
+        self.count = 0
+
+
+class SSHConnectionPool:
+    """
+    Pool of SSH connections keyed by (host, port, username) and the
+    credentials they were opened with, so a caller only ever gets back a
+    transport authenticated with the password / key it passed itself.
+
+    Every consumer of the same key shares one paramiko Transport; Terminal,
+    Monitoring, Logs and Shell Exec each open their own channel on it through
+    the usual SSHClient API (exec_command, invoke_shell, get_transport()).
+    Idle connections are evicted after `idle_timeout` seconds, keepalives are
+    sent every `keepalive_interval` seconds and at most `max_connections`
+    transports are held open at once.
+    """
+
+    def __init__(self, max_connections: int = 64, idle_timeout: float = 300.0,
+                 keepalive_interval: int = 30, connect_timeout: float = 10.0):
+        self.max_connections = max_connections
+        self.idle_timeout = idle_timeout
+        self.keepalive_interval = keepalive_interval
+        self.connect_timeout = connect_timeout
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> _PooledConnection, LRU order
+        self._by_client = {}  # id(client) -> _PooledConnection, current clients only
+        self._leases = {}  # id(client) -> _Lease, until every lease on it is released
+        self._janitor = None
+        self._closed = threading.Event()
+
+    @staticmethod
+    def make_key(host: str, port: int = 22, username: str = "", password: str = "", key_file: str = None):
+        # Only a digest of the credentials is kept in the key
+        auth = hashlib.sha256(f"{password or ''}\0{key_file or ''}".encode()).hexdigest()[:16]
+        return (host, int(port or 22), username, auth)
+
+    def acquire(self, host: str, port: int = 22, username: str = "",
+                password: str = "", key_file: str = None, timeout: float = None):
+        """
+        Return a connected SSHClient for (host, port, username) and these
+        credentials, reusing the pooled transport when it is still alive.
+        Each acquire must be paired with a release(); the connection stays
+        pooled after the last release until it goes idle.
+        """
+        key = self.make_key(host, port, username, password, key_file)
+        entry = self._reserve(key)
+        try:
+            with entry.lock:
+                if not entry.is_alive():
+                    self._discard_client(entry)
+                    client = self._connect(host, key[1], username, password, key_file,
+                                           timeout or self.connect_timeout)
+                    with self._lock:
+                        entry.client = client
+                        self._by_client[id(client)] = entry
+                client = entry.client
+                with self._lock:
+                    self._add_lease_locked(client, entry)
+            return client
+        except Exception:
+            self._unreserve(entry)
+            raise
+
+    def lease(self, client) -> bool:
+        """
+        Take another lease on a client this pool handed out, if it is still
+        the live pooled transport. Returns False otherwise (nothing to release).
+        """
+        with self._lock:
+            entry = self._by_client.get(id(client))
+            if entry is None or entry.client is not client or self._entries.get(entry.key) is not entry \
+                    or not entry.is_alive():
+                return False
+            self._entries.move_to_end(entry.key)
+            entry.refcount += 1
+            entry.last_used = time.monotonic()
+            self._add_lease_locked(client, entry)
+        return True
+
+    def release(self, client) -> None:
+        """
+        Give back a client obtained from acquire() or lease(). Works after
+        the client was replaced by a reconnect or closed: the lease still
+        counts against the entry it was taken on.
+        """
+        if client is None:
+            return
+        with self._lock:
+            lease = self._leases.get(id(client))
+            if lease is None or lease.client is not client:
+                return
+            lease.count -= 1
+            if not lease.count:
+                del self._leases[id(client)]
+            lease.entry.refcount = max(0, lease.entry.refcount - 1)
+            lease.entry.last_used = time.monotonic()
+
+    def get(self, host: str, port: int = 22, username: str = "", password: str = "", key_file: str = None):
+        """Return the pooled client for these credentials if it is connected, without taking a lease."""
+        with self._lock:
+            entry = self._entries.get(self.make_key(host, port, username, password, key_file))
+            if entry and entry.is_alive():
+                entry.last_used = time.monotonic()
+                return entry.client
+        return None
+
+    def evict_idle(self) -> int:
+        """Close connections that are unused past idle_timeout or already dead."""
+        now = time.monotonic()
+        victims = []
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if entry.refcount:
+                    continue
+                if not entry.is_alive() or now - entry.last_used >= self.idle_timeout:
+                    victims.append(self._pop(key))
+        for entry in victims:
+            self._discard_client(entry)
+        if victims:
+            logger.info("Evicted %d idle SSH connection(s)", len(victims))
+        return len(victims)
+
+    def close(self, host: str, port: int = 22, username: str = "") -> None:
+        """Close the pooled connections to (host, port, username), whatever their credentials or leases."""
+        prefix = self.make_key(host, port, username)[:3]
+        with self._lock:
+            entries = [self._pop(key) for key in list(self._entries) if key[:3] == prefix]
+        for entry in entries:
+            self._discard_client(entry)
+
+    def close_all(self) -> None:
+        self._closed.set()
+        with self._lock:
+            entries = [self._pop(key) for key in list(self._entries)]
+        for entry in entries:
+            self._discard_client(entry)
+
+    def concurrency_for(self, requested: int) -> int:
+        """
+        How many hosts a fan-out holding one lease per host may work on at
+        once without exhausting the pool: `requested`, capped by the
+        connections not currently leased (idle ones can be evicted). Always
+        at least 1. The pool's own limit is left alone.
+        """
+        with self._lock:
+            in_use = sum(1 for e in self._entries.values() if e.refcount)
+        return max(1, min(requested, self.max_connections - in_use))
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "connections": len(self._entries),
+                "in_use": sum(1 for e in self._entries.values() if e.refcount),
+                "max_connections": self.max_connections,
+            }
+
+    # ------------------------------------------------------------------ #
+
+    def _reserve(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                if len(self._entries) >= self.max_connections:
+                    self._evict_lru_locked()
+                entry = _PooledConnection(key)
+                self._entries[key] = entry
+            self._entries.move_to_end(key)
+            entry.refcount += 1
+            entry.last_used = time.monotonic()
+        self._ensure_janitor()
+        return entry
+
+    def _add_lease_locked(self, client, entry):
+        lease = self._leases.get(id(client))
+        if lease is None or lease.client is not client:
+            lease = self._leases[id(client)] = _Lease(client, entry)
+        lease.count += 1
+
+    def _unreserve(self, entry):
+        with self._lock:
+            entry.refcount = max(0, entry.refcount - 1)
+            if entry.client is None and not entry.refcount:
+                self._pop(entry.key)
+
+    def _evict_lru_locked(self):
+        for key, entry in self._entries.items():
+            if not entry.refcount:
+                victim = self._pop(key)
+                # Closing may block on the socket; do it off the pool lock.
+                threading.Thread(target=self._discard_client, args=(victim,), daemon=True).start()
+                return
+        raise PoolExhaustedError(
+            f"SSH connection pool is full ({self.max_connections} connections in use)"
+        )
+
+    def _pop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry and entry.client is not None:
+            self._by_client.pop(id(entry.client), None)
+        return entry
+
+    def _discard_client(self, entry):
+        if entry is None or entry.client is None:
+            return
+        with self._lock:
+            self._by_client.pop(id(entry.client), None)
+        try:
+            entry.client.close()
+        except Exception:
+            pass
+        entry.client = None
+
+    def _connect(self, host, port, username, password, key_file, timeout):
+        client = paramiko.SSHClient()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        if key_file:
+            logger.info("Connecting to %s with SSH key", host)
+            pkey = paramiko.RSAKey.from_private_key_file(key_file)
+            client.connect(host, port=port, username=username, pkey=pkey, timeout=timeout)
+        else:
+            logger.info("Connecting to %s with password", host)
+            client.connect(host, port=port, username=username, password=password, timeout=timeout)
+
+        transport = client.get_transport()
+        if transport and self.keepalive_interval:
+            transport.set_keepalive(self.keepalive_interval)
+        logger.info("SSH connection established to %s:%d (pooled)", host, port)
+        return client
+
+    def _ensure_janitor(self):
+        if self._janitor and self._janitor.is_alive():
+            return
+        self._closed.clear()
+        self._janitor = threading.Thread(target=self._janitor_loop, name="ssh-pool-janitor", daemon=True)
+        self._janitor.start()
+
+    def _janitor_loop(self):
+        interval = max(1.0, min(self.idle_timeout / 2, 30.0))
+        while not self._closed.wait(interval):
+            try:
+                self.evict_idle()
+            except Exception as e:
+                logger.error("SSH pool eviction failed: %s", e)
+
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+
+def get_connection_pool() -> SSHConnectionPool:
+    """Return the process-wide connection pool shared by every page."""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = SSHConnectionPool()
+        return _default_pool
@@ -1,14 +1,20 @@
 import logging
 logging.basicConfig(level=logging.DEBUG)
 from PyQt5.QtCore import QThread, pyqtSignal
-import time
-import logging
-import select
+import threading
+from features.ssh_access.channel_reactor import get_channel_reactor
+from features.ssh_access.output_coalescer import OutputCoalescer
 
 logger = logging.getLogger("interactive_ssh_worker")
 
 
 class InteractiveSSHWorker(QThread):
+    """
+    Opens an interactive shell off the GUI thread, then hands the channel to
+    the shared channel reactor: output is emitted in per-frame batches and
+    commands are written straight to the channel, with no polling loop.
+    """
+
     data_received = pyqtSignal(str)
     error = pyqtSignal(str)
 
@@ -17,50 +23,56 @@ class InteractiveSSHWorker(QThread):
         self.ssh_client = ssh_client
         self.channel = None
         self.running = True
-        self.input_buffer = []  # ✅ Queue for commands
+        self.input_buffer = []  # ✅ Commands queued until the shell is open
+        self._lock = threading.Lock()
+        self.coalescer = OutputCoalescer()
+        self.coalescer.output_ready.connect(self._on_output)
 
     def run(self):
         try:
-            self.channel = self.ssh_client.invoke_shell(term='xterm')
-            self.channel.settimeout(0.0)
+            channel = self.ssh_client.invoke_shell(term='xterm')
 
             self.data_received.emit("[✅ Connected: Interactive Shell Started]\n")
             logger.info("SSH interactive shell started.")
 
-            while self.running:
-                # ✅ Check if there’s data ready to read
-                if self.channel and self.channel.recv_ready():
-                    rl, _, _ = select.select([self.channel], [], [], 0.1)
-                    if rl:
-                        output = self.channel.recv(4096).decode("utf-8", errors="ignore")
-                        logger.debug(f"[Received] {output.strip()}")
-                        self.data_received.emit(output)
-
-                # ✅ Check if there's any command to send
-                if self.input_buffer:
-                    cmd = self.input_buffer.pop(0)
-                    logger.info(f"[Sending command] {cmd}")
-                    self.channel.send(cmd + '\n')
-
-                time.sleep(0.05)  # Small sleep to prevent high CPU usage
+            self.coalescer.channel = channel
+            get_channel_reactor().register(channel, self.coalescer.push, self._on_close)
+            with self._lock:
+                self.channel = channel
+                pending, self.input_buffer = self.input_buffer, []
+            for cmd in pending:
+                self._send(cmd)
 
         except Exception as e:
             logger.exception("SSHWorker failed")
             self.error.emit(f"❌ SSH Shell Error: {e}")
 
+    def _on_output(self, output: str):
+        logger.debug(f"[Received] {output.strip()}")
+        self.data_received.emit(output)
+
+    def _on_close(self):
+        if self.running:
+            logger.info("SSH interactive shell closed by remote side.")
+
+    def _send(self, cmd: str):
+        logger.info(f"[Sending command] {cmd}")
+        self.channel.send(cmd + '\n')
+
     def send_command(self, command: str):
-        logger.debug(f"[Queueing command] {command}")
-        self.input_buffer.append(command)
+        with self._lock:
+            if self.channel is None:
+                logger.debug(f"[Queueing command] {command}")
+                self.input_buffer.append(command)
+                return
+        try:
+            self._send(command)
+        except Exception as e:
+            self.error.emit(f"❌ SSH Shell Error: {e}")
 
     def stop(self):
         self.running = False
         if self.channel:
-            try:
-                self.channel.close()
-            except Exception:
-                pass
-        if self.ssh_client:
-            try:
-                self.ssh_client.close()
-            except Exception:
-                pass
+            get_channel_reactor().unregister(self.channel, close=True)
+        # The client is shared through the connection pool; closing our
+        # channel is enough, the transport stays up for other pages.
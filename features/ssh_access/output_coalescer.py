@@ -0,0 +1,120 @@
+# features/ssh_access/output_coalescer.py
+import codecs
+import threading
+import time
+from collections import deque
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from features.ssh_access.channel_reactor import get_channel_reactor
+
+
+class OutputCoalescer(QObject):
+    """
+    Batches channel output between the reader and the UI.
+
+    push() is called from the reader (reactor) thread for every chunk; the
+    GUI thread drains the queue at most `fps` times a second and emits one
+    output_ready per frame, with at most `frame_bytes` of text. When more
+    than `high_watermark` bytes are queued, reads of the channel are paused
+    in the reactor (paramiko's receive window then fills and the remote side
+    blocks) until the UI has drained the queue below `low_watermark`. Queued
+    memory is therefore bounded however much the remote side writes.
+
+    Create it on the GUI thread.
+    """
+
+    output_ready = pyqtSignal(str)
+    _wake = pyqtSignal()
+
+    def __init__(self, channel=None, fps: int = 60, frame_bytes: int = 64 * 1024,
+                 high_watermark: int = 4 * 1024 * 1024, low_watermark: int = 1024 * 1024, parent=None):
+        super().__init__(parent)
+        self.channel = channel
+        self.frame_bytes = frame_bytes
+        self.high_watermark = high_watermark
+        self.low_watermark = low_watermark
+        self.paused = False
+        self.pauses = 0  # how often backpressure kicked in
+
+        self._chunks = deque()
+        self._queued = 0
+        self._lock = threading.Lock()
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+        self._frame_ms = max(1, 1000 // fps)
+        self._last_drain = 0.0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._drain)
+        self._wake.connect(self._schedule)  # queued when emitted from the reader thread
+
+    @property
+    def queued_bytes(self) -> int:
+        return self._queued
+
+    def push(self, data: bytes) -> None:
+        """Queue one chunk; safe to call from any thread."""
+        if not data:
+            return
+        with self._lock:
+            was_empty = not self._chunks
+            self._chunks.append(data)
+            self._queued += len(data)
+            pause = self.channel is not None and not self.paused and self._queued > self.high_watermark
+            if pause:
+                self.paused = True
+                self.pauses += 1
+        if pause:
+            get_channel_reactor().pause(self.channel)
+        if was_empty:
+            self._wake.emit()  # one signal per idle -> busy transition, not per chunk
+
+    def flush(self) -> None:
+        """Deliver everything queued right away (e.g. before closing)."""
+        while self._chunks:
+            self._drain()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._chunks.clear()
+            self._queued = 0
+        self._timer.stop()
+        self._resume_if_drained()
+
+    def _schedule(self):
+        if not self._timer.isActive():
+            # Output after a quiet spell (keystroke echo) is shown at once;
+            # a steady stream is held to one drain per frame
+            elapsed_ms = (time.monotonic() - self._last_drain) * 1000
+            self._timer.start(max(0, int(self._frame_ms - elapsed_ms)))
+
+    def _drain(self):
+        self._last_drain = time.monotonic()
+        budget = self.frame_bytes
+        parts = []
+        with self._lock:
+            while self._chunks and budget > 0:
+                chunk = self._chunks.popleft()
+                if len(chunk) > budget:
+                    chunk, rest = chunk[:budget], chunk[budget:]
+                    self._chunks.appendleft(rest)
+                parts.append(chunk)
+                budget -= len(chunk)
+                self._queued -= len(chunk)
+            more = bool(self._chunks)
+
+        text = self._decoder.decode(b"".join(parts))
+        if text:
+            self.output_ready.emit(text)
+        self._resume_if_drained()
+        if more:
+            self._timer.start(self._frame_ms)
+
+    def _resume_if_drained(self):
+        with self._lock:
+            resume = self.paused and self._queued <= self.low_watermark
+            if resume:
+                self.paused = False
+        if resume:
+            get_channel_reactor().resume(self.channel)
@@ -1,7 +1,8 @@
 #feature/ssh_access/ssh_connect.py
-import paramiko
 import logging
 
+from features.ssh_access.connection_pool import get_connection_pool
+
 logger = logging.getLogger("ssh_connect")
 
 # 🔁 Global variable to store the active SSH client
@@ -34,23 +35,15 @@ def get_active_ssh_client():
 
 def create_ssh_client(ip: str, port: int, username: str, password: str = "", key_file: str = None):
     """
-    Create and return an SSH client connection using Paramiko.
-    Supports password or key-based authentication.
-    Returns a connected SSHClient object or None on failure.
+    Return an SSH client for (ip, port, username) from the shared connection pool.
+    Supports password or key-based authentication; an existing pooled transport
+    is reused instead of running a new handshake.
+    Returns a connected SSHClient object or None on failure. Hand the client back
+    with release_ssh_client() when done.
     """
     try:
-        client = paramiko.SSHClient()
-        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-
-        if key_file:
-            logger.info("Connecting to %s with SSH key", ip)
-            pkey = paramiko.RSAKey.from_private_key_file(key_file)
-            client.connect(ip, port=port, username=username, pkey=pkey, timeout=10)
-        else:
-            logger.info("Connecting to %s with password", ip)
-            client.connect(ip, port=port, username=username, password=password, timeout=10)
-
-        logger.info("SSH connection established to %s:%d", ip, port)
+        client = get_connection_pool().acquire(ip, port=port, username=username,
+                                               password=password, key_file=key_file)
 
         # ✅ Save this client globally
         set_active_ssh_client(client)
@@ -60,3 +53,24 @@ def create_ssh_client(ip: str, port: int, username: str, password: str = "", key
     except Exception as e:
         logger.error("Failed to connect to %s:%d: %s", ip, port, e)
         return None
+
+
+def release_ssh_client(client):
+    """
+    Return a client obtained from create_ssh_client() to the pool.
+    The transport stays open for other pages until it goes idle.
+    """
+    get_connection_pool().release(client)
+
+
+def acquire_ssh_lease(client):
+    """
+    Take an extra pool lease on an already connected client (e.g. the one
+    from get_active_ssh_client()), so its transport is not evicted while a
+    page still uses it after the Terminal lets go. Returns the client, or
+    None if it is not pooled or no longer connected. Pair with
+    release_ssh_client().
+    """
+    if client is None or not get_connection_pool().lease(client):
+        return None  # not pooled, replaced or disconnected
+    return client
@@ -1,19 +1,181 @@
 # features/ssh_access/terminal_handler.py
 
 import pyte
+from pyte.screens import Char, Margins
+
+_WIDE_FILLER = "\0"  # stands in for the empty right half of a wide character
+_DEFAULT_STYLE = Char(" ")[1:]
+
+
+class _Row(dict):
+    """Cells of a history row by column; missing columns read as blank."""
+
+    __slots__ = ("default",)
+
+    def __init__(self, default):
+        super().__init__()
+        self.default = default
+
+    def __missing__(self, key):
+        return self.default
+
+
+class ScrollbackBuffer:
+    """
+    Ring buffer of lines that scrolled off the top of the screen.
+
+    Each line is kept as one right-trimmed string plus, only when it is not
+    all default style, a tuple of (column, style id) runs; styles are
+    interned in a shared, reference-counted table and dropped with the last
+    line using them. That is a few bytes per character instead of a pyte
+    Char object per cell, and the oldest line is overwritten once
+    `max_lines` is reached, so memory stays fixed however long a session
+    (e.g. a tail -f, or one cycling through truecolor values) runs.
+    """
+
+    def __init__(self, max_lines: int = 5000):
+        self.max_lines = max(0, max_lines)
+        self._lines = [None] * self.max_lines
+        self._start = 0
+        self._count = 0
+        self.appended = 0  # lines ever added, so views can tell how far history moved
+        self._reset_styles()
+
+    def __len__(self):
+        return self._count
+
+    def append(self, line, columns: int) -> None:
+        """Encode one pyte screen line."""
+        if not self.max_lines:
+            return
+        width = min(columns, max(line) + 1) if line else 0
+        chars = []
+        runs = []
+        current = None
+        for x in range(width):
+            cell = line[x]
+            chars.append(cell.data or _WIDE_FILLER)
+            style = cell[1:]
+            if style != current:
+                current = style
+                runs.append((x, style))
+        text = "".join(chars).rstrip(" ")
+        plain = not runs or (len(runs) == 1 and runs[0][1] == _DEFAULT_STYLE)
+        entry = (text, None if plain else tuple((x, self._intern(style)) for x, style in runs))
+
+        if self._count < self.max_lines:
+            self._lines[(self._start + self._count) % self.max_lines] = entry
+            self._count += 1
+        else:
+            self._release(self._lines[self._start])
+            self._lines[self._start] = entry
+            self._start = (self._start + 1) % self.max_lines
+        self.appended += 1
+
+    def text(self, index: int) -> str:
+        """Plain text of history line `index` (0 = oldest)."""
+        return self._entry(index)[0].replace(_WIDE_FILLER, "")
+
+    def cells(self, index: int, default: Char):
+        """Decode history line `index` (0 = oldest) into a column -> Char mapping."""
+        text, runs = self._entry(index)
+        row = _Row(default)
+        if runs is None:
+            for x, data in enumerate(text):
+                row[x] = default._replace(data="" if data == _WIDE_FILLER else data)
+            return row
+        bounds = [start for start, _ in runs[1:]] + [max(len(text), runs[-1][0] + 1)]
+        for (start, style_id), end in zip(runs, bounds):
+            style = self._styles[style_id]
+            for x in range(start, end):
+                data = text[x] if x < len(text) else " "
+                row[x] = Char("" if data == _WIDE_FILLER else data, *style)
+        return row
+
+    def history_range(self, start: int, end: int) -> list:
+        """Plain text of lines [start, end); only those lines are decoded."""
+        start, end = max(0, start), min(end, self._count)
+        return [self.text(i) for i in range(start, end)]
+
+    def clear(self) -> None:
+        self._lines = [None] * self.max_lines
+        self._start = self._count = 0
+        self._reset_styles()
+
+    def _reset_styles(self):
+        self._styles = []  # style id -> Char fields after `data`, None when free
+        self._style_ids = {}
+        self._style_refs = []  # style id -> runs using it
+        self._free_ids = []
+
+    def _intern(self, style) -> int:
+        style_id = self._style_ids.get(style)
+        if style_id is None:
+            if self._free_ids:
+                style_id = self._free_ids.pop()
+                self._styles[style_id] = style
+            else:
+                style_id = len(self._styles)
+                self._styles.append(style)
+                self._style_refs.append(0)
+            self._style_ids[style] = style_id
+        self._style_refs[style_id] += 1
+        return style_id
+
+    def _release(self, entry):
+        """Drop the style references of an evicted line."""
+        runs = entry[1]
+        for _, style_id in runs or ():
+            self._style_refs[style_id] -= 1
+            if not self._style_refs[style_id]:
+                del self._style_ids[self._styles[style_id]]
+                self._styles[style_id] = None
+                self._free_ids.append(style_id)
+
+    def _entry(self, index: int):
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        return self._lines[(self._start + index) % self.max_lines]
+
+
+class ScrollbackScreen(pyte.Screen):
+    """pyte.Screen that hands every line scrolled off the top to a ScrollbackBuffer."""
+
+    def __init__(self, columns, lines, history: ScrollbackBuffer):
+        self.history = history
+        super().__init__(columns, lines)
+
+    def index(self):
+        top, bottom = self.margins or Margins(0, self.lines - 1)
+        # Only a scroll of the whole screen from its first line is history;
+        # scroll regions (vim, less, htop status areas) are not
+        if top == 0 and self.cursor.y == bottom:
+            self.history.append(self.buffer[0], self.columns)
+        super().index()
 
 
 class TerminalHandler:
     """
     Handles terminal screen emulation using pyte.
-    Converts raw SSH output (with escape sequences) into clean, rendered text.
+    Converts raw SSH output (with escape sequences) into clean, rendered text,
+    or, for widgets that draw cells themselves, reports which rows changed.
+    Lines scrolling off the top are kept in a bounded `history`.
     """
 
-    def __init__(self, width=120, height=30):
-        self.screen = pyte.Screen(width, height)
+    def __init__(self, width=120, height=30, scrollback=5000):
+        self.history = ScrollbackBuffer(scrollback)
+        self.screen = ScrollbackScreen(width, height, self.history)
         self.stream = pyte.Stream()
         self.stream.attach(self.screen)
 
+    @property
+    def columns(self) -> int:
+        return self.screen.columns
+
+    @property
+    def lines(self) -> int:
+        return self.screen.lines
+
     def feed(self, data: str):
         """Feed raw terminal output to the emulator."""
         self.stream.feed(data)
@@ -22,11 +184,35 @@ class TerminalHandler:
         """Return the full current screen display as text."""
         return "\n".join(self.screen.display)
 
-    def reset(self):
-        """Reset the screen (e.g. on reconnect)."""
-        self.screen.reset()
+    def take_dirty(self) -> set:
+        """Rows changed since the last call (pyte's dirty-line tracking), then forget them."""
+        dirty = {y for y in self.screen.dirty if 0 <= y < self.screen.lines}
+        self.screen.dirty.clear()
+        return dirty
+
+    def row(self, y: int):
+        """pyte Char cells of screen row `y`, indexed by column (missing columns are blank)."""
+        return self.screen.buffer[y]
+
+    def history_row(self, index: int):
+        """Cells of scrollback line `index` (0 = oldest), decoded on demand."""
+        return self.history.cells(index, self.screen.default_char)
+
+    def cursor(self):
+        """(column, row, visible) of the cursor."""
+        cursor = self.screen.cursor
+        return cursor.x, cursor.y, not cursor.hidden
 
+    def resize(self, width: int, height: int):
+        """Resize the emulated screen; every row becomes dirty."""
+        if (width, height) != (self.screen.columns, self.screen.lines):
+            # pyte drops rows from the top when the screen gets shorter; keep them as history
+            for y in range(max(0, self.screen.lines - height)):
+                self.history.append(self.screen.buffer[y], self.screen.columns)
+            self.screen.resize(lines=height, columns=width)
+            self.screen.dirty.update(range(height))
 
     def reset(self):
-        """Reset the screen (e.g. on reconnect)."""
+        """Reset the screen and drop the scrollback (e.g. on reconnect)."""
         self.screen.reset()
+        self.history.clear()
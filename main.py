@@ -1,10 +1,11 @@
 #main.py
 import sys
-import json
 import logging
 from pathlib import Path
 from PyQt5.QtWidgets import QApplication, QMainWindow, QMessageBox
 
+from features.server_registration.server_registry import get_server_registry
+
 # Project Paths and other setup unchanged
 ROOT = Path(__file__).resolve().parent
 ASSETS_DIR = ROOT / "assets"
@@ -12,14 +13,11 @@ UI_DIR = ROOT / "ui"
 FEATURES_DIR = ROOT / "features"
 LOGS_DIR = ROOT / "logs"
 SERVER_REG_DIR = FEATURES_DIR / "server_registration"
-SERVER_STORE_PATH = SERVER_REG_DIR / "server_store.json"
 APP_LOG_PATH = LOGS_DIR / "app.log"
 
 def _ensure_scaffold():
     for p in [ASSETS_DIR, UI_DIR, FEATURES_DIR, LOGS_DIR, SERVER_REG_DIR]:
         p.mkdir(parents=True, exist_ok=True)
-    if not SERVER_STORE_PATH.exists():
-        SERVER_STORE_PATH.write_text(json.dumps({"servers": []}, indent=2))
     if not APP_LOG_PATH.exists():
         APP_LOG_PATH.touch()
 
@@ -37,20 +35,11 @@ logger = logging.getLogger("smart_management_tools")
 
 def load_servers() -> dict:
     try:
-        data = json.loads(SERVER_STORE_PATH.read_text(encoding="utf-8"))
-        if "servers" not in data or not isinstance(data["servers"], list):
-            raise ValueError("Malformed server_store.json: missing 'servers' list.")
-        return data
+        return {"servers": get_server_registry().servers()}
     except Exception as exc:
         logger.exception("Failed to load servers: %s", exc)
         return {"servers": []}
 
-def save_servers(data: dict) -> None:
-    try:
-        SERVER_STORE_PATH.write_text(json.dumps(data, indent=2), encoding="utf-8")
-    except Exception as exc:
-        logger.exception("Failed to save servers: %s", exc)
-
 def main():
     app = QApplication(sys.argv)
 
@@ -69,8 +58,10 @@ def main():
 
         MainWindowClass = MainWindow
 
+    # The registry is loaded once here and shared by every page
     data = load_servers()
-    logger.info("Loaded %d server(s) from %s", len(data.get("servers", [])), SERVER_STORE_PATH)
+    logger.info("Loaded %d registered server(s)", len(data.get("servers", [])))
+    get_server_registry().watch()
 
     window = MainWindowClass()
     window.show()
@@ -0,0 +1,155 @@
+from array import array
+from collections import deque
+
+from PyQt5.QtWidgets import QListView, QAbstractItemView
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex
+from PyQt5.QtGui import QFont
+
+
+class LineStore:
+    """
+    Append-only line store kept in fixed-size chunks.
+
+    Full chunks are frozen into one string plus an array of line offsets,
+    which costs a few bytes per line instead of a Python object per line.
+    When more than `max_lines` lines are held, whole chunks are dropped
+    from the front, so memory stays bounded however long the log is.
+    """
+
+    def __init__(self, max_lines: int = 1_000_000, chunk_size: int = 4096):
+        self.max_lines = max(chunk_size, max_lines)
+        self.chunk_size = chunk_size
+        self._chunks = deque()  # frozen (text, offsets) chunks, each chunk_size lines
+        self._tail = []  # lines of the chunk being filled
+
+    def __len__(self):
+        return len(self._chunks) * self.chunk_size + len(self._tail)
+
+    def append(self, lines) -> int:
+        """Append lines; returns how many old lines were dropped to honour max_lines."""
+        for line in lines:
+            self._tail.append(line)
+            if len(self._tail) == self.chunk_size:
+                self._freeze_tail()
+
+        dropped = 0
+        while len(self) > self.max_lines and self._chunks:
+            self._chunks.popleft()
+            dropped += self.chunk_size
+        return dropped
+
+    def line(self, row: int) -> str:
+        chunk, pos = divmod(row, self.chunk_size)
+        if chunk == len(self._chunks):
+            return self._tail[pos]
+        text, offsets = self._chunks[chunk]
+        return text[offsets[pos]:offsets[pos + 1] - 1]
+
+    def clear(self):
+        self._chunks.clear()
+        self._tail = []
+
+    def _freeze_tail(self):
+        offsets = array("L", [0])
+        total = 0
+        for line in self._tail:
+            total += len(line) + 1
+            offsets.append(total)
+        self._chunks.append(("\n".join(self._tail) + "\n", offsets))
+        self._tail = []
+
+
+class LogListModel(QAbstractListModel):
+    """
+    List model over a LineStore. Rows are exposed to the view in batches
+    through canFetchMore/fetchMore, so a huge load only costs what the
+    user actually scrolls through; appends made while the view already
+    shows every row are exposed immediately (follow mode).
+    """
+
+    def __init__(self, max_lines: int = 1_000_000, batch_size: int = 50_000, parent=None):
+        super().__init__(parent)
+        self.store = LineStore(max_lines=max_lines)
+        self.batch_size = batch_size
+        self._exposed = 0
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._exposed
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid() and index.row() < self._exposed:
+            return self.store.line(index.row())
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._exposed < len(self.store)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.batch_size, len(self.store) - self._exposed)
+        if count > 0:
+            self.beginInsertRows(QModelIndex(), self._exposed, self._exposed + count - 1)
+            self._exposed += count
+            self.endInsertRows()
+
+    def append_lines(self, lines) -> None:
+        following = self._exposed == len(self.store)
+        dropped = self.store.append(lines)
+        if dropped:
+            visible_dropped = min(dropped, self._exposed)
+            if visible_dropped:
+                self.beginRemoveRows(QModelIndex(), 0, visible_dropped - 1)
+                self._exposed -= visible_dropped
+                self.endRemoveRows()
+        if following:
+            self.fetchMore()
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self.store.clear()
+        self._exposed = 0
+        self.endResetModel()
+
+
+class LogView(QListView):
+    """
+    Read-only, virtualized log viewer: only visible rows are laid out and
+    painted, and the view sticks to the newest line unless the user has
+    scrolled away from the bottom.
+    """
+
+    def __init__(self, max_lines: int = 1_000_000, parent=None):
+        super().__init__(parent)
+        self.log_model = LogListModel(max_lines=max_lines, parent=self)
+        self.setModel(self.log_model)
+        self.setUniformItemSizes(True)  # row height from one item, not every item
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(2000)
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.setFont(QFont("Courier New", 10))
+        self._pending = ""  # partial line carried between append_text calls
+
+    def append_text(self, text: str) -> None:
+        """Append raw text; lines are split here and a trailing partial line is held back."""
+        text = self._pending + text
+        lines = text.split("\n")
+        self._pending = lines.pop()
+        if lines:
+            self.append_lines(lines)
+
+    def append_lines(self, lines) -> None:
+        bar = self.verticalScrollBar()
+        at_bottom = bar.value() >= bar.maximum()
+        self.log_model.append_lines(lines)
+        if at_bottom:
+            self.scrollToBottom()
+
+    def set_message(self, text: str) -> None:
+        """Replace the contents with a short status message."""
+        self.clear()
+        self.append_lines(text.splitlines() or [""])
+
+    def clear(self) -> None:
+        self._pending = ""
+        self.log_model.clear()
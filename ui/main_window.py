@@ -1,15 +1,19 @@
 from PyQt5.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QStackedWidget, QTextEdit
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QStackedWidget
 )
 from PyQt5.QtCore import Qt
 
 from ui.server_list_ui import ServerListUI
 from ui.terminal_ui import TerminalUI
 from features.server_monitoring.resource_graph import ResourceGraph
-from features.server_monitoring.cpu_memory_disk import get_resource_usage
+from features.server_monitoring.metrics_history import get_metrics_history
+from features.server_monitoring.metrics_stream import MetricsStream
+from features.server_monitoring.timeseries import TimeSeriesStore
 from features.ssh_access.ssh_connect import get_active_ssh_client
-from features.process_logs.log_viewer import fetch_logs
+from features.process_logs.log_follower import LogFollower
 from ui.shell_exec_ui import ShellExecUI
+from ui.log_view import LogView
+from ui.process_table_ui import ProcessTableUI
 
 
 class MainWindow(QMainWindow):
@@ -26,12 +30,14 @@ class MainWindow(QMainWindow):
         self.terminal_btn = QPushButton("💻 Terminal")
         self.monitor_btn = QPushButton("📊 Monitoring")
         self.logs_btn = QPushButton("📑 Logs")
+        self.processes_btn = QPushButton("🧮 Processes")
         self.shell_btn = QPushButton("⚙️ Shell Exec")
 
         sidebar.addWidget(self.server_list_btn)
         sidebar.addWidget(self.terminal_btn)
         sidebar.addWidget(self.monitor_btn)
         sidebar.addWidget(self.logs_btn)
+        sidebar.addWidget(self.processes_btn)
         sidebar.addWidget(self.shell_btn)
         sidebar.addStretch(1)
 
@@ -41,14 +47,18 @@ class MainWindow(QMainWindow):
         self.server_list_ui = ServerListUI()
         self.terminal_ui = TerminalUI()
         self.monitor_widget = QWidget()
-        self.logs_ui = QTextEdit()
-        self.logs_ui.setReadOnly(True)
+        self.logs_ui = LogView(max_lines=1_000_000)  # virtualized; memory capped by max_lines
+        self.log_follower = None
+        self.processes_ui = ProcessTableUI()
         self.shell_exec_ui = None  # Initialize as None
+        self.metrics_stream = None
+        self.metrics_series = TimeSeriesStore(retention_seconds=6 * 3600, sample_interval=1.0)
 
         self.content_area.addWidget(self.server_list_ui)
         self.content_area.addWidget(self.terminal_ui)
         self.content_area.addWidget(self.monitor_widget)
         self.content_area.addWidget(self.logs_ui)
+        self.content_area.addWidget(self.processes_ui)
 
         main_layout.addLayout(sidebar, 1)
         main_layout.addWidget(self.content_area, 4)
@@ -62,6 +72,7 @@ class MainWindow(QMainWindow):
         self.terminal_btn.clicked.connect(self.show_terminal)
         self.monitor_btn.clicked.connect(self.show_monitoring)
         self.logs_btn.clicked.connect(self.show_logs)
+        self.processes_btn.clicked.connect(self.show_processes)
         self.shell_btn.clicked.connect(self.open_shell_exec_tab)  # ✅ Correct connection
 
         # Default page
@@ -75,14 +86,26 @@ class MainWindow(QMainWindow):
     def show_monitoring(self):
         ssh_client = get_active_ssh_client()
 
+        # One long-lived collector per monitoring view
+        if self.metrics_stream:
+            self.metrics_stream.stop()
+            self.metrics_stream.wait()
+            self.metrics_stream = None
+
         # Clear previous monitor widget layout/widgets if any
         for i in reversed(range(self.monitor_widget.layout().count()) if self.monitor_widget.layout() else []):
             widget = self.monitor_widget.layout().itemAt(i).widget()
             if widget:
+                if isinstance(widget, ResourceGraph):
+                    widget.stop()
                 widget.setParent(None)
+                widget.deleteLater()
 
-        layout = QVBoxLayout()
-        self.monitor_widget.setLayout(layout)
+        # setLayout() is ignored once a layout exists, so reuse it on refresh
+        layout = self.monitor_widget.layout()
+        if layout is None:
+            layout = QVBoxLayout()
+            self.monitor_widget.setLayout(layout)
 
         if not ssh_client or not ssh_client.get_transport() or not ssh_client.get_transport().is_active():
             label = QLabel("⚠️ No active SSH connection. Please open a Terminal connection first.")
@@ -95,8 +118,16 @@ class MainWindow(QMainWindow):
                 label.setAlignment(Qt.AlignCenter)
                 layout.addWidget(label)
 
-                monitor_graph = ResourceGraph(fetch_callback=lambda: get_resource_usage(ssh_client))
+                # History survives page switches: the ring buffer belongs to the window
+                monitor_graph = ResourceGraph(series=self.metrics_series.buffer(ip))
                 layout.addWidget(monitor_graph)
+
+                self.metrics_stream = MetricsStream(ssh_client, interval=1.0)
+                self.metrics_stream.sample_ready.connect(monitor_graph.push_sample)
+                # Persist every sample so history survives restarts (see logs/metrics)
+                history = get_metrics_history()
+                self.metrics_stream.subscribe(lambda sample, host=ip: history.append(host, sample))
+                self.metrics_stream.start()
             except Exception as e:
                 label = QLabel(f"❌ Error getting monitoring data.\nTry reconnecting the terminal.\nError: {str(e)}")
                 label.setAlignment(Qt.AlignCenter)
@@ -108,16 +139,52 @@ class MainWindow(QMainWindow):
         ssh_client = get_active_ssh_client()
 
         if not ssh_client or not ssh_client.get_transport() or not ssh_client.get_transport().is_active():
-            self.logs_ui.setPlainText("⚠️ No active SSH connection. Please open a Terminal connection first.")
+            self._stop_log_follower()
+            self.logs_ui.set_message("⚠️ No active SSH connection. Please open a Terminal connection first.")
         else:
             try:
-                logs = fetch_logs(ssh_client)
-                self.logs_ui.setPlainText(logs.strip() if logs else "⚠️ No logs found.")
+                ip = ssh_client.get_transport().getpeername()[0]
+                # Keep following if we're already attached to this server
+                if not (self.log_follower and self.log_follower.isRunning() and self.log_follower.host == ip):
+                    self._stop_log_follower()
+                    self.logs_ui.clear()
+                    self.log_follower = LogFollower(ssh_client, ip)
+                    self.log_follower.lines_appended.connect(self.append_log_lines)
+                    self.log_follower.rotated.connect(lambda msg: self.append_log_lines(f"--- {msg} ---\n"))
+                    self.log_follower.error.connect(self.append_log_lines)
+                    self.log_follower.start()
             except Exception:
-                self.logs_ui.setPlainText("❌ Failed to fetch logs. SSH session may be closed.")
+                self.logs_ui.set_message("❌ Failed to fetch logs. SSH session may be closed.")
 
         self.content_area.setCurrentWidget(self.logs_ui)
 
+    def append_log_lines(self, text):
+        """Append only the new lines; the view scrolls with the tail unless the user scrolled up."""
+        self.logs_ui.append_text(text if text.endswith("\n") else text + "\n")
+
+    def _stop_log_follower(self):
+        if self.log_follower:
+            self.log_follower.stop()
+            self.log_follower.wait()
+            self.log_follower = None
+
+    def show_processes(self):
+        ssh_client = get_active_ssh_client()
+
+        if not ssh_client or not ssh_client.get_transport() or not ssh_client.get_transport().is_active():
+            self.processes_ui.show_message("⚠️ No active SSH connection. Please open a Terminal connection first.")
+        else:
+            try:
+                ip = ssh_client.get_transport().getpeername()[0]
+                # Keep the running table (and its deltas) if it is already this server
+                worker = self.processes_ui.worker
+                if not (worker and worker.isRunning() and worker.ssh_client is ssh_client):
+                    self.processes_ui.start(ssh_client, ip)
+            except Exception:
+                self.processes_ui.show_message("❌ Failed to list processes. SSH session may be closed.")
+
+        self.content_area.setCurrentWidget(self.processes_ui)
+
     def open_shell_exec_tab(self):
         ssh_client = get_active_ssh_client()
         if not ssh_client:
@@ -129,6 +196,7 @@ class MainWindow(QMainWindow):
 
         # 🔁 Clean up old ShellExecUI if it exists
         if self.shell_exec_ui:
+            self.shell_exec_ui.close_shell()
             self.content_area.removeWidget(self.shell_exec_ui)
             self.shell_exec_ui.deleteLater()
 
@@ -136,3 +204,12 @@ class MainWindow(QMainWindow):
         self.shell_exec_ui = ShellExecUI(ssh_client)
         self.content_area.addWidget(self.shell_exec_ui)
         self.content_area.setCurrentWidget(self.shell_exec_ui)
+
+    def closeEvent(self, event):
+        self._stop_log_follower()
+        self.processes_ui.stop()
+        if self.metrics_stream:
+            self.metrics_stream.stop()
+            self.metrics_stream.wait()
+        get_metrics_history().close()
+        super().closeEvent(event)
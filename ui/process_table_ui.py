@@ -0,0 +1,249 @@
+import logging
+
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QTableView, QHeaderView, QLineEdit
+from PyQt5.QtCore import (
+    Qt, QThread, pyqtSignal, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+)
+from PyQt5.QtGui import QFont
+
+from features.process_logs.process_table import ProcessTable
+from features.process_logs.process_sampler import ProcessSampler
+from features.ssh_access.ssh_connect import acquire_ssh_lease, release_ssh_client
+
+logger = logging.getLogger("process_table_ui")
+
+# (header, record attribute, display format)
+COLUMNS = (
+    ("PID", "pid", "{}"),
+    ("USER", "user", "{}"),
+    ("CPU %", "cpu", "{:.1f}"),
+    ("MEM %", "mem", "{:.1f}"),
+    ("RSS (MB)", "rss_kb", None),
+    ("READ KB/s", "read_rate", "{:.0f}"),
+    ("WRITE KB/s", "write_rate", "{:.0f}"),
+    ("THR", "threads", "{}"),
+    ("S", "state", "{}"),
+    ("COMMAND", "name", "{}"),
+)
+SORT_ROLE = Qt.UserRole
+
+
+class ProcessTableModel(QAbstractTableModel):
+    """
+    Table model over ProcessRecords that is only ever patched with deltas:
+    removed rows are taken out in contiguous runs, new rows are appended,
+    and changed rows get one dataChanged per run, so views repaint only
+    the visible cells that actually changed.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []  # ProcessRecord, in insertion order
+        self._row_of = {}  # pid -> row
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return COLUMNS[section][0]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        record = self._rows[index.row()]
+        _, attr, fmt = COLUMNS[index.column()]
+        value = getattr(record, attr)
+        if role == SORT_ROLE:
+            return value
+        if role == Qt.DisplayRole:
+            if fmt is None:
+                return f"{value / 1024:.1f}"
+            if attr in ("read_rate", "write_rate"):
+                return fmt.format(value / 1024) if value else ""
+            return fmt.format(value)
+        if role == Qt.TextAlignmentRole and attr not in ("user", "name", "state"):
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def record(self, row: int):
+        return self._rows[row]
+
+    def apply_delta(self, delta) -> None:
+        if delta.removed:
+            rows = sorted((self._row_of[pid] for pid in set(delta.removed) if pid in self._row_of),
+                          reverse=True)
+            # Remove from the bottom up in contiguous runs so row numbers stay valid
+            i = 0
+            while i < len(rows):
+                last = first = rows[i]
+                while i + 1 < len(rows) and rows[i + 1] == first - 1:
+                    i += 1
+                    first = rows[i]
+                self.beginRemoveRows(QModelIndex(), first, last)
+                del self._rows[first:last + 1]
+                self.endRemoveRows()
+                i += 1
+            self._row_of = {record.pid: row for row, record in enumerate(self._rows)}
+
+        if delta.changed:
+            rows = sorted(self._row_of[r.pid] for r in delta.changed if r.pid in self._row_of)
+            last_column = len(COLUMNS) - 1
+            start = prev = None
+            for row in rows + [None]:
+                if start is not None and row != prev + 1:
+                    self.dataChanged.emit(self.index(start, 0), self.index(prev, last_column))
+                    start = None
+                if row is not None and start is None:
+                    start = row
+                prev = row
+
+        if delta.added:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(delta.added) - 1)
+            for row, record in enumerate(delta.added, first):
+                self._rows.append(record)
+                self._row_of[record.pid] = row
+            self.endInsertRows()
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._rows = []
+        self._row_of = {}
+        self.endResetModel()
+
+
+class ProcessTableWorker(QThread):
+    """
+    Refreshes a ProcessTable off the GUI thread, feeds the ProcessSampler
+    history and top-K ranking, and emits one delta per tick.
+    """
+
+    delta_ready = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+    def __init__(self, ssh_client, interval: float = 1.0):
+        super().__init__()
+        self.ssh_client = ssh_client
+        self.interval = interval
+        self.table = ProcessTable()
+        self.sampler = ProcessSampler()
+        self.running = True
+
+    def run(self):
+        lease = acquire_ssh_lease(self.ssh_client)  # keeps the pooled transport from idle eviction
+        try:
+            while self.running:
+                try:
+                    delta = self.table.refresh(self.ssh_client)
+                    self.sampler.update(self.table, delta)
+                    self.delta_ready.emit(delta)
+                except Exception as e:
+                    logger.error("Process table refresh failed: %s", e)
+                    self.error.emit(f"❌ Process refresh error: {e}")
+                # Sleep in small steps so stop() takes effect quickly
+                remaining = self.interval
+                while self.running and remaining > 0:
+                    self.msleep(int(min(remaining, 0.1) * 1000))
+                    remaining -= 0.1
+        finally:
+            release_ssh_client(lease)
+
+    def stop(self):
+        self.running = False
+
+
+class ProcessTableUI(QWidget):
+    """Full, sortable process list of the active server, refreshed once a second."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.worker = None
+
+        layout = QVBoxLayout()
+        self.status_label = QLabel("⚠️ No active SSH connection. Please open a Terminal connection first.")
+        layout.addWidget(self.status_label)
+
+        self.top_label = QLabel("")
+        layout.addWidget(self.top_label)
+
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText("Filter by command or user...")
+        layout.addWidget(self.filter_input)
+
+        self.model = ProcessTableModel(self)
+        self.proxy = QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.proxy.setSortRole(SORT_ROLE)
+        self.proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.proxy.setFilterKeyColumn(-1)
+        self.proxy.setDynamicSortFilter(True)
+        self.filter_input.textChanged.connect(self.proxy.setFilterFixedString)
+
+        self.table_view = QTableView()
+        self.table_view.setModel(self.proxy)
+        self.table_view.setSortingEnabled(True)
+        self.table_view.sortByColumn(2, Qt.DescendingOrder)  # busiest first
+        self.table_view.setSelectionBehavior(QTableView.SelectRows)
+        self.table_view.verticalHeader().setVisible(False)
+        self.table_view.verticalHeader().setDefaultSectionSize(20)
+        self.table_view.horizontalHeader().setStretchLastSection(True)
+        self.table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.table_view.setFont(QFont("Courier New", 10))
+        layout.addWidget(self.table_view)
+        self.table_view.selectionModel().currentRowChanged.connect(self.update_history_label)
+
+        self.history_label = QLabel("Select a process to see its recent peaks.")
+        layout.addWidget(self.history_label)
+
+        self.setLayout(layout)
+
+    def start(self, ssh_client, host: str) -> None:
+        self.stop()
+        self.model.clear()
+        self.top_label.setText("")
+        self.status_label.setText(f"🧮 Processes on {host}")
+        self.worker = ProcessTableWorker(ssh_client)
+        self.worker.delta_ready.connect(self.apply_delta)
+        self.worker.error.connect(self.status_label.setText)
+        self.worker.start()
+
+    def apply_delta(self, delta) -> None:
+        self.model.apply_delta(delta)
+        self.status_label.setText(
+            f"🧮 {delta.total} processes · refreshed in {delta.seconds * 1000:.0f} ms")
+        if self.worker:
+            sampler = self.worker.sampler
+            top_cpu = ", ".join(f"{r.name} ({r.pid}) {r.cpu:.0f}%" for r in sampler.top("cpu")[:3] if r.cpu)
+            top_io = ", ".join(f"{r.name} ({r.pid}) {r.write_rate / 1024:.0f} KB/s"
+                               for r in sampler.top("write_rate")[:3] if r.write_rate)
+            self.top_label.setText(f"🔥 CPU: {top_cpu or '-'}   💾 Writes: {top_io or '-'}")
+            self.update_history_label(self.table_view.currentIndex())
+
+    def update_history_label(self, index, _previous=None) -> None:
+        if not self.worker or not index.isValid():
+            return
+        record = self.model.record(self.proxy.mapToSource(index).row())
+        samples = self.worker.sampler.history(record.pid)
+        if not samples:
+            return
+        peak = lambda column: max(sample[column] for sample in samples)
+        self.history_label.setText(
+            f"{record.name} ({record.pid}), last {len(samples)} samples: "
+            f"peak CPU {peak(1):.1f}%, peak RSS {peak(2) / 1024:.1f} MB, "
+            f"peak read {peak(3) / 1024:.0f} KB/s, peak write {peak(4) / 1024:.0f} KB/s")
+
+    def show_message(self, text: str) -> None:
+        self.stop()
+        self.model.clear()
+        self.status_label.setText(text)
+
+    def stop(self) -> None:
+        if self.worker:
+            self.worker.stop()
+            self.worker.wait()
+            self.worker = None
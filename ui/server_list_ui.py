@@ -1,21 +1,20 @@
-import json
-from pathlib import Path
+from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QListWidget, QLineEdit, QLabel, QMessageBox
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QListWidget, QListWidgetItem, QLineEdit, QLabel, QMessageBox,
+    QFileDialog, QApplication
 )
 
 
 # Import backend logic
 from features.server_registration.add_server import add_server
+from features.server_registration.bulk_io import export_servers, import_servers
 from features.server_registration.remove_server import remove_server
-
-#SERVER_STORE_PATH = Path("features/server_registration/server_store.json")
-SERVER_STORE_PATH = Path(__file__).resolve().parent.parent / "features" / "server_registration" / "server_store.json"
+from features.server_registration.server_registry import get_server_registry
 
 class ServerListUI(QWidget):
     """
     UI for listing, adding, and removing servers.
-    Reads/writes from server_store.json
+    Reads/writes the server store (features/server_registration/servers.db)
     """
 
     def __init__(self):
@@ -47,44 +46,41 @@ class ServerListUI(QWidget):
         btn_layout = QHBoxLayout()
         self.add_btn = QPushButton("➕ Add Server")
         self.remove_btn = QPushButton("🗑️ Remove Server")
+        self.import_btn = QPushButton("📥 Import")
+        self.export_btn = QPushButton("📤 Export")
         btn_layout.addWidget(self.add_btn)
         btn_layout.addWidget(self.remove_btn)
+        btn_layout.addWidget(self.import_btn)
+        btn_layout.addWidget(self.export_btn)
 
         layout.addLayout(btn_layout)
         self.setLayout(layout)
 
-        # Load servers initially
+        # Load servers initially, then follow the shared registry
+        self.registry = get_server_registry()
+        self.registry.servers_changed.connect(self.load_servers)
         self.load_servers()
 
         # Connect signals
         self.add_btn.clicked.connect(self.add_server)
         self.remove_btn.clicked.connect(self.remove_server)
+        self.import_btn.clicked.connect(self.import_servers)
+        self.export_btn.clicked.connect(self.export_servers)
 
     def load_servers(self):
-        """Load servers from JSON file."""
+        """Show the servers of the shared registry."""
         self.server_list.clear()
-        if SERVER_STORE_PATH.exists():
-            try:
-                data = json.loads(SERVER_STORE_PATH.read_text(encoding="utf-8"))
-                servers = data.get("servers", [])
-                for server in servers:
-                    # Ensure server is a dict
-                    if isinstance(server, dict):
-                        ip = server.get("ip", "N/A")
-                        user = server.get("username", "N/A")
-                        self.server_list.addItem(f"{ip} ({user})")
-                    else:
-                        # Log or show error if server entry malformed
-                        print(f"Error parsing server entry: expected dict but got {type(server)}")
-                        self.server_list.addItem("⚠️ Error parsing server entry")
-            except Exception as e:
-                print(f"Failed to load servers: {e}")
-                self.server_list.addItem("⚠️ Failed to load servers")
-        else:
+        servers = self.registry.servers()
+
+        if not servers:
             self.server_list.addItem("No servers registered yet.")
+        for server in servers:
+            item = QListWidgetItem(f"{server['ip']} ({server['username']})")
+            item.setData(Qt.UserRole, server["id"])  # remove by id, not by row
+            self.server_list.addItem(item)
 
     def add_server(self):
-        """Add a server to JSON file."""
+        """Add a server to the server store."""
         ip = self.ip_input.text().strip()
         user = self.user_input.text().strip()
         password = self.pass_input.text().strip()
@@ -101,12 +97,13 @@ class ServerListUI(QWidget):
             self.ip_input.clear()
             self.user_input.clear()
             self.pass_input.clear()
-            self.load_servers()
+            self.registry.check()  # every view reloads through servers_changed
 
     def remove_server(self):
         """Trigger removing a server via backend function."""
-        selected = self.server_list.currentRow()
-        if selected == -1:
+        item = self.server_list.currentItem()
+        server_id = item.data(Qt.UserRole) if item else None
+        if server_id is None:
             QMessageBox.warning(self, "Error", "Select a server to remove!")
             return
 
@@ -119,9 +116,44 @@ class ServerListUI(QWidget):
         if confirm != QMessageBox.Yes:
             return
 
-        success = remove_server(selected)
+        success = remove_server(server_id)
         if success:
             QMessageBox.information(self, "Removed", "Server removed successfully.")
-            self.load_servers()
+            self.registry.check()
         else:
-            QMessageBox.warning(self, "Error", "Failed to remove server.")
\ No newline at end of file
+            QMessageBox.warning(self, "Error", "Failed to remove server.")
+
+    def import_servers(self):
+        """Bulk import from a CSV, JSON Lines, JSON or Ansible INI inventory file."""
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Import Servers", "", "Inventories (*.csv *.jsonl *.ndjson *.json *.ini *.cfg *);;All files (*)")
+        if not path:
+            return
+
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            report = import_servers(path, default_username=self.user_input.text().strip())
+        except Exception as e:
+            QApplication.restoreOverrideCursor()
+            QMessageBox.warning(self, "Error", f"Import failed: {e}")
+            return
+        QApplication.restoreOverrideCursor()
+
+        self.registry.check()
+        QMessageBox.information(self, "Import", report.summary())
+
+    def export_servers(self):
+        """Export every registered server (without passwords)."""
+        path, selected = QFileDialog.getSaveFileName(
+            self, "Export Servers", "servers.csv", "CSV (*.csv);;JSON Lines (*.jsonl);;JSON (*.json);;Ansible inventory (*.ini)")
+        if not path:
+            return
+
+        fmt = {"CSV (*.csv)": "csv", "JSON Lines (*.jsonl)": "jsonl", "JSON (*.json)": "json",
+               "Ansible inventory (*.ini)": "ini"}.get(selected)
+        try:
+            count = export_servers(path, fmt)
+        except Exception as e:
+            QMessageBox.warning(self, "Error", f"Export failed: {e}")
+            return
+        QMessageBox.information(self, "Export", f"Exported {count} server(s) to {path}.")
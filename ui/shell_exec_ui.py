@@ -1,53 +1,54 @@
-import re
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QPlainTextEdit
-from PyQt5.QtGui import QFont, QTextCursor
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QEvent
+from PyQt5.QtWidgets import QWidget, QVBoxLayout
+from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, QObject, pyqtSignal, QEvent
+from features.ssh_access.channel_reactor import get_channel_reactor
+from features.ssh_access.output_coalescer import OutputCoalescer
+from features.ssh_access.ssh_connect import acquire_ssh_lease, release_ssh_client
 from features.ssh_access.terminal_handler import TerminalHandler
+from ui.terminal_widget import TerminalGridWidget
+
+class ShellReader(QObject):
+    """
+    Delivers decoded shell output to the GUI, at most once per frame.
+    Reading is done by the shared channel reactor, so no thread is spent
+    per shell, and the coalescer pauses reads while the UI catches up.
+    """
 
-class ShellReader(QThread):
     data_ready = pyqtSignal(str)
 
-    def __init__(self, channel, terminal_handler):
+    def __init__(self, channel):
         super().__init__()
         self.channel = channel
-        self.terminal_handler = terminal_handler
-        self._running = True
-
-    def run(self):
-        while self._running:
-            if self.channel.recv_ready():
-                try:
-                    raw_data = self.channel.recv(4096).decode(errors='ignore')
-                    self.terminal_handler.feed(raw_data)
-                    display = self.terminal_handler.get_display()
-                    self.data_ready.emit(display)
-                except Exception:
-                    pass
+        self.coalescer = OutputCoalescer(channel, parent=self)
+        self.coalescer.output_ready.connect(self.data_ready)
+
+    def start(self):
+        get_channel_reactor().register(self.channel, self.coalescer.push)
 
     def stop(self):
-        self._running = False
-        self.quit()
-        self.wait()
+        """Stop reading and close the channel."""
+        get_channel_reactor().unregister(self.channel, close=True)
 
 class ShellExecUI(QWidget):
+    SCROLLBACK_LINES = 10000
+
     def __init__(self, ssh_client):
         super().__init__()
         self.ssh_client = ssh_client
+        # Held until close_shell() so the pooled transport is not evicted as idle under the shell
+        self.lease = acquire_ssh_lease(ssh_client)
         self.channel = None
-        self.reader_thread = None
-        self.terminal_handler = TerminalHandler(width=120, height=30)
+        self.reader = None
+        # Emulated and drawn on the GUI thread; only dirty rows are repainted
+        self.terminal_handler = TerminalHandler(width=120, height=30, scrollback=self.SCROLLBACK_LINES)
 
         self.init_ui()
 
     def init_ui(self):
         layout = QVBoxLayout()
 
-        self.terminal_output = QPlainTextEdit()
-        self.terminal_output.setReadOnly(False)
-        self.terminal_output.setStyleSheet("background-color: black; color: white;")
-        self.terminal_output.setFont(QFont("Courier New", 10))
-        self.terminal_output.setCursorWidth(2)
-        self.terminal_output.setWordWrapMode(False)
+        self.terminal_output = TerminalGridWidget(self.terminal_handler, font=QFont("Courier New", 10))
+        self.terminal_output.grid_resized.connect(self.resize_terminal)
 
         layout.addWidget(self.terminal_output)
         self.setLayout(layout)
@@ -61,30 +62,45 @@ class ShellExecUI(QWidget):
             return
 
         try:
-            self.channel = self.ssh_client.invoke_shell(term='xterm', width=120, height=30)
-            self.reader_thread = ShellReader(self.channel, self.terminal_handler)
-            self.reader_thread.data_ready.connect(self.update_output)
-            self.reader_thread.start()
+            self.channel = self.ssh_client.invoke_shell(
+                term='xterm', width=self.terminal_handler.columns, height=self.terminal_handler.lines)
+            self.reader = ShellReader(self.channel)
+            self.reader.data_ready.connect(self.update_output)
+            self.reader.start()
         except Exception as e:
             self.append_output(f"[❌] Failed to start shell: {e}\n")
 
-    def update_output(self, display_text):
-        self.terminal_output.blockSignals(True)
-        self.terminal_output.setPlainText(display_text)
-        self.terminal_output.moveCursor(QTextCursor.End)
-        self.terminal_output.blockSignals(False)
+    def update_output(self, text):
+        self.terminal_handler.feed(text)
+        self.terminal_output.refresh()
 
     def append_output(self, text):
-        self.terminal_output.moveCursor(QTextCursor.End)
-        self.terminal_output.insertPlainText(text)
-        self.terminal_output.moveCursor(QTextCursor.End)
+        self.update_output(text.replace("\n", "\r\n"))
+
+    def resize_terminal(self, columns, rows):
+        """Match the remote pty to the number of cells that fit the widget."""
+        self.terminal_handler.resize(columns, rows)
+        self.terminal_output.refresh()
+        if self.channel:
+            try:
+                self.channel.resize_pty(width=columns, height=rows)
+            except Exception:
+                pass
 
     def eventFilter(self, source, event):
         if source == self.terminal_output and event.type() == QEvent.KeyPress:
-            if self.channel is None:
+            key = event.key()
+
+            # Shift+PageUp/PageDown page through the scrollback; any other key
+            # goes to the shell and returns the view to the live screen
+            if event.modifiers() & Qt.ShiftModifier and key in (Qt.Key_PageUp, Qt.Key_PageDown):
+                page = self.terminal_handler.lines - 1
+                self.terminal_output.scroll_lines(page if key == Qt.Key_PageUp else -page)
                 return True
 
-            key = event.key()
+            if self.channel is None:
+                return True
+            self.terminal_output.scroll_to_bottom()
 
             if key == Qt.Key_Backspace:
                 self.channel.send('\x7f')
@@ -111,9 +127,16 @@ class ShellExecUI(QWidget):
 
         return super().eventFilter(source, event)
 
-    def closeEvent(self, event):
-        if self.reader_thread:
-            self.reader_thread.stop()
-        if self.channel:
+    def close_shell(self):
+        if self.reader:
+            self.reader.stop()  # also closes the channel
+            self.reader = None
+        elif self.channel:
             self.channel.close()
+        self.channel = None
+        release_ssh_client(self.lease)
+        self.lease = None
+
+    def closeEvent(self, event):
+        self.close_shell()
         event.accept()
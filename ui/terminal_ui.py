@@ -3,40 +3,61 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import Qt, QThread, pyqtSignal
 from PyQt5.QtGui import QFont
-import paramiko, json, os, re
-from features.ssh_access.ssh_connect import set_active_ssh_client
+import re
+import threading
+from features.server_registration.server_registry import get_server_registry
+from features.ssh_access.channel_reactor import get_channel_reactor
+from features.ssh_access.output_coalescer import OutputCoalescer
+from features.ssh_access.ssh_connect import set_active_ssh_client, create_ssh_client, release_ssh_client
 
-SERVER_STORE = "features/server_registration/server_store.json"
 
 
 class SSHWorker(QThread):
+    """
+    Connects off the GUI thread; the shell channel is then read by the
+    shared channel reactor and its output emitted in per-frame batches.
+    """
+
     data_received = pyqtSignal(str)
     error = pyqtSignal(str)
 
-    def __init__(self, ip, username, password):
+    def __init__(self, ip, username, password, port=22):
         super().__init__()
         self.ip = ip
+        self.port = port
         self.username = username
         self.password = password
         self.client = None
         self.channel = None
         self.running = True
+        self._lock = threading.Lock()  # orders stop() against run() handing over the client / channel
+        # Lives on the GUI thread with this object; batches output per frame
+        self.coalescer = OutputCoalescer()
+        self.coalescer.output_ready.connect(self.data_received)
 
     def run(self):
         try:
-            self.client = paramiko.SSHClient()
-            self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            self.client.connect(self.ip, username=self.username, password=self.password)
-
-            self.channel = self.client.invoke_shell(term='xterm', width=120, height=30)
-            self.channel.settimeout(0.5)
-
-            set_active_ssh_client(self.client)
+            # Pooled: reuses the transport if Monitoring/Logs already connected to this host
+            client = create_ssh_client(self.ip, self.port, self.username, self.password)
+            if client is None:
+                raise ConnectionError(f"Unable to connect to {self.ip}:{self.port}")
+            with self._lock:
+                stopped = not self.running
+                if not stopped:
+                    self.client = client
+            if stopped:
+                release_ssh_client(client)  # stopped while connecting
+                return
 
-            while self.running:
-                if self.channel.recv_ready():
-                    data = self.channel.recv(1024).decode(errors='ignore')
-                    self.data_received.emit(data)
+            channel = client.invoke_shell(term='xterm', width=120, height=30)
+            with self._lock:
+                stopped = not self.running
+                if not stopped:
+                    self.channel = channel
+                    self.coalescer.channel = channel
+                    get_channel_reactor().register(channel, self.coalescer.push)
+            if stopped:
+                channel.close()  # stopped while opening the shell; stop() released the client
 
         except Exception as e:
             self.error.emit(f"Connection error: {str(e)}")
@@ -46,14 +67,20 @@ class SSHWorker(QThread):
             self.channel.send(cmd + "\n")
 
     def stop(self):
-        self.running = False
-        if self.channel:
-            self.channel.close()
-        if self.client:
-            self.client.close()
+        with self._lock:
+            self.running = False
+            channel, self.channel = self.channel, None
+            client, self.client = self.client, None
+        if channel:
+            get_channel_reactor().unregister(channel, close=True)
+        if client:
+            # Only our channel is closed; the shared transport stays pooled
+            release_ssh_client(client)
 
 
 class TerminalUI(QWidget):
+    SCROLLBACK_LINES = 10000  # oldest output is dropped beyond this many lines
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Terminal Access")
@@ -83,6 +110,7 @@ class TerminalUI(QWidget):
         self.output_area = QTextEdit()
         self.output_area.setReadOnly(True)
         self.output_area.setFont(self.monospace_font)
+        self.output_area.document().setMaximumBlockCount(self.SCROLLBACK_LINES)
 
         self.input_line = QLineEdit()
         self.input_line.setPlaceholderText("Enter command...")
@@ -114,35 +142,20 @@ class TerminalUI(QWidget):
         self.ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
         self.title_escape = re.compile(r'\x1b\]0;.*?\x07')
 
+        self.registry = get_server_registry()
+        self.registry.servers_changed.connect(self.load_servers)
         self.load_servers()
 
     def load_servers(self):
         self.server_list_widget.clear()
+        self.servers = self.registry.servers()
 
-        if not os.path.exists(SERVER_STORE):
+        if not self.servers:
             self.server_list_widget.addItem("No servers found.")
             return
 
-        try:
-            with open(SERVER_STORE, "r") as f:
-                data = json.load(f)
-
-            if isinstance(data, dict) and "servers" in data:
-                self.servers = data["servers"]
-            elif isinstance(data, list):
-                self.servers = data
-            else:
-                self.server_list_widget.addItem("Invalid server data format.")
-                return
-
-            for srv in self.servers:
-                ip = srv.get("ip")
-                user = srv.get("username")
-                if ip and user:
-                    self.server_list_widget.addItem(f"{ip} ({user})")
-
-        except Exception as e:
-            self.server_list_widget.addItem(f"Error loading server store: {str(e)}")
+        for srv in self.servers:
+            self.server_list_widget.addItem(f"{srv['ip']} ({srv['username']})")
 
     def server_selected(self, item):
         index = self.server_list_widget.currentRow()
@@ -152,6 +165,7 @@ class TerminalUI(QWidget):
 
         server = self.servers[index]
         ip = server.get("ip")
+        port = server.get("port", 22)
         username = server.get("username")
         password = server.get("password", "")
 
@@ -170,7 +184,7 @@ class TerminalUI(QWidget):
             self.worker.stop()
             self.worker.wait()
 
-        self.worker = SSHWorker(ip, username, password)
+        self.worker = SSHWorker(ip, username, password, port)
         self.worker.data_received.connect(self.append_output)
         self.worker.error.connect(self.show_error)
         self.worker.start()
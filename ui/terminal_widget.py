@@ -0,0 +1,236 @@
+from PyQt5.QtWidgets import QWidget, QSizePolicy
+from PyQt5.QtGui import QColor, QFont, QFontMetrics, QPainter, QPixmap
+from PyQt5.QtCore import Qt, QRect, QSize, pyqtSignal
+
+# xterm's default 16-colour palette, under pyte's colour names
+ANSI_COLORS = {
+    "black": "#000000", "red": "#cd0000", "green": "#00cd00", "brown": "#cdcd00",
+    "blue": "#0000ee", "magenta": "#cd00cd", "cyan": "#00cdcd", "white": "#e5e5e5",
+    "brightblack": "#7f7f7f", "brightred": "#ff0000", "brightgreen": "#00ff00",
+    "brightbrown": "#ffff00", "brightblue": "#5c5cff", "brightmagenta": "#ff00ff",
+    "brightcyan": "#00ffff", "brightwhite": "#ffffff",
+}
+DEFAULT_FG = "#e5e5e5"
+DEFAULT_BG = "#000000"
+
+
+class TerminalGridWidget(QWidget):
+    """
+    Draws a TerminalHandler screen as a grid of character cells, with ANSI
+    colours, bold, italics, underline and reverse video.
+
+    The screen is rasterised into a backing pixmap one row at a time: after
+    new output only the rows pyte reports as dirty are redrawn, and only
+    their strip of the widget is repainted. Paint events just copy from the
+    backing pixmap, so an idle or mostly static screen (top, htop) costs
+    almost nothing on the GUI side.
+
+    The mouse wheel (or scroll_lines) pages back into the handler's
+    scrollback; only the history lines in view are decoded.
+    """
+
+    grid_resized = pyqtSignal(int, int)  # columns, rows that fit the widget
+
+    def __init__(self, terminal_handler, parent=None, font=None):
+        super().__init__(parent)
+        self.terminal = terminal_handler
+        self.setFocusPolicy(Qt.StrongFocus)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
+        self._colors = {}  # colour name or hex -> QColor
+        self._fonts = {}  # (bold, italics, underscore) -> QFont
+        self._backing = None
+        self.scroll_offset = 0  # lines scrolled back into history; 0 = live screen
+        self._history_seen = self.terminal.history.appended
+        self.set_font(font or QFont("Courier New", 10))
+
+    # -- public API ------------------------------------------------------- #
+
+    def set_font(self, font: QFont) -> None:
+        font.setStyleHint(QFont.Monospace)
+        font.setFixedPitch(True)
+        self._base_font = font
+        self._fonts.clear()
+        metrics = QFontMetrics(font)
+        self.cell_width = max(1, metrics.horizontalAdvance("M"))
+        self.cell_height = max(1, metrics.height())
+        self.ascent = metrics.ascent()
+        self._reset_backing()
+        self.updateGeometry()
+
+    def refresh(self) -> None:
+        """Redraw the rows that changed since the last refresh."""
+        dirty = self.terminal.take_dirty()
+        history = self.terminal.history
+        added = history.appended - self._history_seen
+        self._history_seen = history.appended
+        if self.scroll_offset:
+            # Keep the scrolled-back view on the same lines while output arrives
+            self.scroll_offset = min(self.scroll_offset + added, len(history))
+            if added:
+                dirty = set(range(self.terminal.lines))
+        if self._backing is None or self._backing.size() != self._grid_pixel_size():
+            self._reset_backing()
+            dirty = set(range(self.terminal.lines))
+        if not dirty:
+            self.update(self._cursor_rect())  # the cursor may still have moved
+            return
+
+        painter = QPainter(self._backing)
+        for y in dirty:
+            self._paint_row(painter, y)
+        painter.end()
+
+        top, bottom = min(dirty), max(dirty)
+        self.update(QRect(0, top * self.cell_height, self.width(), (bottom - top + 1) * self.cell_height))
+        self.update(self._cursor_rect())
+
+    def scroll_lines(self, lines: int) -> None:
+        """Scroll back (positive) or forward (negative) through the scrollback."""
+        offset = max(0, min(self.scroll_offset + lines, len(self.terminal.history)))
+        if offset != self.scroll_offset:
+            self.scroll_offset = offset
+            self.terminal.screen.dirty.update(range(self.terminal.lines))
+            self.refresh()
+
+    def scroll_to_bottom(self) -> None:
+        self.scroll_lines(-self.scroll_offset)
+
+    def sizeHint(self):
+        return self._grid_pixel_size()
+
+    def minimumSizeHint(self):
+        return QSize(self.cell_width * 20, self.cell_height * 5)
+
+    # -- Qt events -------------------------------------------------------- #
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        rect = event.rect()
+        painter.fillRect(rect, self._color(DEFAULT_BG))
+        if self._backing is not None:
+            painter.drawPixmap(rect, self._backing, rect)
+
+        column, row, visible = self.terminal.cursor()
+        if visible and self.hasFocus() and not self.scroll_offset:
+            painter.setCompositionMode(QPainter.RasterOp_SourceXorDestination)
+            painter.fillRect(self._cursor_rect(column, row), Qt.white)
+        painter.end()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        columns = max(20, self.width() // self.cell_width)
+        rows = max(5, self.height() // self.cell_height)
+        self.grid_resized.emit(columns, rows)
+
+    def wheelEvent(self, event):
+        steps = event.angleDelta().y() // 120
+        if steps:
+            self.scroll_lines(steps * 3)
+        event.accept()
+
+    def focusNextPrevChild(self, next):
+        return False  # Tab belongs to the shell, not to focus navigation
+
+    def focusInEvent(self, event):
+        super().focusInEvent(event)
+        self.update(self._cursor_rect())
+
+    def focusOutEvent(self, event):
+        super().focusOutEvent(event)
+        self.update(self._cursor_rect())
+
+    # -- drawing ---------------------------------------------------------- #
+
+    def _grid_pixel_size(self) -> QSize:
+        return QSize(self.terminal.columns * self.cell_width, self.terminal.lines * self.cell_height)
+
+    def _reset_backing(self):
+        self._backing = QPixmap(self._grid_pixel_size())
+        self._backing.fill(self._color(DEFAULT_BG))
+        self.terminal.screen.dirty.update(range(self.terminal.lines))
+
+    def _cursor_rect(self, column=None, row=None) -> QRect:
+        if column is None:
+            column, row, _ = self.terminal.cursor()
+        return QRect(column * self.cell_width, row * self.cell_height, self.cell_width, self.cell_height)
+
+    def _color(self, name: str, default: str = DEFAULT_FG) -> QColor:
+        if name == "default":
+            name = default
+        color = self._colors.get(name)
+        if color is None:
+            if name.startswith("#"):
+                value = name
+            elif name in ANSI_COLORS:
+                value = ANSI_COLORS[name]
+            else:
+                value = "#" + name  # 256-colour and true-colour cells are hex strings
+            color = self._colors[name] = QColor(value)
+        return color
+
+    def _font(self, bold, italics, underscore) -> QFont:
+        key = (bold, italics, underscore)
+        font = self._fonts.get(key)
+        if font is None:
+            font = QFont(self._base_font)
+            font.setBold(bold)
+            font.setItalic(italics)
+            font.setUnderline(underscore)
+            self._fonts[key] = font
+        return font
+
+    def _view_row(self, y):
+        """Cells shown on widget row `y`: a history line when scrolled back, else the screen row."""
+        if self.scroll_offset:
+            index = len(self.terminal.history) - self.scroll_offset + y
+            if index < len(self.terminal.history):
+                return self.terminal.history_row(index)
+            y = index - len(self.terminal.history)
+        return self.terminal.row(y)
+
+    def _paint_row(self, painter, y):
+        """Paint row `y` as runs of equally styled cells."""
+        cw, ch = self.cell_width, self.cell_height
+        top = y * ch
+        line = self._view_row(y)
+        columns = self.terminal.columns
+
+        x = 0
+        while x < columns:
+            cell = line[x]
+            style = (cell.fg, cell.bg, cell.bold, cell.italics, cell.underscore, cell.reverse)
+            start = x
+            chars = [cell.data]
+            x += 1
+            # Wide and non-ASCII glyphs are drawn on their own so they cannot
+            # push the following cells off the grid
+            if cell.data.isascii():
+                while x < columns:
+                    cell = line[x]
+                    if (cell.fg, cell.bg, cell.bold, cell.italics, cell.underscore, cell.reverse) != style \
+                            or not cell.data.isascii():
+                        break
+                    chars.append(cell.data)
+                    x += 1
+            while x < columns and line[x].data == "":
+                x += 1  # the right half of a wide character
+
+            fg, bg, bold, italics, underscore, reverse = style
+            fg_color = self._color(fg, DEFAULT_FG)
+            bg_color = self._color(bg, DEFAULT_BG)
+            if bold and fg in ANSI_COLORS and not fg.startswith("bright"):
+                fg_color = self._color("bright" + fg)
+            if reverse:
+                fg_color, bg_color = bg_color, fg_color
+
+            rect = QRect(start * cw, top, (x - start) * cw, ch)
+            painter.fillRect(rect, bg_color)
+            text = "".join(chars)
+            if text.strip():
+                painter.setFont(self._font(bold, italics, underscore))
+                painter.setPen(fg_color)
+                painter.drawText(start * cw, top + self.ascent, text)
+            elif underscore:
+                painter.fillRect(QRect(rect.left(), top + ch - 1, rect.width(), 1), fg_color)
@@ -1,7 +1,8 @@
-import paramiko
 import logging
 from typing import Optional
 
+from features.ssh_access.connection_pool import get_connection_pool
+
 logger = logging.getLogger("ssh_helper")
 
 class SSHHelper:
@@ -20,30 +21,20 @@ class SSHHelper:
         self.client = None
 
     def connect(self) -> bool:
-        """Establish SSH connection using Paramiko."""
+        """Acquire an SSH connection from the shared pool (handshake only if not pooled)."""
         try:
-            self.client = paramiko.SSHClient()
-            self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-
             if self.key_file:
                 logger.info("Connecting to %s using key %s", self.hostname, self.key_file)
-                private_key = paramiko.RSAKey.from_private_key_file(self.key_file)
-                self.client.connect(
-                    hostname=self.hostname,
-                    port=self.port,
-                    username=self.username,
-                    pkey=private_key,
-                    timeout=10
-                )
             else:
                 logger.info("Connecting to %s with password authentication", self.hostname)
-                self.client.connect(
-                    hostname=self.hostname,
-                    port=self.port,
-                    username=self.username,
-                    password=self.password,
-                    timeout=10
-                )
+
+            self.client = get_connection_pool().acquire(
+                self.hostname,
+                port=self.port,
+                username=self.username,
+                password=self.password,
+                key_file=self.key_file,
+            )
 
             logger.info("Connected successfully to %s", self.hostname)
             return True
@@ -69,8 +60,8 @@ class SSHHelper:
             return f"Error executing command: {e}"
 
     def close(self):
-        """Close the SSH connection."""
+        """Release the SSH connection back to the pool."""
         if self.client:
-            self.client.close()
-            logger.info("SSH connection closed for %s", self.hostname)
+            get_connection_pool().release(self.client)
+            logger.info("SSH connection released for %s", self.hostname)
             self.client = None